@@ -0,0 +1,48 @@
+"""queue_tasks covering metrics index, drop duplicate indexes
+
+Revision ID: 4d8f2b6e1a9c
+Revises: 9e4b1a7c3d5f
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8f2b6e1a9c"
+down_revision: Union[str, Sequence[str], None] = "9e4b1a7c3d5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Completed-task timings for get_metrics, answerable from the index alone
+    op.create_index(
+        "idx_queue_completed_timings",
+        "queue_tasks",
+        ["processing_time_ms"],
+        unique=False,
+        postgresql_include=["rule_engine_time_ms"],
+        postgresql_where=sa.text("status = 'COMPLETED'"),
+    )
+    # Same columns as the ix_queue_tasks_* indexes created by index=True
+    op.drop_index("idx_queue_correlation", table_name="queue_tasks")
+    op.drop_index("idx_queue_celery_task", table_name="queue_tasks")
+    op.drop_index("idx_queue_transaction", table_name="queue_tasks")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_queue_transaction", "queue_tasks", ["transaction_id"], unique=False
+    )
+    op.create_index(
+        "idx_queue_celery_task", "queue_tasks", ["celery_task_id"], unique=False
+    )
+    op.create_index(
+        "idx_queue_correlation", "queue_tasks", ["correlation_id"], unique=False
+    )
+    op.drop_index("idx_queue_completed_timings", table_name="queue_tasks")
@@ -0,0 +1,135 @@
+"""queue_task_counters maintained by triggers
+
+Revision ID: 6a3c9e1f7b2d
+Revises: 4d8f2b6e1a9c
+Create Date: 2026-10-15 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a3c9e1f7b2d"
+down_revision: Union[str, Sequence[str], None] = "4d8f2b6e1a9c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Counter rows are striped: each backend adds its deltas to the stripe
+# pg_backend_pid() % COUNTER_SLOTS, so concurrent writers mostly update
+# different rows instead of queueing on one row per status, and readers sum
+# the stripes. A backend never runs two transactions at once, so two
+# transactions only share rows on a pid collision; within a statement rows
+# are upserted in name order, and zero deltas are skipped.
+COUNTER_SLOTS = 16
+
+# Statement-level triggers with transition tables: one counter upsert per
+# statement, so bulk inserts and cleanup deletes stay cheap
+COUNTERS_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION queue_task_counters_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    counter_slot smallint := pg_backend_pid() % {COUNTER_SLOTS};
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO queue_task_counters (name, slot, value)
+        SELECT name, counter_slot, sum(delta) FROM (
+            SELECT status::text AS name, count(*) AS delta
+            FROM new_rows GROUP BY status
+            UNION ALL
+            SELECT 'retries', coalesce(sum(retry_count), 0) FROM new_rows
+        ) AS deltas
+        GROUP BY name
+        HAVING sum(delta) <> 0
+        ORDER BY name
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = queue_task_counters.value + EXCLUDED.value;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO queue_task_counters (name, slot, value)
+        SELECT name, counter_slot, -sum(delta) FROM (
+            SELECT status::text AS name, count(*) AS delta
+            FROM old_rows GROUP BY status
+            UNION ALL
+            SELECT 'retries', coalesce(sum(retry_count), 0) FROM old_rows
+        ) AS deltas
+        GROUP BY name
+        HAVING sum(delta) <> 0
+        ORDER BY name
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = queue_task_counters.value + EXCLUDED.value;
+    ELSE
+        INSERT INTO queue_task_counters (name, slot, value)
+        SELECT name, counter_slot, sum(delta) FROM (
+            SELECT n.status::text AS name, 1 AS delta
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.status <> o.status
+            UNION ALL
+            SELECT o.status::text, -1
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.status <> o.status
+            UNION ALL
+            SELECT 'retries', n.retry_count - o.retry_count
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.retry_count <> o.retry_count
+        ) AS deltas
+        GROUP BY name
+        HAVING sum(delta) <> 0
+        ORDER BY name
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = queue_task_counters.value + EXCLUDED.value;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "queue_task_counters",
+        sa.Column("name", sqlmodel.AutoString(), nullable=False),
+        sa.Column("slot", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "value", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("name", "slot"),
+    )
+
+    # Block writers while seeding so no change slips in before the triggers
+    op.execute("LOCK TABLE queue_tasks IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        "INSERT INTO queue_task_counters (name, slot, value) "
+        "SELECT status::text, 0, count(*) FROM queue_tasks GROUP BY status "
+        "UNION ALL "
+        "SELECT 'retries', 0, coalesce(sum(retry_count), 0) FROM queue_tasks"
+    )
+
+    op.execute(COUNTERS_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER queue_task_counters_insert AFTER INSERT ON queue_tasks "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION queue_task_counters_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_task_counters_update AFTER UPDATE ON queue_tasks "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION queue_task_counters_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_task_counters_delete AFTER DELETE ON queue_tasks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION queue_task_counters_apply()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS queue_task_counters_delete ON queue_tasks")
+    op.execute("DROP TRIGGER IF EXISTS queue_task_counters_update ON queue_tasks")
+    op.execute("DROP TRIGGER IF EXISTS queue_task_counters_insert ON queue_tasks")
+    op.execute("DROP FUNCTION IF EXISTS queue_task_counters_apply()")
+    op.drop_table("queue_task_counters")
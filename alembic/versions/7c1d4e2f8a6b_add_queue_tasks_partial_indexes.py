@@ -0,0 +1,41 @@
+"""add queue_tasks partial indexes
+
+Revision ID: 7c1d4e2f8a6b
+Revises: 2b7e3c8a9f4d
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d4e2f8a6b"
+down_revision: Union[str, Sequence[str], None] = "2b7e3c8a9f4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_queue_pending_created",
+        "queue_tasks",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+    )
+    op.create_index(
+        "idx_queue_completed_at",
+        "queue_tasks",
+        ["completed_at"],
+        unique=False,
+        postgresql_where=sa.text("completed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_queue_completed_at", table_name="queue_tasks")
+    op.drop_index("idx_queue_pending_created", table_name="queue_tasks")
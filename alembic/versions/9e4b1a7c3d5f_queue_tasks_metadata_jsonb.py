@@ -0,0 +1,39 @@
+"""queue_tasks.task_metadata to jsonb with gin index
+
+Revision ID: 9e4b1a7c3d5f
+Revises: 7c1d4e2f8a6b
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b1a7c3d5f"
+down_revision: Union[str, Sequence[str], None] = "7c1d4e2f8a6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE queue_tasks "
+        "ALTER COLUMN task_metadata TYPE jsonb USING task_metadata::jsonb"
+    )
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_queue_metadata_gin "
+            "ON queue_tasks USING gin (task_metadata jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_queue_metadata_gin")
+    op.execute(
+        "ALTER TABLE queue_tasks "
+        "ALTER COLUMN task_metadata TYPE json USING task_metadata::json"
+    )
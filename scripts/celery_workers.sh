@@ -0,0 +1,57 @@
+#!/usr/bin/env bash
+###############################################################################
+# celery_workers.sh - Run split Celery worker pools
+#
+# Purpose:
+#   Starts one worker per workload instead of a single solo worker consuming
+#   every queue:
+#     - transactions:            async rule evaluation, solo pool, prefetch 1
+#     - notifications,celery:    I/O-bound alert delivery and maintenance
+#                                tasks, prefork pool with a deeper prefetch so
+#                                workers are not idle between broker
+#                                round-trips
+#
+# Usage:
+#   ./scripts/celery_workers.sh
+#
+# Environment:
+#   CELERY_IO_CONCURRENCY   Processes for the I/O worker (default: nproc)
+#   CELERY_IO_PREFETCH      Prefetch multiplier for the I/O worker (default: 8)
+#   CELERY_LOGLEVEL         Worker log level (default: info)
+###############################################################################
+
+set -euo pipefail
+
+APP="src.modules.queue.celery_config:celery_app"
+LOGLEVEL="${CELERY_LOGLEVEL:-info}"
+IO_CONCURRENCY="${CELERY_IO_CONCURRENCY:-$(nproc)}"
+IO_PREFETCH="${CELERY_IO_PREFETCH:-8}"
+
+pids=()
+
+shutdown() {
+  kill -TERM "${pids[@]}" 2>/dev/null || true
+  wait
+}
+trap shutdown INT TERM
+
+uv run celery -A "$APP" worker \
+  --hostname="transactions@%h" \
+  --queues=transactions \
+  --pool=solo \
+  --prefetch-multiplier=1 \
+  --loglevel="$LOGLEVEL" &
+pids+=($!)
+
+uv run celery -A "$APP" worker \
+  --hostname="io@%h" \
+  --queues=notifications,celery \
+  --pool=prefork \
+  --concurrency="$IO_CONCURRENCY" \
+  --prefetch-multiplier="$IO_PREFETCH" \
+  --loglevel="$LOGLEVEL" &
+pids+=($!)
+
+# Exit (and stop the other worker) as soon as either one exits
+wait -n
+shutdown
@@ -5,11 +5,23 @@ Creates and configures the FastAPI application instance with all routers,
 middleware, and exception handlers.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import make_asgi_app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared clients on shutdown."""
+    yield
+
+    from src.modules.notifications.senders import close_telegram_bots
+
+    await close_telegram_bots()
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
     app = FastAPI(
@@ -18,6 +30,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # CORS middleware
@@ -24,6 +24,9 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_HOST: str = Field(default="localhost")
     POSTGRES_PORT: int = Field(default=5432)
     POSTGRES_ASYNC_URL: Optional[str] = Field(default=None)
+    # Async engine pool; size it to the concurrent requests/tasks per process
+    POSTGRES_POOL_SIZE: int = Field(default=10)
+    POSTGRES_MAX_OVERFLOW: int = Field(default=20)
 
     @field_validator("POSTGRES_ASYNC_URL", mode="before")
     @classmethod
@@ -57,6 +60,8 @@ class RedisSettings(BaseSettings):
     REDIS_PORT: int = Field(default=6379)
     REDIS_DB: int = Field(default=0)
     REDIS_PASSWORD: str = Field(default="")
+    REDIS_POOL_SIZE: int = Field(default=20)
+    REDIS_POOL_TIMEOUT: float = Field(default=5.0)
 
     model_config = SettingsConfigDict(
         env_file=str(PROJECT_ROOT / ".env"),
@@ -129,6 +134,31 @@ class NotificationSettings(BaseSettings):
     )
 
 
+class QueueSettings(BaseSettings):
+    """Transaction queue worker configuration."""
+
+    # Per-backend circuit breakers: consecutive connection failures before the
+    # circuit opens, and seconds before a trial call is let through
+    CIRCUIT_ERROR_THRESHOLD: int = Field(default=5)
+    CIRCUIT_RECOVERY_SECONDS: float = Field(default=30.0)
+
+    # Write the PROCESSING state when a task starts. When off, start and
+    # completion are recorded together in the final UPDATE (one less commit
+    # per task), and tasks stay PENDING while in flight.
+    MARK_TASKS_STARTED: bool = Field(default=True)
+
+    # Transactions of one queue.process_transaction_batch task processed
+    # concurrently on the worker event loop
+    TRANSACTION_BATCH_CONCURRENCY: int = Field(default=10)
+
+    model_config = SettingsConfigDict(
+        env_file=str(PROJECT_ROOT / ".env"),
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
+
+
 class JWTSettings(BaseSettings):
     """JWT authentication configuration."""
 
@@ -160,6 +190,7 @@ class Settings(BaseSettings):
     backend: BackendSettings = Field(default_factory=BackendSettings)
     grafana: GrafanaSettings = Field(default_factory=GrafanaSettings)
     notifications: NotificationSettings = Field(default_factory=NotificationSettings)
+    queue: QueueSettings = Field(default_factory=QueueSettings)
     jwt: JWTSettings = Field(default_factory=JWTSettings)
 
     model_config = SettingsConfigDict(
@@ -252,6 +252,18 @@ class QueueConnectionError(QueueError):
         super().__init__(message, error_code="QUEUE_CONNECTION_ERROR", **kwargs)
 
 
+class NonRetriableError(QueueError):
+    """
+    Exception raised for task failures that retrying cannot fix.
+
+    Celery tasks never auto-retry on it (bad payloads, missing configuration,
+    unsupported channels), so the task fails immediately.
+    """
+
+    def __init__(self, message: str = "Non-retriable task failure", **kwargs):
+        super().__init__(message, error_code="NON_RETRIABLE_ERROR", **kwargs)
+
+
 class AuthenticationError(AppBaseException):
     """Exception raised when authentication fails."""
 
@@ -325,6 +337,16 @@ class ServiceUnavailableError(ExternalServiceError):
         )
 
 
+class CircuitOpenError(ServiceUnavailableError):
+    """Exception raised when a circuit breaker rejects calls to a failing backend."""
+
+    def __init__(self, service_name: str, retry_after: float, **kwargs):
+        super().__init__(service_name, **kwargs)
+        self.error_code = "CIRCUIT_OPEN"
+        self.retry_after = retry_after
+        self.details["retry_after"] = retry_after
+
+
 class ConfigurationError(AppBaseException):
     """Exception raised when configuration is invalid or missing."""
 
@@ -24,6 +24,9 @@ user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
 # Global configuration flag
 _logging_configured = False
 
+# Lowest severity number accepted by any configured sink
+_min_level_no = 0
+
 
 def configure_logging(
     log_level: str = "INFO",
@@ -46,11 +49,13 @@ def configure_logging(
         file_rotation: File rotation policy
         file_retention: File retention policy
     """
-    global _logging_configured
+    global _logging_configured, _min_level_no
 
     if _logging_configured:
         return
 
+    _min_level_no = loguru_logger.level(log_level.upper()).no
+
     # Remove default handler
     loguru_logger.remove()
 
@@ -175,6 +180,23 @@ def configure_logging(
     _logging_configured = True
 
 
+# Loguru severities of the levels LoggerAdapter emits
+_LEVEL_NOS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "critical": 50}
+
+
+def is_level_enabled(level: str) -> bool:
+    """
+    Check whether any configured sink accepts messages of the given level.
+
+    Use this to skip building expensive arguments for debug logs that are
+    filtered out anyway.
+
+    Args:
+        level: Log level name (debug, info, warning, error, critical)
+    """
+    return _LEVEL_NOS[level.lower()] >= _min_level_no
+
+
 class LoggerAdapter:
     """
     Custom logger adapter that provides structured logging with flexible parameters.
@@ -193,6 +215,32 @@ class LoggerAdapter:
         self.name = name
         self.logger = loguru_logger.bind(component=name)
 
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether a message of the given level would be emitted.
+
+        Args:
+            level: Log level name (debug, info, warning, error, critical)
+        """
+        return is_level_enabled(level)
+
+    def bind(self, **kwargs) -> "LoggerAdapter":
+        """
+        Return an adapter with context fields bound once.
+
+        Bound values are attached to every record the new adapter emits, so
+        hot paths can bind IDs at entry instead of passing them per call.
+        Values are stringified by the sink only when a record is written.
+
+        Example:
+            >>> log = logger.bind(delivery_id=delivery_id)
+            >>> log.info("Delivery delivered")
+        """
+        bound = LoggerAdapter.__new__(LoggerAdapter)
+        bound.name = self.name
+        bound.logger = self.logger.bind(**kwargs)
+        return bound
+
     def _log(self, level: str, message: str, **kwargs) -> None:
         """
         Internal logging method with flexible parameter injection.
@@ -202,6 +250,10 @@ class LoggerAdapter:
             message: Log message
             **kwargs: Additional parameters to include in structured log
         """
+        # Skip building the record when no sink would emit it
+        if not is_level_enabled(level):
+            return
+
         # Extract standard parameters
         extra = kwargs.pop("extra", {})
         exc_info = kwargs.pop("exc_info", None)
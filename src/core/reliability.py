@@ -0,0 +1,171 @@
+"""
+Circuit breaker for backend calls.
+
+A CircuitBreaker stops calling a backend (Redis, PostgreSQL) after repeated
+connection-level failures: while OPEN, calls fail fast with CircuitOpenError
+instead of holding a worker slot and a connection until they time out. After
+recovery_seconds one trial call is let through (HALF_OPEN); its outcome
+closes the circuit again or re-opens it.
+"""
+
+import threading
+from enum import Enum
+from time import monotonic
+from typing import Optional, Tuple, Type
+
+from src.core.exceptions import CircuitOpenError
+from src.core.logging import get_logger
+
+logger = get_logger("core.reliability")
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    CLOSED -> OPEN -> HALF_OPEN circuit breaker for one backend.
+
+    Use as a context manager around a backend call, async in coroutines:
+
+        with redis_breaker:
+            value = redis_client.get(key)
+
+        async with redis_breaker:
+            value = await redis_client.get(key)
+
+    Only exceptions matching failure_exceptions (checked along the
+    __cause__/__context__ chain, so wrapped driver errors count) are
+    recorded as failures; other errors leave the breaker untouched. The
+    guarded call must let backend errors propagate, or every call counts
+    as a success.
+
+    State is kept under a threading lock that is only taken for the
+    bookkeeping on entry and exit, never across the guarded call, so a
+    coroutine awaiting inside `async with` does not block other callers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        error_threshold: int,
+        recovery_seconds: float,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.error_threshold = error_threshold
+        self.recovery_seconds = recovery_seconds
+        self.failure_exceptions = failure_exceptions
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an OPEN circuit past its recovery time is HALF_OPEN."""
+        with self._lock:
+            if (
+                self._state == CircuitState.OPEN
+                and monotonic() - self._opened_at >= self.recovery_seconds
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it.
+
+        Raises:
+            CircuitOpenError: Circuit is open, or its half-open trial call is
+                already in flight
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+
+            elapsed = monotonic() - self._opened_at
+            if self._state == CircuitState.OPEN:
+                if elapsed < self.recovery_seconds:
+                    raise CircuitOpenError(
+                        self.name, retry_after=self.recovery_seconds - elapsed
+                    )
+                self._state = CircuitState.HALF_OPEN
+
+            # HALF_OPEN: a single trial call probes the backend; if it
+            # fails, the circuit stays open for another recovery period
+            if self._trial_in_flight:
+                raise CircuitOpenError(self.name, retry_after=self.recovery_seconds)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info(
+                    f"Circuit '{self.name}' closed",
+                    event="circuit_closed",
+                    circuit=self.name,
+                )
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Count a failed call; opens the circuit at the threshold."""
+        if not self._is_failure(exc):
+            with self._lock:
+                # Not a backend failure, but it still ends a trial call
+                self._trial_in_flight = False
+            return
+
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.error_threshold
+            ):
+                if self._state != CircuitState.OPEN:
+                    logger.warning(
+                        f"Circuit '{self.name}' opened after "
+                        f"{self._failures} failures: {exc}",
+                        event="circuit_opened",
+                        circuit=self.name,
+                        failures=self._failures,
+                    )
+                self._state = CircuitState.OPEN
+                self._opened_at = monotonic()
+
+    def _is_failure(self, exc: Optional[BaseException]) -> bool:
+        seen = set()
+        while exc is not None and id(exc) not in seen:
+            if isinstance(exc, self.failure_exceptions):
+                return True
+            seen.add(id(exc))
+            exc = exc.__cause__ or exc.__context__
+        return False
+
+    def __enter__(self) -> "CircuitBreaker":
+        self.before_call()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc is None:
+            self.record_success()
+        else:
+            self.record_failure(exc)
+        return False
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
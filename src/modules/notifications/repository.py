@@ -5,11 +5,12 @@ Provides data access methods for notification templates, channel configurations,
 delivery tracking, and related database operations.
 """
 
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-from uuid import UUID
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, desc, update
+from sqlalchemy import and_, case, desc, insert, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select as sqlmodel_select
 
@@ -34,6 +35,21 @@ from src.storage.models import (
     NotificationTemplate,
 )
 
+# Templates are read on every delivery but edited rarely. Loaded rows are
+# detached from their session and kept in-process for a short TTL; edits made
+# through this repository drop the entry immediately.
+_TEMPLATE_CACHE_TTL_SECONDS = 60.0
+_TEMPLATE_CACHE_SIZE = 512
+_template_cache: Dict[UUID, Tuple[float, NotificationTemplate]] = {}
+
+
+def invalidate_template_cache(template_id: Optional[UUID] = None) -> None:
+    """Drop one cached template, or all of them when no ID is given."""
+    if template_id is None:
+        _template_cache.clear()
+    else:
+        _template_cache.pop(template_id, None)
+
 
 class NotificationRepository:
     """
@@ -101,6 +117,31 @@ class NotificationRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_template_cached(
+        self, template_id: UUID
+    ) -> Optional[NotificationTemplate]:
+        """
+        Get template by ID for read-only use (rendering).
+
+        The returned instance is detached from the session and shared between
+        callers, so it must not be modified. Use get_template for updates.
+        """
+        now = time.monotonic()
+        cached = _template_cache.get(template_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        template = await self.get_template(template_id)
+        if template is None:
+            return None
+
+        # Detach so later commits on this session do not expire its attributes
+        self.db_session.expunge(template)
+        if len(_template_cache) >= _TEMPLATE_CACHE_SIZE:
+            _template_cache.clear()
+        _template_cache[template_id] = (now + _TEMPLATE_CACHE_TTL_SECONDS, template)
+        return template
+
     async def get_templates(
         self,
         template_type: Optional[TemplateType] = None,
@@ -157,6 +198,7 @@ class NotificationRepository:
         template.updated_at = datetime.utcnow()
 
         await self.db_session.commit()
+        invalidate_template_cache(template_id)
         await self.db_session.refresh(template)
 
         return template
@@ -169,6 +211,7 @@ class NotificationRepository:
 
         await self.db_session.delete(template)
         await self.db_session.commit()
+        invalidate_template_cache(template_id)
 
         return True
 
@@ -241,9 +284,14 @@ class NotificationRepository:
 
     # Delivery operations
     async def create_delivery(
-        self, delivery_data: NotificationDeliveryCreate
+        self, delivery_data: NotificationDeliveryCreate, commit: bool = True
     ) -> NotificationDelivery:
-        """Create notification delivery record."""
+        """
+        Create notification delivery record.
+
+        With commit=False the row is only flushed, so callers creating several
+        deliveries can commit them together.
+        """
         delivery = NotificationDelivery(
             transaction_id=delivery_data.transaction_id,
             template_id=delivery_data.template_id,
@@ -259,6 +307,10 @@ class NotificationRepository:
         )
 
         self.db_session.add(delivery)
+        if not commit:
+            await self.db_session.flush()
+            return delivery
+
         await self.db_session.commit()
         await self.db_session.refresh(delivery)
 
@@ -273,6 +325,19 @@ class NotificationRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_deliveries_by_ids(
+        self, delivery_ids: List[UUID]
+    ) -> List[NotificationDelivery]:
+        """Get several deliveries by ID in a single query."""
+        if not delivery_ids:
+            return []
+        result = await self.db_session.execute(
+            sqlmodel_select(NotificationDelivery).where(
+                NotificationDelivery.id.in_(delivery_ids)
+            )
+        )
+        return result.scalars().all()
+
     async def get_deliveries(
         self,
         transaction_id: Optional[UUID] = None,
@@ -371,6 +436,81 @@ class NotificationRepository:
 
         return attempt
 
+    async def record_attempt_and_update(
+        self,
+        delivery_id: UUID,
+        attempt_number: int,
+        success: bool,
+        error_message: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[int, int, NotificationStatus]]:
+        """
+        Record a delivery attempt and advance the delivery in one round-trip.
+
+        The attempt INSERT runs as a data-modifying CTE of the delivery UPDATE,
+        which increments attempts and picks the next status server-side:
+        DELIVERED on success, otherwise FAILED once attempts reach max_attempts
+        and RETRYING before that.
+
+        Returns:
+            (attempts, max_attempts, status) after the update, or None if the
+            delivery does not exist
+        """
+        now = datetime.utcnow()
+
+        recorded_attempt = (
+            insert(NotificationDeliveryAttempt)
+            .values(
+                id=uuid4(),
+                delivery_id=delivery_id,
+                attempt_number=attempt_number,
+                success=success,
+                error_message=error_message,
+                metadata_=metadata or {},
+                started_at=now,
+                completed_at=now,
+            )
+            .returning(NotificationDeliveryAttempt.id)
+            .cte("recorded_attempt")
+        )
+
+        next_attempts = NotificationDelivery.attempts + 1
+        if success:
+            status_values: Dict[str, Any] = {
+                "status": NotificationStatus.DELIVERED,
+                "delivered_at": now,
+                "error_message": None,
+            }
+        else:
+            status_type = NotificationDelivery.__table__.c.status.type
+            exhausted = next_attempts >= NotificationDelivery.max_attempts
+            status_values = {
+                "status": case(
+                    (exhausted, literal(NotificationStatus.FAILED, status_type)),
+                    else_=literal(NotificationStatus.RETRYING, status_type),
+                ),
+                "failed_at": case(
+                    (exhausted, now), else_=NotificationDelivery.failed_at
+                ),
+                "error_message": error_message,
+            }
+
+        result = await self.db_session.execute(
+            update(NotificationDelivery)
+            .where(NotificationDelivery.id == delivery_id)
+            .values(attempts=next_attempts, updated_at=now, **status_values)
+            .returning(
+                NotificationDelivery.attempts,
+                NotificationDelivery.max_attempts,
+                NotificationDelivery.status,
+            )
+            .add_cte(recorded_attempt)
+        )
+        row = result.first()
+        await self.db_session.commit()
+
+        return (row.attempts, row.max_attempts, row.status) if row else None
+
     # Statistics operations
     async def get_delivery_stats(
         self,
@@ -519,6 +659,7 @@ class NotificationRepository:
 
         template.updated_at = datetime.utcnow()
         await self.db_session.commit()
+        invalidate_template_cache(template_id)
         await self.db_session.refresh(template)
 
         return template
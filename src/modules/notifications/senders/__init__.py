@@ -4,14 +4,21 @@ Notification senders package.
 Contains implementations of different notification channel senders:
 - EmailSender: Email notifications via SMTP
 - TelegramSender: Telegram notifications via aiogram Bot API
+- EmailConfig / TelegramConfig: typed channel configurations
 """
 
 from .base import BaseSender
+from .config import ChannelConfig, EmailConfig, TelegramConfig, build_channel_config
 from .email import EmailSender
-from .telegram import TelegramSender
+from .telegram import TelegramSender, close_telegram_bots
 
 __all__ = [
     "BaseSender",
+    "ChannelConfig",
+    "EmailConfig",
+    "TelegramConfig",
+    "build_channel_config",
     "EmailSender",
     "TelegramSender",
+    "close_telegram_bots",
 ]
@@ -7,6 +7,8 @@ Defines the common interface that all notification senders must implement.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
+from .config import ChannelConfig
+
 
 class BaseSender(ABC):
     """
@@ -21,7 +23,7 @@ class BaseSender(ABC):
         self,
         recipients: List[str],
         message: str,
-        config: Dict[str, Any],
+        config: ChannelConfig,
         subject: Optional[str] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
@@ -40,6 +42,29 @@ class BaseSender(ABC):
         """
         pass
 
+    async def send_many(
+        self,
+        messages: List[Tuple[List[str], str, Optional[str]]],
+        config: ChannelConfig,
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Send several messages through this channel.
+
+        The default implementation sends them one after another. Channels
+        that can reuse a connection or send concurrently override it.
+
+        Args:
+            messages: List of (recipients, message, subject) tuples
+            config: Channel-specific configuration shared by all messages
+
+        Returns:
+            List of (success, error_message) tuples, in the order of messages
+        """
+        return [
+            await self.send(recipients, message, config, subject=subject)
+            for recipients, message, subject in messages
+        ]
+
     @abstractmethod
     def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
@@ -0,0 +1,81 @@
+"""
+Typed channel configurations for notification senders.
+
+Channel configs are stored as JSON on NotificationChannelConfig rows. They are
+converted once, when the row is loaded, into frozen slotted dataclasses so
+senders read plain attributes instead of probing the dict on every send.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from aiogram.enums import ParseMode
+
+from src.storage.enums import NotificationChannel
+
+# Keyed by the upper-cased names TelegramSender.validate_config accepts
+_PARSE_MODES = {
+    "HTML": ParseMode.HTML,
+    "MARKDOWN": ParseMode.MARKDOWN,
+    "MARKDOWNV2": ParseMode.MARKDOWN_V2,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EmailConfig:
+    """SMTP settings for the email channel."""
+
+    host: str
+    port: int
+    use_tls: bool = True
+    username: Optional[str] = None
+    password: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "EmailConfig":
+        """
+        Build from a stored channel config.
+
+        Raises:
+            KeyError: SMTP_HOST or SMTP_PORT is missing
+            ValueError: SMTP_PORT is not an integer
+        """
+        return cls(
+            host=config["SMTP_HOST"],
+            port=int(config["SMTP_PORT"]),
+            use_tls=bool(config.get("USE_TLS", True)),
+            username=config.get("SMTP_USER") or None,
+            password=config.get("SMTP_PASSWORD") or None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramConfig:
+    """Message options for the Telegram channel."""
+
+    parse_mode: Optional[ParseMode] = ParseMode.HTML
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "TelegramConfig":
+        """Build from a stored channel config; unknown parse modes send plain text."""
+        parse_mode = config.get("parse_mode", "HTML") or ""
+        return cls(parse_mode=_PARSE_MODES.get(parse_mode.upper()))
+
+
+ChannelConfig = Union[EmailConfig, TelegramConfig]
+
+
+def build_channel_config(
+    channel: NotificationChannel, config: Dict[str, Any]
+) -> Optional[ChannelConfig]:
+    """
+    Convert a stored config dict into the typed config for its channel.
+
+    Returns:
+        Typed config, or None for channels without one
+    """
+    if channel == NotificationChannel.EMAIL:
+        return EmailConfig.from_dict(config)
+    if channel == NotificationChannel.TELEGRAM:
+        return TelegramConfig.from_dict(config)
+    return None
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from src.core.logging import get_logger
 
 from .base import BaseSender
+from .config import EmailConfig
 
 logger = get_logger("notifications.email")
 
@@ -71,7 +72,7 @@ class EmailSender(BaseSender):
         self,
         recipients: List[str],
         message: str,
-        config: Dict[str, Any],
+        config: EmailConfig,
         subject: Optional[str] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
@@ -86,13 +87,12 @@ class EmailSender(BaseSender):
         Args:
             recipients: List of email addresses to send to
             message: Email body content (plain text)
-            config: SMTP configuration dictionary:
-                - smtp_server (str): SMTP server hostname
-                - smtp_port (int): SMTP server port (usually 587)
+            config: SMTP configuration (EmailConfig):
+                - host (str): SMTP server hostname
+                - port (int): SMTP server port (usually 587)
                 - use_tls (bool): Whether to use STARTTLS (recommended)
                 - username (str): SMTP authentication username
                 - password (str): SMTP authentication password
-                - from_name (str, optional): Sender display name
             subject: Email subject line
 
         Returns:
@@ -101,14 +101,13 @@ class EmailSender(BaseSender):
             - (False, error_description) if sending failed
 
         Example config:
-            {
-                "smtp_server": "smtp.gmail.com",
-                "smtp_port": 587,
-                "use_tls": True,
-                "username": "alerts@company.com",
-                "password": "app-password",
-                "from_name": "Fraud Detection System"
-            }
+            EmailConfig(
+                host="smtp.gmail.com",
+                port=587,
+                use_tls=True,
+                username="alerts@company.com",
+                password="app-password",
+            )
         """
         if not recipients:
             return False, "no_recipients"
@@ -119,30 +118,9 @@ class EmailSender(BaseSender):
         try:
             # Step 1: Prepare MIME message
             # -----------------------------
-            # MIMEMultipart allows us to have multiple parts (text, HTML, attachments)
-            # even though we're currently only using plain text
-            mime_message = MIMEMultipart()
-
-            # Set email headers
-            # "From" header - can include display name: "Name <email@domain.com>"
-            from_address = config.get("SMTP_HOST", "noreply@company.com")
-            from_name = config.get("SMTP_USER", "")
-            if from_name:
-                mime_message["From"] = f"{from_name} <{from_address}>"
-            else:
-                mime_message["From"] = from_address
-
-            # "To" header - comma-separated list of recipients
-            mime_message["To"] = ", ".join(recipients)
-
-            # "Subject" header
-            mime_message["Subject"] = subject
-
-            # Attach message body
-            # MIMEText creates a MIME part with the content type "text/plain"
-            # We could also use "text/html" for HTML emails
-            text_part = MIMEText(message, "plain", "utf-8")
-            mime_message.attach(text_part)
+            mime_message = self._build_mime_message(
+                recipients, message, config, subject
+            )
 
             # Step 2: Execute SMTP sending in thread pool
             # --------------------------------------------
@@ -183,8 +161,8 @@ class EmailSender(BaseSender):
                 "SMTP connection failed",
                 component="notifications",
                 event="email_connect_failed",
-                smtp_server=config.get("smtp_server"),
-                smtp_port=config.get("smtp_port"),
+                smtp_server=config.host,
+                smtp_port=config.port,
                 error=str(e),
             )
             return False, error_msg
@@ -210,8 +188,164 @@ class EmailSender(BaseSender):
             )
             return False, error_msg
 
+    def _build_mime_message(
+        self,
+        recipients: List[str],
+        message: str,
+        config: EmailConfig,
+        subject: str,
+    ) -> MIMEMultipart:
+        """
+        Build the MIME message with From/To/Subject headers and a plain text body.
+
+        Args:
+            recipients: List of email addresses to send to
+            message: Email body content (plain text)
+            config: SMTP configuration (sender address and display name)
+            subject: Email subject line
+
+        Returns:
+            Prepared MIME message
+        """
+        # MIMEMultipart allows us to have multiple parts (text, HTML, attachments)
+        # even though we're currently only using plain text
+        mime_message = MIMEMultipart()
+
+        # Set email headers
+        # "From" header - can include display name: "Name <email@domain.com>"
+        from_address = config.host or "noreply@company.com"
+        from_name = config.username
+        if from_name:
+            mime_message["From"] = f"{from_name} <{from_address}>"
+        else:
+            mime_message["From"] = from_address
+
+        # "To" header - comma-separated list of recipients
+        mime_message["To"] = ", ".join(recipients)
+
+        # "Subject" header
+        mime_message["Subject"] = subject
+
+        # Attach message body
+        # MIMEText creates a MIME part with the content type "text/plain"
+        # We could also use "text/html" for HTML emails
+        text_part = MIMEText(message, "plain", "utf-8")
+        mime_message.attach(text_part)
+
+        return mime_message
+
+    async def send_many(
+        self,
+        messages: List[Tuple[List[str], str, Optional[str]]],
+        config: EmailConfig,
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Send several emails over a single SMTP connection.
+
+        Connecting, STARTTLS and LOGIN happen once for the whole batch
+        instead of once per message. A connection-level failure fails every
+        message in the batch; per-message SMTP errors only fail that message.
+
+        Args:
+            messages: List of (recipients, message, subject) tuples
+            config: SMTP configuration (see send())
+
+        Returns:
+            List of (success, error_message) tuples, in the order of messages
+        """
+        no_recipients: Tuple[bool, Optional[str]] = (False, "no_recipients")
+        results = [no_recipients] * len(messages)
+        prepared = [
+            (
+                index,
+                self._build_mime_message(
+                    recipients, message, config, subject or "Notification"
+                ),
+            )
+            for index, (recipients, message, subject) in enumerate(messages)
+            if recipients
+        ]
+        if not prepared:
+            return results
+
+        try:
+            loop = asyncio.get_running_loop()
+            sent = await loop.run_in_executor(
+                None,
+                self._send_smtp_many_blocking,
+                [mime_message for _, mime_message in prepared],
+                config,
+            )
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error(
+                "SMTP authentication failed",
+                component="notifications",
+                event="email_auth_failed",
+                error=str(e),
+            )
+            sent = [(False, f"smtp_auth_failed: {str(e)}")] * len(prepared)
+        except smtplib.SMTPConnectError as e:
+            logger.error(
+                "SMTP connection failed",
+                component="notifications",
+                event="email_connect_failed",
+                error=str(e),
+            )
+            sent = [(False, f"smtp_connect_failed: {str(e)}")] * len(prepared)
+        except Exception as e:
+            logger.exception(
+                "Unexpected error sending email batch",
+                component="notifications",
+                event="email_unexpected_error",
+            )
+            sent = [(False, f"email_unexpected_error: {str(e)}")] * len(prepared)
+
+        for (index, _), result in zip(prepared, sent):
+            results[index] = result
+
+        logger.info(
+            "Email batch sent",
+            component="notifications",
+            event="email_batch_sent",
+            total=len(messages),
+            sent=sum(1 for ok, _ in results if ok),
+        )
+        return results
+
+    def _send_smtp_many_blocking(
+        self, mime_messages: List[MIMEMultipart], config: EmailConfig
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Blocking batch send: one connection, one DATA exchange per message.
+
+        Args:
+            mime_messages: Prepared MIME messages
+            config: SMTP configuration
+
+        Returns:
+            List of (success, error_message) tuples, one per message
+
+        Raises:
+            smtplib.SMTPAuthenticationError: Authentication failed
+            smtplib.SMTPConnectError: Connection failed
+        """
+        results: List[Tuple[bool, Optional[str]]] = []
+        with self._open_smtp_connection(config) as server:
+            for mime_message in mime_messages:
+                try:
+                    server.send_message(mime_message)
+                    results.append((True, None))
+                except smtplib.SMTPServerDisconnected as e:
+                    # Connection dropped mid-batch: fail the remaining messages
+                    remaining = len(mime_messages) - len(results)
+                    results.extend([(False, f"smtp_error: {str(e)}")] * remaining)
+                    break
+                except smtplib.SMTPException as e:
+                    results.append((False, f"smtp_error: {str(e)}"))
+        return results
+
     def _send_smtp_blocking(
-        self, mime_message: MIMEMultipart, config: Dict[str, Any]
+        self, mime_message: MIMEMultipart, config: EmailConfig
     ) -> None:
         """
         Blocking SMTP send operation.
@@ -264,13 +398,42 @@ class EmailSender(BaseSender):
             smtplib.SMTPConnectError: Connection failed
             smtplib.SMTPException: Other SMTP errors
         """
-        # Extract configuration
-        smtp_server = config["SMTP_HOST"]
-        smtp_port = config["SMTP_PORT"]
-        use_tls = config.get("USE_TLS", True)
-        username = config.get("SMTP_USER")
-        password = config.get("SMTP_PASSWORD")
+        # Steps 1-4: Connect, upgrade to TLS and authenticate
+        # ---------------------------------------------------
+        # Using context manager (with statement) ensures connection is closed
+        # even if an error occurs
+        with self._open_smtp_connection(config) as server:
+            # Step 5: Send the email message
+            # -------------------------------
+            # send_message() handles:
+            # - Extracting sender and recipients from MIME headers
+            # - Sending MAIL FROM, RCPT TO, DATA commands
+            # - Encoding message content
+            # - Handling multipart messages
+            server.send_message(mime_message)
+
+        # Step 6: Connection automatically closed by context manager
+        # -----------------------------------------------------------
+        logger.debug(
+            "SMTP send completed",
+            component="notifications",
+            event="smtp_completed",
+            smtp_server=config.host,
+        )
+
+    def _open_smtp_connection(self, config: EmailConfig) -> smtplib.SMTP:
+        """
+        Open an SMTP connection, upgrade it to TLS and authenticate.
 
+        The caller owns the returned connection and must close it (it can be
+        used as a context manager).
+
+        Args:
+            config: SMTP configuration
+
+        Returns:
+            Connected and authenticated SMTP client
+        """
         # Step 1: Create SSL context for secure communication
         # ----------------------------------------------------
         # This creates a context with secure default settings:
@@ -281,15 +444,14 @@ class EmailSender(BaseSender):
 
         # Step 2: Create SMTP connection
         # -------------------------------
-        # Using context manager (with statement) ensures connection is closed
-        # even if an error occurs
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
+        server = smtplib.SMTP(config.host, config.port)
+        try:
             # Enable debug output to console (useful for troubleshooting)
             # server.set_debuglevel(1)
 
             # Step 3: Upgrade to TLS if configured
             # -------------------------------------
-            if use_tls:
+            if config.use_tls:
                 # STARTTLS command:
                 # - Tells server "I want to upgrade to TLS"
                 # - Server responds with "ready to start TLS"
@@ -303,28 +465,15 @@ class EmailSender(BaseSender):
 
             # Step 4: Authenticate with SMTP server
             # --------------------------------------
-            if username and password:
+            if config.username and config.password:
                 # LOGIN command with credentials
                 # These are sent encrypted if TLS is enabled
-                server.login(username, password)
+                server.login(config.username, config.password)
+        except Exception:
+            server.close()
+            raise
 
-            # Step 5: Send the email message
-            # -------------------------------
-            # send_message() handles:
-            # - Extracting sender and recipients from MIME headers
-            # - Sending MAIL FROM, RCPT TO, DATA commands
-            # - Encoding message content
-            # - Handling multipart messages
-            server.send_message(mime_message)
-
-        # Step 6: Connection automatically closed by context manager
-        # -----------------------------------------------------------
-        logger.debug(
-            "SMTP send completed",
-            component="notifications",
-            event="smtp_completed",
-            smtp_server=smtp_server,
-        )
+        return server
 
     def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
@@ -4,19 +4,38 @@ Telegram notification sender using aiogram.
 Sends notifications to Telegram chats using the Bot API through aiogram library.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
 from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
-from aiogram.exceptions import TelegramAPIError
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
 
 from src.config import settings
 from src.core.logging import get_logger
 
 from .base import BaseSender
+from .config import TelegramConfig
 
 logger = get_logger("notifications.telegram")
 
+# Max simultaneous connections to the Bot API per bot
+BOT_CONNECTION_LIMIT = 100
+
+# Max in-flight sendMessage calls per bot, across all send() and send_many()
+# calls (Telegram allows ~30 msg/s per bot)
+MAX_CONCURRENT_SENDS = 20
+
+# Longest flood-control wait honoured before giving up on a chat
+MAX_RETRY_AFTER_SECONDS = 30
+
+# Bots shared by all sender instances, keyed by token, each with the semaphore
+# bounding its in-flight sends. NotificationService is created per DB session,
+# so per-instance bots would open a new aiohttp session (and TLS connection)
+# for every alert and never close it.
+_bots: Dict[str, Tuple[Bot, asyncio.Semaphore]] = {}
+
 
 class TelegramSender(BaseSender):
     """
@@ -30,25 +49,38 @@ class TelegramSender(BaseSender):
         """Initialize Telegram sender with bot token from settings."""
         self.bot_token = settings.notifications.TELEGRAM_BOT_TOKEN
         self._bot: Optional[Bot] = None
+        self._send_limit: Optional[asyncio.Semaphore] = None
 
     def _get_bot(self) -> Bot:
         """
         Get or create Bot instance.
 
+        The bot, its HTTP connection pool and its send limit are shared
+        across senders.
+
         Returns:
             Bot instance configured with token
         """
         if not self._bot:
             if not self.bot_token:
                 raise ValueError("TELEGRAM_BOT_TOKEN not configured")
-            self._bot = Bot(token=self.bot_token)
+            entry = _bots.get(self.bot_token)
+            if entry is None:
+                entry = _bots[self.bot_token] = (
+                    Bot(
+                        token=self.bot_token,
+                        session=AiohttpSession(limit=BOT_CONNECTION_LIMIT),
+                    ),
+                    asyncio.Semaphore(MAX_CONCURRENT_SENDS),
+                )
+            self._bot, self._send_limit = entry
         return self._bot
 
     async def send(
         self,
         recipients: List[str],
         message: str,
-        config: Dict[str, Any],
+        config: TelegramConfig,
         subject: Optional[str] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
@@ -68,52 +100,23 @@ class TelegramSender(BaseSender):
 
         try:
             bot = self._get_bot()
-            parse_mode = config.get("parse_mode", "HTML")
-
-            # Convert parse_mode string to ParseMode enum
-            if parse_mode.upper() == "HTML":
-                parse_mode_enum = ParseMode.HTML
-            elif parse_mode.upper() == "MARKDOWN":
-                parse_mode_enum = ParseMode.MARKDOWN
-            else:
-                parse_mode_enum = None
+            send_limit = self._send_limit
 
-            success_count = 0
-            failed_chats = []
-
-            # Send to each chat
-            for chat_id in recipients:
-                try:
-                    await bot.send_message(
-                        chat_id=chat_id,
-                        text=message,
-                        parse_mode=parse_mode_enum,
-                    )
-                    success_count += 1
-                    logger.debug(
-                        "Telegram message sent",
-                        component="notifications",
-                        event="telegram_sent",
-                        chat_id=chat_id,
-                    )
-                except TelegramAPIError as e:
-                    failed_chats.append(chat_id)
-                    logger.warning(
-                        "Failed to send Telegram message to chat",
-                        component="notifications",
-                        event="telegram_send_failed",
-                        chat_id=chat_id,
-                        error=str(e),
-                    )
-                except Exception:
-                    failed_chats.append(chat_id)
-                    logger.exception(
-                        "Unexpected error sending Telegram message",
-                        component="notifications",
-                        event="telegram_unexpected_error",
-                        chat_id=chat_id,
+            async def send_one(chat_id: str) -> bool:
+                async with send_limit:
+                    return await self._send_to_chat(
+                        bot, chat_id, message, config.parse_mode
                     )
 
+            # Fan out to all chats at once (bounded by the bot's send limit)
+            results = await asyncio.gather(
+                *(send_one(chat_id) for chat_id in recipients)
+            )
+            failed_chats = [
+                chat_id for chat_id, sent in zip(recipients, results) if not sent
+            ]
+            success_count = len(recipients) - len(failed_chats)
+
             # Determine overall success
             if success_count == len(recipients):
                 logger.info(
@@ -160,6 +163,89 @@ class TelegramSender(BaseSender):
             )
             return False, str(e)
 
+    async def _send_to_chat(
+        self, bot: Bot, chat_id: str, message: str, parse_mode: Optional[ParseMode]
+    ) -> bool:
+        """
+        Send a message to one chat, retrying once after a flood-control wait.
+
+        Returns:
+            True if the message was sent
+        """
+        for attempt in range(2):
+            try:
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text=message,
+                    parse_mode=parse_mode,
+                )
+                if logger.is_enabled_for("debug"):
+                    logger.debug(
+                        "Telegram message sent",
+                        component="notifications",
+                        event="telegram_sent",
+                        chat_id=chat_id,
+                    )
+                return True
+            except TelegramRetryAfter as e:
+                # 429: Telegram tells us how long to back off
+                if attempt == 0 and e.retry_after <= MAX_RETRY_AFTER_SECONDS:
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                logger.warning(
+                    "Telegram rate limit exceeded",
+                    component="notifications",
+                    event="telegram_rate_limited",
+                    chat_id=chat_id,
+                    retry_after=e.retry_after,
+                )
+                return False
+            except TelegramAPIError as e:
+                logger.warning(
+                    "Failed to send Telegram message to chat",
+                    component="notifications",
+                    event="telegram_send_failed",
+                    chat_id=chat_id,
+                    error=str(e),
+                )
+                return False
+            except Exception:
+                logger.exception(
+                    "Unexpected error sending Telegram message",
+                    component="notifications",
+                    event="telegram_unexpected_error",
+                    chat_id=chat_id,
+                )
+                return False
+        return False
+
+    async def send_many(
+        self,
+        messages: List[Tuple[List[str], str, Optional[str]]],
+        config: TelegramConfig,
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Send several Telegram messages concurrently over the shared bot session.
+
+        All messages share the bot's send limit, so a large batch keeps at
+        most MAX_CONCURRENT_SENDS requests in flight.
+
+        Args:
+            messages: List of (recipients, message, subject) tuples
+            config: Telegram-specific configuration
+
+        Returns:
+            List of (success, error_message) tuples, in the order of messages
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.send(recipients, message, config)
+                    for recipients, message, _ in messages
+                )
+            )
+        )
+
     def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Validate Telegram configuration.
@@ -201,10 +287,23 @@ class TelegramSender(BaseSender):
         Should be called when shutting down the application.
         """
         if self._bot:
+            _bots.pop(self.bot_token, None)
             await self._bot.session.close()
             self._bot = None
+            self._send_limit = None
             logger.debug(
                 "Telegram bot session closed",
                 component="notifications",
                 event="telegram_closed",
             )
+
+
+async def close_telegram_bots() -> None:
+    """
+    Close the HTTP sessions of all shared bots.
+
+    Should be called once when shutting down the application.
+    """
+    while _bots:
+        _, (bot, _) = _bots.popitem()
+        await bot.session.close()
@@ -12,8 +12,11 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -32,9 +35,18 @@ from src.modules.notifications.enums import (
 )
 from src.modules.notifications.repository import NotificationRepository
 from src.modules.notifications.schemas import NotificationDeliveryCreate
-from src.modules.notifications.senders import EmailSender, TelegramSender
+from src.modules.notifications.senders import (
+    ChannelConfig,
+    EmailSender,
+    TelegramSender,
+    build_channel_config,
+)
+from src.modules.notifications.templating import (
+    get_variables_builder,
+    render_template_string,
+)
 from src.modules.reporting.metrics import (
-    increment_error_counter,
+    errors_total,
     observe_notification_time,
 )
 from src.modules.users.repository import UserRepository
@@ -45,6 +57,61 @@ from src.storage.models import Rule as RuleModel
 
 logger = get_logger("notifications")
 
+# Error counter children bound once at import, so the hot error paths skip
+# the per-call label lookup
+_ERR = {
+    error_type: errors_total.labels(error_type=error_type).inc
+    for error_type in (
+        "channel_config_missing",
+        "delivery_create_error",
+        "delivery_send_error",
+        "delivery_update_error",
+        "notification_unexpected_error",
+        "rule_load_error",
+        "user_load_error",
+    )
+}
+
+# Channel configs change rarely; keep them in-process for a short TTL, already
+# converted to the typed config the sender reads
+_CHANNEL_CONFIG_TTL_SECONDS = 60.0
+_channel_config_cache: Dict[Any, Tuple[float, ChannelConfig]] = {}
+
+
+async def _get_channel_config(
+    repo: NotificationRepository, channel: NotificationChannel
+) -> Optional[ChannelConfig]:
+    """
+    Return the typed config for a channel, or None if it is not configured.
+
+    Missing or invalid configs are not cached, so a fixed one is picked up on
+    the next delivery.
+    """
+    now = time.monotonic()
+    cached = _channel_config_cache.get(channel)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    channel_cfg = await repo.get_channel_config(channel)
+    if not channel_cfg:
+        return None
+
+    try:
+        config = build_channel_config(channel, channel_cfg.config or {})
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(
+            "Invalid channel configuration",
+            component="notifications",
+            channel=str(channel),
+            error=repr(e),
+        )
+        return None
+    if config is None:
+        return None
+
+    _channel_config_cache[channel] = (now + _CHANNEL_CONFIG_TTL_SECONDS, config)
+    return config
+
 
 class NotificationService:
     """
@@ -67,6 +134,7 @@ class NotificationService:
         """
         self.db_session = db_session
         self.repo = NotificationRepository(db_session)
+        self.user_repo = UserRepository(db_session)
 
         # Initialize channel senders
         self.email_sender = EmailSender()
@@ -81,7 +149,10 @@ class NotificationService:
         """
         Send fraud alerts using user's notification templates.
 
-        For each matched rule:
+        Matched rules are grouped by author, so each user receives a single
+        delivery per channel listing all of their violated rules.
+
+        For each rule author:
         - Load the rule author (user)
         - Load user's email and telegram templates
         - Check notification channel settings (email_notifications_enabled, telegram_notifications_enabled)
@@ -101,27 +172,46 @@ class NotificationService:
         )
 
         if not matched:
-            logger.debug(
-                "No matched rules in evaluation_result - nothing to notify",
-                component="notifications",
-                correlation_id=correlation_id,
-            )
+            if logger.is_enabled_for("debug"):
+                logger.debug(
+                    "No matched rules in evaluation_result - nothing to notify",
+                    component="notifications",
+                    correlation_id=correlation_id,
+                )
             return []
 
+        # Drop duplicate entries for the same rule (upstream may emit the
+        # same rule twice, e.g. in overlapping result lists)
+        seen_rule_ids = set()
+        unique_matched = []
         for rule_entry in matched:
+            rule_key = str(rule_entry.get("rule_id") or rule_entry.get("id") or "")
+            if rule_key and rule_key in seen_rule_ids:
+                continue
+            seen_rule_ids.add(rule_key)
+            unique_matched.append(rule_entry)
+
+        # Group matched rules by author so each user gets one delivery per
+        # channel, no matter how many of their rules fired.
+        by_author: Dict[UUID, List[RuleModel]] = defaultdict(list)
+        authors: Dict[UUID, Any] = {}
+
+        for rule_entry in unique_matched:
             try:
                 # rule_entry can be a dict with 'rule_id' or 'id'
                 rule_id_raw = rule_entry.get("rule_id") or rule_entry.get("id")
                 if not rule_id_raw:
-                    logger.debug(
-                        "Skipping rule entry without id",
-                        component="notifications",
-                        entry=str(rule_entry),
-                        correlation_id=correlation_id,
-                    )
+                    if logger.is_enabled_for("debug"):
+                        logger.debug(
+                            "Skipping rule entry without id",
+                            component="notifications",
+                            entry=str(rule_entry),
+                            correlation_id=correlation_id,
+                        )
                     continue
 
                 rule_id = UUID(str(rule_id_raw))
+                rule_id_str = str(rule_id)
 
                 # Load rule object from DB
                 try:
@@ -133,17 +223,17 @@ class NotificationService:
                     logger.exception(
                         "Failed to load rule from DB",
                         component="notifications",
-                        rule_id=str(rule_id),
+                        rule_id=rule_id_str,
                         correlation_id=correlation_id,
                     )
-                    increment_error_counter("rule_load_error")
+                    _ERR["rule_load_error"]()
                     continue
 
                 if not rule_obj:
                     logger.warning(
                         "Rule not found in DB",
                         component="notifications",
-                        rule_id=str(rule_id),
+                        rule_id=rule_id_str,
                         correlation_id=correlation_id,
                     )
                     continue
@@ -153,49 +243,90 @@ class NotificationService:
                     logger.warning(
                         "Rule has no author set",
                         component="notifications",
-                        rule_id=str(rule_id),
+                        rule_id=rule_id_str,
                         correlation_id=correlation_id,
                     )
                     continue
 
+                if author_id in authors:
+                    by_author[author_id].append(rule_obj)
+                    continue
+
+                author_id_str = str(author_id)
+
                 # Load the user record
                 try:
-                    user_repo = UserRepository(self.db_session)
-                    user = await user_repo.get_user_by_id(author_id)
+                    user = await self.user_repo.get_user_by_id(author_id)
                 except Exception:
                     logger.exception(
                         "Failed to load user for rule author",
                         component="notifications",
-                        user_id=str(author_id),
-                        rule_id=str(rule_id),
+                        user_id=author_id_str,
+                        rule_id=rule_id_str,
                         correlation_id=correlation_id,
                     )
-                    increment_error_counter("user_load_error")
+                    _ERR["user_load_error"]()
                     continue
 
                 if not user:
                     logger.warning(
                         "Author user not found",
                         component="notifications",
-                        user_id=str(author_id),
-                        rule_id=str(rule_id),
+                        user_id=author_id_str,
+                        rule_id=rule_id_str,
                         correlation_id=correlation_id,
                     )
                     continue
 
-                txn_id = (
-                    UUID(str(transaction_data.get("id")))
-                    if transaction_data.get("id")
-                    else None
+                authors[author_id] = user
+                by_author[author_id].append(rule_obj)
+
+            except Exception:
+                logger.exception(
+                    "Unexpected error while resolving matched rule",
+                    component="notifications",
+                    entry=str(rule_entry),
+                    correlation_id=correlation_id,
+                )
+                _ERR["notification_unexpected_error"]()
+
+        # Deliveries reference the transaction; parse its id once for all authors
+        raw_txn_id = transaction_data.get("id")
+        try:
+            txn_id = UUID(str(raw_txn_id)) if raw_txn_id else None
+        except ValueError:
+            logger.warning(
+                "Invalid transaction id in fraud alert",
+                component="notifications",
+                transaction_id=str(raw_txn_id),
+                correlation_id=correlation_id,
+            )
+            txn_id = None
+
+        for author_id, rules in by_author.items():
+            try:
+                user = authors[author_id]
+                author_id_str = str(author_id)
+                email, tg_id, tg_alias = (
+                    user.email,
+                    user.telegram_id,
+                    user.telegram_alias,
                 )
+                rule_ids = [str(rule.id) for rule in rules]
+                rule_names = [rule.name for rule in rules]
+                metadata = {
+                    "correlation_id": correlation_id,
+                    "rule_ids": rule_ids,
+                    "rule_names": rule_names,
+                }
 
                 # Send EMAIL notification if enabled and template exists
-                if getattr(user, "email_notifications_enabled", True):
-                    email_template_id = getattr(user, "email_template_id", None)
-                    if email_template_id and getattr(user, "email", None) and txn_id:
+                if user.email_notifications_enabled:
+                    email_template_id = user.email_template_id
+                    if email_template_id and email and txn_id:
                         try:
                             # Load email template
-                            email_template = await self.repo.get_template(
+                            email_template = await self.repo.get_template_cached(
                                 email_template_id
                             )
                             if email_template:
@@ -209,15 +340,13 @@ class NotificationService:
                                     template_id=email_template_id,
                                     channel=NotificationChannel.EMAIL,
                                     subject=rendered.get("subject"),
-                                    body=rendered.get("body"),
-                                    recipients=[user.email],
+                                    body=self._append_rule_summary(
+                                        rendered.get("body"), rule_names
+                                    ),
+                                    recipients=[email],
                                     priority=1,
                                     scheduled_at=None,
-                                    metadata={
-                                        "correlation_id": correlation_id,
-                                        "rule_id": str(rule_id),
-                                        "rule_name": rule_obj.name,
-                                    },
+                                    metadata=metadata,
                                 )
 
                                 await self._create_and_schedule_delivery(
@@ -226,39 +355,36 @@ class NotificationService:
                             else:
                                 logger.warning(
                                     "Email template not found for user",
-                                    user_id=str(author_id),
+                                    user_id=author_id_str,
                                     template_id=str(email_template_id),
                                 )
                         except Exception:
                             logger.exception(
                                 "Failed to create/send email delivery for rule author",
                                 component="notifications",
-                                user_id=str(author_id),
-                                rule_id=str(rule_id),
+                                user_id=author_id_str,
+                                rule_ids=rule_ids,
                                 correlation_id=correlation_id,
                             )
-                            increment_error_counter("delivery_create_error")
+                            _ERR["delivery_create_error"]()
 
                 # Send TELEGRAM notification if enabled and template exists
-                if getattr(user, "telegram_notifications_enabled", True):
-                    telegram_template_id = getattr(user, "telegram_template_id", None)
-                    tg_recipient = None
+                if user.telegram_notifications_enabled:
+                    telegram_template_id = user.telegram_template_id
 
-                    print("Telegram recipient determined:", tg_recipient)
-
-                    # Determine telegram recipient
-                    if getattr(user, "telegram_id", None):
-                        tg_recipient = [str(user.telegram_id)]
-                    elif getattr(user, "telegram_alias", None):
-                        alias = getattr(user, "telegram_alias")
-                        if alias and not alias.startswith("@"):
-                            alias = f"@{alias}"
-                        tg_recipient = [alias]
+                    # Prefer the numeric chat id, fall back to the @alias
+                    tg_recipient = None
+                    if tg_id:
+                        tg_recipient = [str(tg_id)]
+                    elif tg_alias:
+                        tg_recipient = [
+                            tg_alias if tg_alias.startswith("@") else f"@{tg_alias}"
+                        ]
 
                     if telegram_template_id and tg_recipient and txn_id:
                         try:
                             # Load telegram template
-                            telegram_template = await self.repo.get_template(
+                            telegram_template = await self.repo.get_template_cached(
                                 telegram_template_id
                             )
                             if telegram_template:
@@ -274,15 +400,13 @@ class NotificationService:
                                     template_id=telegram_template_id,
                                     channel=NotificationChannel.TELEGRAM,
                                     subject=None,
-                                    body=rendered.get("body"),
+                                    body=self._append_rule_summary(
+                                        rendered.get("body"), rule_names
+                                    ),
                                     recipients=tg_recipient,
                                     priority=1,
                                     scheduled_at=None,
-                                    metadata={
-                                        "correlation_id": correlation_id,
-                                        "rule_id": str(rule_id),
-                                        "rule_name": rule_obj.name,
-                                    },
+                                    metadata=metadata,
                                 )
 
                                 await self._create_and_schedule_delivery(
@@ -291,27 +415,44 @@ class NotificationService:
                             else:
                                 logger.warning(
                                     "Telegram template not found for user",
-                                    user_id=str(author_id),
+                                    user_id=author_id_str,
                                     template_id=str(telegram_template_id),
                                 )
                         except Exception as e:
                             logger.exception(
                                 f"Failed to create/send telegram delivery for rule author: {e}",
                                 component="notifications",
-                                user_id=str(author_id),
-                                rule_id=str(rule_id),
+                                user_id=author_id_str,
+                                rule_ids=rule_ids,
                                 correlation_id=correlation_id,
                             )
-                            increment_error_counter("delivery_create_error")
+                            _ERR["delivery_create_error"]()
 
             except Exception:
                 logger.exception(
-                    "Unexpected error while creating notifications for matched rule",
+                    "Unexpected error while creating notifications for rule author",
                     component="notifications",
-                    entry=str(rule_entry),
+                    user_id=str(author_id),
                     correlation_id=correlation_id,
                 )
-                increment_error_counter("notification_unexpected_error")
+                _ERR["notification_unexpected_error"]()
+
+        if created_ids:
+            # Commit the deliveries before any SMTP/Telegram I/O so this session
+            # is not held open during sends; _send_batch uses its own session
+            try:
+                await self.db_session.commit()
+            except Exception:
+                logger.exception(
+                    "Failed to commit notification deliveries",
+                    component="notifications",
+                    correlation_id=correlation_id,
+                )
+                _ERR["delivery_create_error"]()
+                await self.db_session.rollback()
+                created_ids = []
+            else:
+                await self._send_batch(created_ids)
 
         duration = (datetime.utcnow() - start).total_seconds()
         observe_notification_time(duration)
@@ -325,6 +466,20 @@ class NotificationService:
 
         return created_ids
 
+    @staticmethod
+    def _append_rule_summary(body: Optional[str], rule_names: List[str]) -> str:
+        """
+        Append the list of violated rules to a rendered body.
+
+        Only applied when several rules of the same author matched, so
+        single-rule alerts keep the template output unchanged.
+        """
+        body = body or ""
+        if len(rule_names) < 2:
+            return body
+        summary = "Violated rules: " + ", ".join(rule_names)
+        return f"{body}\n\n{summary}" if body else summary
+
     def _get_default_recipients(self, channel: NotificationChannel) -> List[str]:
         """
         Returns default recipients for a channel.
@@ -340,8 +495,10 @@ class NotificationService:
         self, payload: NotificationDeliveryCreate, created_ids: List[UUID]
     ) -> Optional[UUID]:
         """
-        Create a delivery record via repository, append its id to created_ids
-        and send the notification immediately (not in background).
+        Create a delivery record via repository and append its id to created_ids.
+
+        Sending is done afterwards by _send_batch, once all deliveries for the
+        alert exist, so each channel can send its messages together.
         """
         logger.info(
             "🔍 DELIVERY: Creating delivery",
@@ -350,19 +507,10 @@ class NotificationService:
             component="notifications",
         )
         try:
-            delivery = await self.repo.create_delivery(payload)
+            delivery = await self.repo.create_delivery(payload, commit=False)
             created_ids.append(delivery.id)
             logger.info(
-                "✅ DELIVERY: Created, sending now",
-                delivery_id=str(delivery.id),
-                component="notifications",
-            )
-
-            # Send immediately instead of background task
-            await self._send_notification_async(delivery.id)
-
-            logger.info(
-                "✅ DELIVERY: Send completed",
+                "✅ DELIVERY: Created",
                 delivery_id=str(delivery.id),
                 component="notifications",
             )
@@ -373,7 +521,7 @@ class NotificationService:
                 component="notifications",
                 metadata=getattr(payload, "metadata", {}),
             )
-            increment_error_counter("delivery_create_error")
+            _ERR["delivery_create_error"]()
             return None
 
     async def _render_template(
@@ -385,8 +533,7 @@ class NotificationService:
         """
         Render subject and body for a template.
 
-        Uses a simple substitution scheme supporting both "{{var}}" and "{var}".
-        Complex templates should be migrated to Jinja2 later.
+        Supports legacy "{{var}}"/"{var}" interpolation and Jinja2 templates.
         """
         try:
             vars_map = self._prepare_template_variables(
@@ -415,66 +562,11 @@ class NotificationService:
     ) -> Dict[str, Any]:
         """
         Build variables dictionary according to template flags and input data.
-        """
-        variables: Dict[str, Any] = {}
-
-        if getattr(template, "show_transaction_id", False):
-            variables["transaction_id"] = transaction_data.get("id", "Unknown")
-
-        if getattr(template, "show_amount", False):
-            variables["amount"] = transaction_data.get("amount", 0)
-            variables["currency"] = transaction_data.get("currency", "USD")
 
-        if getattr(template, "show_timestamp", False):
-            ts = transaction_data.get("timestamp")
-            if isinstance(ts, str):
-                variables["timestamp"] = ts
-            elif ts:
-                try:
-                    variables["timestamp"] = ts.strftime("%Y-%m-%d %H:%M:%S UTC")
-                except Exception:
-                    variables["timestamp"] = str(ts)
-            else:
-                variables["timestamp"] = "Unknown"
-
-        if getattr(template, "show_from_account", False):
-            variables["from_account"] = transaction_data.get("from_account", "Unknown")
-
-        if getattr(template, "show_to_account", False):
-            variables["to_account"] = transaction_data.get("to_account", "Unknown")
-
-        if getattr(template, "show_location", False):
-            variables["location"] = transaction_data.get("location", "Unknown")
-
-        if getattr(template, "show_device_info", False):
-            variables["device_id"] = transaction_data.get("device_id", "Unknown")
-            variables["ip_address"] = transaction_data.get("ip_address", "Unknown")
-
-        if getattr(template, "show_triggered_rules", False):
-            rule_results = evaluation_result.get("rule_results", []) or []
-            triggered = [
-                f"{r.get('rule_name', 'Unknown')} ({r.get('risk_level', 'Unknown')})"
-                for r in rule_results
-                if r.get("match_status") == "MATCHED"
-            ]
-            variables["triggered_rules"] = ", ".join(triggered) if triggered else "None"
-            variables["triggered_rules_count"] = len(triggered)
-
-        if getattr(template, "show_fraud_probability", False):
-            rule_results = evaluation_result.get("rule_results", []) or []
-            if rule_results:
-                avg_conf = sum(
-                    r.get("confidence_score", 0) for r in rule_results
-                ) / len(rule_results)
-                variables["fraud_probability"] = f"{avg_conf:.2%}"
-            else:
-                variables["fraud_probability"] = "Unknown"
-
-        variables["overall_risk_level"] = evaluation_result.get(
-            "overall_risk_level", "Unknown"
-        )
-        variables["flagged"] = evaluation_result.get("flagged", False)
-        variables["should_block"] = evaluation_result.get("should_block", False)
+        The enabled show_* flags are resolved once per template version into a
+        generated builder function (see templating.get_variables_builder).
+        """
+        variables = get_variables_builder(template)(transaction_data, evaluation_result)
 
         # merge custom_fields if present and is a dict
         try:
@@ -493,40 +585,14 @@ class NotificationService:
         self, template_string: str, variables: Dict[str, Any]
     ) -> str:
         """
-        Render a template string using simple replacement:
-        converts '{{var}}' to '{var}' and uses str.format.
-        Lines with missing/unresolved variables are removed from the output.
+        Render a template string via the templating module.
+
+        Jinja templates ("{%" blocks) use compiled, cached templates. Legacy
+        '{var}'/'{{var}}' templates are formatted line by line and lines with
+        missing/unresolved variables are removed from the output.
         """
         try:
-            safe = template_string.replace("{{", "{").replace("}}", "}")
-
-            # Split into lines to handle each separately
-            lines = safe.split("\n")
-            rendered_lines = []
-
-            for line in lines:
-                try:
-                    # Try to format the line
-                    rendered_line = line.format(**variables)
-
-                    # Check if line still contains unresolved placeholders
-                    # (happens when variable is not in variables dict)
-                    if "{" in rendered_line and "}" in rendered_line:
-                        # Skip lines with unresolved placeholders
-                        continue
-
-                    rendered_lines.append(rendered_line)
-                except KeyError:
-                    # Skip lines with missing variables
-                    logger.debug(
-                        "Skipping line with missing variable",
-                        component="notifications",
-                        line=line[:50],  # Log first 50 chars
-                    )
-                    continue
-
-            return "\n".join(rendered_lines)
-
+            return render_template_string(template_string, variables)
         except Exception:
             logger.exception(
                 "Unexpected template rendering error", component="notifications"
@@ -544,6 +610,8 @@ class NotificationService:
         # Import here to avoid circular dependencies
         from src.storage.sql import get_async_session_maker
 
+        log = logger.bind(delivery_id=delivery_id)
+
         try:
             # Create a new session for this async task
             session_maker = get_async_session_maker()
@@ -553,17 +621,13 @@ class NotificationService:
 
                 delivery = await repo.get_delivery(delivery_id)
                 if not delivery:
-                    logger.warning(
-                        "Delivery not found",
-                        component="notifications",
-                        delivery_id=str(delivery_id),
-                    )
+                    log.warning("Delivery not found")
                     return
 
                 attempt_no = (delivery.attempts or 0) + 1
 
-                channel_cfg = await repo.get_channel_config(delivery.channel)
-                if not channel_cfg:
+                channel_cfg = await _get_channel_config(repo, delivery.channel)
+                if channel_cfg is None:
                     err = "channel_configuration_missing"
                     await repo.create_delivery_attempt(
                         delivery_id=delivery_id,
@@ -574,12 +638,8 @@ class NotificationService:
                     await repo.update_delivery_status(
                         delivery_id, NotificationStatus.FAILED, error_message=err
                     )
-                    logger.error(
-                        "Missing channel configuration",
-                        component="notifications",
-                        delivery_id=str(delivery_id),
-                    )
-                    increment_error_counter("channel_config_missing")
+                    log.error("Missing channel configuration")
+                    _ERR["channel_config_missing"]()
                     return
 
                 send_ok = False
@@ -587,19 +647,17 @@ class NotificationService:
 
                 try:
                     if delivery.channel == NotificationChannel.EMAIL:
-                        cfg = channel_cfg.config or {}
                         send_ok, send_err = await self.email_sender.send(
                             recipients=delivery.recipients,
                             message=delivery.body,
-                            config=cfg,
+                            config=channel_cfg,
                             subject=delivery.subject,
                         )
                     elif delivery.channel == NotificationChannel.TELEGRAM:
-                        cfg = channel_cfg.config or {}
                         send_ok, send_err = await self.telegram_sender.send(
                             recipients=delivery.recipients,
                             message=delivery.body,
-                            config=cfg,
+                            config=channel_cfg,
                         )
                     else:
                         send_ok = False
@@ -607,74 +665,158 @@ class NotificationService:
                 except Exception as exc:
                     send_ok = False
                     send_err = str(exc)
-                    print("EX1", str(exc))
 
-                # persist attempt
-                try:
-                    await repo.create_delivery_attempt(
-                        delivery_id=delivery_id,
-                        attempt_number=attempt_no,
-                        success=send_ok,
-                        error_message=send_err,
-                        metadata={"channel": str(delivery.channel)},
-                    )
-                    await repo.increment_delivery_attempt(delivery_id)
-                except Exception:
-                    logger.exception(
-                        "Failed to persist delivery attempt",
-                        delivery_id=str(delivery_id),
-                    )
+                await self._record_send_result(repo, delivery, send_ok, send_err)
 
-                # update status based on result and attempts
-                try:
-                    updated = await repo.get_delivery(delivery_id)
-                    if not updated:
-                        logger.error(
-                            "Delivery not found after send",
-                            delivery_id=str(delivery_id),
-                        )
-                        return
+        except Exception:
+            log.exception("Unexpected error in _send_notification_async")
+            _ERR["notification_unexpected_error"]()
 
-                    attempts_now = updated.attempts or attempt_no
-                    max_attempts = updated.max_attempts or 1
+    async def send_many(self, delivery_ids: List[UUID], concurrency: int = 32) -> None:
+        """
+        Send existing deliveries concurrently, at most `concurrency` at a time.
 
-                    if send_ok:
-                        await repo.update_delivery_status(
-                            delivery_id, NotificationStatus.DELIVERED
-                        )
-                        logger.info(
-                            "Delivery delivered",
+        Each delivery is sent independently by _send_notification_async (own
+        session, failures recorded per delivery); the semaphore keeps the
+        fan-out within SMTP/Telegram rate limits.
+        """
+        if not delivery_ids:
+            return
+
+        # Warm the channel config cache so concurrent sends don't all miss it
+        from src.storage.sql import get_async_session_maker
+
+        try:
+            async with get_async_session_maker()() as session:
+                repo = NotificationRepository(session)
+                for channel in NotificationChannel:
+                    await _get_channel_config(repo, channel)
+        except Exception:
+            logger.exception(
+                "Failed to preload channel configs", component="notifications"
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_one(delivery_id: UUID) -> None:
+            async with semaphore:
+                await self._send_notification_async(delivery_id)
+
+        await asyncio.gather(
+            *(send_one(delivery_id) for delivery_id in delivery_ids),
+            return_exceptions=True,
+        )
+
+    async def _record_send_result(
+        self,
+        repo: NotificationRepository,
+        delivery: Any,
+        send_ok: bool,
+        send_err: Optional[str],
+    ) -> None:
+        """
+        Persist a send attempt and move the delivery to its next status.
+
+        Both happen in a single statement, see
+        NotificationRepository.record_attempt_and_update.
+        """
+        attempt_no = (delivery.attempts or 0) + 1
+        log = logger.bind(delivery_id=delivery.id)
+
+        try:
+            updated = await repo.record_attempt_and_update(
+                delivery_id=delivery.id,
+                attempt_number=attempt_no,
+                success=send_ok,
+                error_message=send_err,
+                metadata={"channel": str(delivery.channel)},
+            )
+        except Exception:
+            log.exception("Failed to record delivery attempt")
+            _ERR["delivery_update_error"]()
+            return
+
+        if not updated:
+            log.error("Delivery not found after send")
+            return
+
+        attempts_now, max_attempts, _ = updated
+        if send_ok:
+            log.info("Delivery delivered")
+        else:
+            log.warning(
+                "Delivery send failed",
+                attempts=attempts_now,
+                max_attempts=max_attempts,
+                error=send_err,
+            )
+            _ERR["delivery_send_error"]()
+
+    async def _send_batch(self, delivery_ids: List[UUID]) -> None:
+        """
+        Send several deliveries, grouped by channel.
+
+        Deliveries are loaded in one query and each channel's messages go
+        through its sender's send_many(), so e.g. all emails share a single
+        SMTP connection. Uses its own session, like _send_notification_async.
+        """
+        from src.storage.sql import get_async_session_maker
+
+        try:
+            session_maker = get_async_session_maker()
+            async with session_maker() as session:
+                repo = NotificationRepository(session)
+                deliveries = await repo.get_deliveries_by_ids(delivery_ids)
+
+                by_channel: Dict[Any, List[Any]] = defaultdict(list)
+                for delivery in deliveries:
+                    by_channel[delivery.channel].append(delivery)
+
+                senders = {
+                    NotificationChannel.EMAIL: self.email_sender,
+                    NotificationChannel.TELEGRAM: self.telegram_sender,
+                }
+
+                for channel, channel_deliveries in by_channel.items():
+                    sender = senders.get(channel)
+                    channel_cfg = await _get_channel_config(repo, channel)
+
+                    if sender is None:
+                        error = f"unsupported_channel:{channel}"
+                        results = [(False, error)] * len(channel_deliveries)
+                    elif channel_cfg is None:
+                        logger.error(
+                            "Missing channel configuration",
                             component="notifications",
-                            delivery_id=str(delivery_id),
+                            channel=str(channel),
                         )
-                    else:
-                        new_status = (
-                            NotificationStatus.FAILED
-                            if attempts_now >= max_attempts
-                            else NotificationStatus.RETRYING
-                        )
-                        await repo.update_delivery_status(
-                            delivery_id, new_status, error_message=send_err
+                        _ERR["channel_config_missing"]()
+                        results = [(False, "channel_configuration_missing")] * len(
+                            channel_deliveries
                         )
-                        logger.warning(
-                            "Delivery send failed",
-                            component="notifications",
-                            delivery_id=str(delivery_id),
-                            attempts=attempts_now,
-                            max_attempts=max_attempts,
-                            error=send_err,
+                    else:
+                        try:
+                            results = await sender.send_many(
+                                [
+                                    (d.recipients, d.body, d.subject)
+                                    for d in channel_deliveries
+                                ],
+                                channel_cfg,
+                            )
+                        except Exception as exc:
+                            results = [(False, str(exc))] * len(channel_deliveries)
+
+                    for delivery, (send_ok, send_err) in zip(
+                        channel_deliveries, results
+                    ):
+                        await self._record_send_result(
+                            repo, delivery, send_ok, send_err
                         )
-                        increment_error_counter("delivery_send_error")
-                except Exception:
-                    logger.exception(
-                        "Failed to update delivery status", delivery_id=str(delivery_id)
-                    )
-                    increment_error_counter("delivery_update_error")
 
         except Exception:
             logger.exception(
-                "Unexpected error in _send_notification_async",
+                "Unexpected error in _send_batch",
                 component="notifications",
-                delivery_id=str(delivery_id),
+                delivery_count=len(delivery_ids),
             )
-            increment_error_counter("notification_unexpected_error")
+            _ERR["notification_unexpected_error"]()
@@ -0,0 +1,294 @@
+"""
+Template rendering for notification messages.
+
+Two template syntaxes are supported:
+- Legacy interpolation templates ("{var}" / "{{var}}"), rendered line by line.
+  Lines whose variables are missing are dropped, which is how the template
+  show_* flags hide fields. The default user templates use this syntax.
+  Lines are pre-split into static chunks and placeholder names, so plain
+  interpolation renders with a single join instead of str.format.
+- Jinja2 templates (any "{%" block tag), compiled once and cached in-process.
+  Template bodies are user-editable, so they run in Jinja's sandbox.
+"""
+
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+from jinja2 import Template
+from jinja2.sandbox import SandboxedEnvironment
+
+from src.core.logging import get_logger
+
+logger = get_logger("notifications.templating")
+
+# Sandboxed: templates can only reach the variables they are given, not
+# arbitrary Python attributes of those objects
+_environment = SandboxedEnvironment(
+    autoescape=False,
+    cache_size=0,  # compiled templates are cached by _compile_jinja_template
+)
+
+
+def is_jinja_template(template_string: str) -> bool:
+    """Return True if the template uses Jinja block syntax."""
+    return "{%" in template_string
+
+
+@lru_cache(maxsize=1000)
+def _compile_jinja_template(template_string: str) -> Template:
+    """Compile a Jinja template once; keyed by its source text."""
+    return _environment.from_string(template_string)
+
+
+# Plain "{name}" placeholder; anything else (format specs, attribute or
+# index access) is left to str.format
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_]\w*)\}")
+
+# Compiled legacy line kinds
+_STATIC = 0
+_ZIP = 1
+_FORMAT = 2
+
+CompiledLine = Tuple[int, str, Tuple[str, ...], Tuple[str, ...]]
+
+
+def _compile_legacy_line(line: str) -> CompiledLine:
+    """
+    Split a line into static chunks and placeholder names.
+
+    Returns (kind, line, statics, names); statics and names interleave as
+    statics[0], names[0], statics[1], ... when kind is _ZIP.
+    """
+    if "{" not in line and "}" not in line:
+        return _STATIC, line, (), ()
+
+    parts = _PLACEHOLDER_RE.split(line)
+    statics = tuple(parts[0::2])
+    if any("{" in chunk or "}" in chunk for chunk in statics):
+        return _FORMAT, line, (), ()
+    return _ZIP, line, statics, tuple(parts[1::2])
+
+
+@lru_cache(maxsize=1024)
+def _compile_legacy_template(template_string: str) -> Tuple[CompiledLine, ...]:
+    """
+    Preprocess a legacy template once: normalize '{{var}}' to '{var}', split
+    into lines and parse each line into static chunks and placeholder names.
+
+    Cached by source text, so edited templates naturally get a new entry.
+    """
+    safe = template_string.replace("{{", "{").replace("}}", "}")
+    return tuple(_compile_legacy_line(line) for line in safe.split("\n"))
+
+
+def _render_legacy(template_string: str, variables: Dict[str, Any]) -> str:
+    """Render a legacy template, dropping lines with missing variables."""
+    rendered_lines = []
+
+    for kind, line, statics, names in _compile_legacy_template(template_string):
+        if kind == _STATIC:
+            rendered_lines.append(line)
+            continue
+        try:
+            if kind == _ZIP:
+                # Interleave static chunks with values, one join per line
+                parts = [""] * (len(statics) + len(names))
+                parts[0::2] = statics
+                parts[1::2] = [str(variables[name]) for name in names]
+                rendered_line = "".join(parts)
+            else:
+                rendered_line = line.format(**variables)
+
+            # Check if line still contains unresolved placeholders
+            # (happens when variable is not in variables dict)
+            if "{" in rendered_line and "}" in rendered_line:
+                # Skip lines with unresolved placeholders
+                continue
+
+            rendered_lines.append(rendered_line)
+        except KeyError:
+            # Skip lines with missing variables
+            if logger.is_enabled_for("debug"):
+                logger.debug(
+                    "Skipping line with missing variable",
+                    component="notifications",
+                    line=line[:50],  # Log first 50 chars
+                )
+            continue
+
+    return "\n".join(rendered_lines)
+
+
+def render_template_string(template_string: str, variables: Dict[str, Any]) -> str:
+    """
+    Render a notification template string with the given variables.
+
+    Jinja templates are rendered through the compiled template cache; legacy
+    interpolation templates keep their line-dropping behaviour.
+    """
+    if is_jinja_template(template_string):
+        return _compile_jinja_template(template_string).render(variables)
+    return _render_legacy(template_string, variables)
+
+
+# Template variable builders
+#
+# The show_* flags of a template only change together with updated_at. For
+# each flag combination a straight-line builder function is generated once
+# (source text compiled with exec), and templates map to their builder by
+# (template.id, updated_at), so rendering runs no per-flag getattr or branch.
+
+VariablesBuilder = Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+
+FLAG_NAMES: Tuple[str, ...] = (
+    "show_transaction_id",
+    "show_amount",
+    "show_timestamp",
+    "show_from_account",
+    "show_to_account",
+    "show_location",
+    "show_device_info",
+    "show_triggered_rules",
+    "show_fraud_probability",
+)
+
+# Builder body lines per flag, in the order variables are added
+_FLAG_SOURCE: Dict[str, str] = {
+    "show_transaction_id": 'v["transaction_id"] = tx.get("id", "Unknown")',
+    "show_amount": (
+        'v["amount"] = tx.get("amount", 0)\nv["currency"] = tx.get("currency", "USD")'
+    ),
+    "show_timestamp": 'v["timestamp"] = _format_timestamp(tx.get("timestamp"))',
+    "show_from_account": 'v["from_account"] = tx.get("from_account", "Unknown")',
+    "show_to_account": 'v["to_account"] = tx.get("to_account", "Unknown")',
+    "show_location": 'v["location"] = tx.get("location", "Unknown")',
+    "show_device_info": (
+        'v["device_id"] = tx.get("device_id", "Unknown")\n'
+        'v["ip_address"] = tx.get("ip_address", "Unknown")'
+    ),
+    "show_triggered_rules": "_add_triggered_rules(v, ev)",
+    "show_fraud_probability": "_add_fraud_probability(v, ev)",
+}
+
+# Variables every template gets
+_COMMON_SOURCE = (
+    'v["overall_risk_level"] = ev.get("overall_risk_level", "Unknown")\n'
+    'v["flagged"] = ev.get("flagged", False)\n'
+    'v["should_block"] = ev.get("should_block", False)'
+)
+
+_BUILDER_CACHE_SIZE = 1024
+_builder_cache: Dict[Tuple[Any, Any], VariablesBuilder] = {}
+
+
+def _format_timestamp(ts: Any) -> str:
+    if isinstance(ts, str):
+        return ts
+    if isinstance(ts, datetime):
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(timezone.utc)
+        # Fixed format; building it directly skips strftime's format parsing
+        return (
+            f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} "
+            f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d} UTC"
+        )
+    if ts:
+        return str(ts)
+    return "Unknown"
+
+
+def _add_triggered_rules(variables: Dict[str, Any], ev: Dict[str, Any]) -> None:
+    rule_results = ev.get("rule_results", []) or []
+    triggered = [
+        f"{r.get('rule_name', 'Unknown')} ({r.get('risk_level', 'Unknown')})"
+        for r in rule_results
+        if r.get("match_status") == "MATCHED"
+    ]
+    variables["triggered_rules"] = ", ".join(triggered) if triggered else "None"
+    variables["triggered_rules_count"] = len(triggered)
+
+
+def _add_fraud_probability(variables: Dict[str, Any], ev: Dict[str, Any]) -> None:
+    rule_results = ev.get("rule_results", []) or []
+    if rule_results:
+        avg_conf = sum(r.get("confidence_score", 0) for r in rule_results) / len(
+            rule_results
+        )
+        variables["fraud_probability"] = f"{avg_conf:.2%}"
+    else:
+        variables["fraud_probability"] = "Unknown"
+
+
+def _add_triggered_rules_and_fraud_probability(
+    variables: Dict[str, Any], ev: Dict[str, Any]
+) -> None:
+    """Fused step: one pass over rule_results for both rule variables."""
+    triggered = []
+    conf_sum = 0
+    count = 0
+    for r in ev.get("rule_results", []) or []:
+        conf_sum += r.get("confidence_score", 0)
+        count += 1
+        if r.get("match_status") == "MATCHED":
+            triggered.append(
+                f"{r.get('rule_name', 'Unknown')} ({r.get('risk_level', 'Unknown')})"
+            )
+    variables["triggered_rules"] = ", ".join(triggered) if triggered else "None"
+    variables["triggered_rules_count"] = len(triggered)
+    variables["fraud_probability"] = f"{conf_sum / count:.2%}" if count else "Unknown"
+
+
+_BUILDER_GLOBALS: Dict[str, Any] = {
+    "_format_timestamp": _format_timestamp,
+    "_add_triggered_rules": _add_triggered_rules,
+    "_add_fraud_probability": _add_fraud_probability,
+    "_add_triggered_rules_and_fraud_probability": (
+        _add_triggered_rules_and_fraud_probability
+    ),
+}
+
+
+@lru_cache(maxsize=512)
+def compile_variables_builder(flags: Tuple[bool, ...]) -> VariablesBuilder:
+    """
+    Generate and compile the builder function for a flag combination.
+
+    Args:
+        flags: Values of FLAG_NAMES, in order
+    """
+    enabled = {name for name, on in zip(FLAG_NAMES, flags) if on}
+
+    lines = []
+    for name in FLAG_NAMES:
+        if name not in enabled:
+            continue
+        if name == "show_triggered_rules" and "show_fraud_probability" in enabled:
+            # Both rule variables need rule_results; walk the list only once
+            lines.append("_add_triggered_rules_and_fraud_probability(v, ev)")
+        elif name == "show_fraud_probability" and "show_triggered_rules" in enabled:
+            continue
+        else:
+            lines.append(_FLAG_SOURCE[name])
+    lines.append(_COMMON_SOURCE)
+
+    body = "\n".join(lines).replace("\n", "\n    ")
+    source = f"def build(tx, ev):\n    v = {{}}\n    {body}\n    return v\n"
+
+    namespace = dict(_BUILDER_GLOBALS)
+    label = "".join("1" if on else "0" for on in flags)
+    exec(compile(source, f"<notification-variables:{label}>", "exec"), namespace)
+    return namespace["build"]
+
+
+def get_variables_builder(template: Any) -> VariablesBuilder:
+    """Return the builder for a template, reading its flags once per version."""
+    key = (getattr(template, "id", None), getattr(template, "updated_at", None))
+    builder = _builder_cache.get(key)
+    if builder is None:
+        if len(_builder_cache) >= _BUILDER_CACHE_SIZE:
+            _builder_cache.clear()
+        flags = tuple(bool(getattr(template, name, False)) for name in FLAG_NAMES)
+        builder = _builder_cache[key] = compile_variables_builder(flags)
+    return builder
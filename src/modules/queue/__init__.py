@@ -36,7 +36,7 @@ from .schemas import (
     TaskSubmitResponse,
     TaskUpdate,
 )
-from .tasks import process_transaction
+from .tasks import process_transaction, process_transaction_batch
 
 __all__ = [
     # Celery app
@@ -59,4 +59,5 @@ __all__ = [
     "QueueMetrics",
     # Tasks
     "process_transaction",
+    "process_transaction_batch",
 ]
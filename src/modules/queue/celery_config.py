@@ -5,9 +5,16 @@ Configures Celery with Redis broker, PostgreSQL result backend,
 retry policies, and worker settings for distributed task processing.
 """
 
+import aiohttp
+import asyncpg
+import redis.exceptions
+import sqlalchemy.exc
 from celery import Celery
 from kombu import Exchange, Queue
+from kombu.exceptions import OperationalError as KombuOperationalError
+from pydantic import ValidationError as PydanticValidationError
 
+from src.core.exceptions import NonRetriableError, ValidationError
 from src.storage.redis.client import get_redis_url
 from src.storage.sql.engine import get_database_url
 
@@ -20,6 +27,33 @@ BROKER_URL = get_redis_url()
 # Convert async PostgreSQL URL to sync for Celery result backend
 RESULT_BACKEND = get_database_url().replace("postgresql+asyncpg://", "db+postgresql://")
 
+# Transient failures worth retrying. Anything else (bad payloads, programmer
+# errors) fails fast instead of re-running the whole task up to max_retries.
+RETRIABLE_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError,
+    KombuOperationalError,
+    sqlalchemy.exc.OperationalError,
+    sqlalchemy.exc.InterfaceError,
+    asyncpg.exceptions.PostgresConnectionError,
+    aiohttp.ClientConnectorError,
+)
+
+# Never retried, even when wrapping a retriable error: bad payloads and
+# programmer errors fail the same way on every attempt. CircuitOpenError is in
+# neither list: process_transaction re-queues those tasks for when the circuit
+# lets calls through again, without spending a retry.
+NON_RETRIABLE_EXCEPTIONS = (
+    NonRetriableError,
+    ValidationError,
+    PydanticValidationError,
+    TypeError,
+    KeyError,
+    AttributeError,
+)
+
 # Celery Configuration
 celery_app.conf.update(
     # Broker settings
@@ -59,8 +93,16 @@ celery_app.conf.update(
         "[%(asctime)s: %(levelname)s/%(processName)s] "
         "[%(task_name)s(%(task_id)s)] %(message)s"
     ),
-    # Retry settings (default for all tasks)
-    task_autoretry_for=(Exception,),  # Auto-retry on any exception
+    # Retry settings (default for all tasks, applied through annotations)
+    task_annotations={
+        "*": {
+            "autoretry_for": RETRIABLE_EXCEPTIONS,
+            "dont_autoretry_for": NON_RETRIABLE_EXCEPTIONS,
+            "retry_backoff": True,  # Exponential backoff
+            "retry_backoff_max": 300,  # Max 5 minutes
+            "retry_jitter": True,  # Avoid synchronized retry waves
+        },
+    },
     task_max_retries=3,  # Maximum retry attempts
     task_default_retry_delay=60,  # Wait 60 seconds between retries
     # Task routing and priority
@@ -69,9 +111,13 @@ celery_app.conf.update(
             "queue": "transactions",
             "routing_key": "transaction.process",
         },
-        "queue.save_rule_executions_to_db": {
-            "queue": "rule_executions",
-            "routing_key": "rule_execution.save",
+        "queue.process_transaction_batch": {
+            "queue": "transactions",
+            "routing_key": "transaction.process",
+        },
+        "queue.send_fraud_notification": {
+            "queue": "notifications",
+            "routing_key": "notification.fraud_alert",
         },
         "queue.cleanup_old_tasks": {
             "queue": "celery",
@@ -89,10 +135,9 @@ celery_app.conf.update(
             queue_arguments={"x-max-priority": 20},
         ),
         Queue(
-            "rule_executions",
-            Exchange("rule_executions"),
-            routing_key="rule_execution.#",
-            queue_arguments={"x-max-priority": 15},
+            "notifications",
+            Exchange("notifications"),
+            routing_key="notification.#",
         ),
         Queue(
             "celery",  # Default queue
@@ -106,10 +151,10 @@ celery_app.conf.update(
     # Performance optimizations
     broker_pool_limit=10,  # Connection pool size
     broker_heartbeat=30,  # Heartbeat interval
+    # No fanout_prefix/fanout_patterns: nothing uses broadcast queues, and
+    # the transactions queue is plain point-to-point list delivery
     broker_transport_options={
         "visibility_timeout": 3600,  # 1 hour
-        "fanout_prefix": True,
-        "fanout_patterns": True,
     },
     # Beat scheduler (for periodic tasks)
     beat_schedule={
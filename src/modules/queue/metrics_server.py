@@ -1,22 +1,37 @@
 """
 Metrics server for Celery worker.
 
-Runs a simple HTTP server in a background thread to expose Prometheus metrics
+Runs a threaded HTTP server in a background thread to expose Prometheus metrics
 from the Celery worker process.
 """
 
+import errno
 import threading
-from wsgiref.simple_server import make_server
+from wsgiref.simple_server import WSGIRequestHandler, make_server
 
 from prometheus_client import REGISTRY, generate_latest
+from prometheus_client.exposition import ThreadingWSGIServer
 
 # Set to track if server is already started
 _server_started = False
 _server_lock = threading.Lock()
 
 
+class _QuietHandler(WSGIRequestHandler):
+    """Request handler that skips the per-request access log on stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
 class MetricsServer:
-    """Simple WSGI server for exposing Prometheus metrics from Celery."""
+    """
+    Threaded WSGI server for exposing Prometheus metrics from Celery.
+
+    Uses prometheus_client's ThreadingWSGIServer so concurrent scrapes don't
+    queue behind each other, and a request handler that skips per-request
+    access logging to stderr.
+    """
 
     def __init__(self, port: int = 9091):
         """
@@ -55,11 +70,14 @@ class MetricsServer:
                 return
 
             try:
-                # Create WSGI server
-                self.server = make_server("0.0.0.0", self.port, self.metrics_app)
-
-                # Make server non-blocking
-                self.server.timeout = 0.5
+                # Create WSGI server (one thread per scrape)
+                self.server = make_server(
+                    "0.0.0.0",
+                    self.port,
+                    self.metrics_app,
+                    server_class=ThreadingWSGIServer,
+                    handler_class=_QuietHandler,
+                )
 
                 # Start server in daemon thread
                 self.thread = threading.Thread(
@@ -73,7 +91,7 @@ class MetricsServer:
                 )
 
             except OSError as e:
-                if e.errno == 48:  # Address already in use
+                if e.errno == errno.EADDRINUSE:
                     print(
                         f"⚠️  Port {self.port} already in use, metrics server not started"
                     )
@@ -5,22 +5,92 @@ Provides async database access for creating, updating, and querying
 queue tasks with support for metrics calculation and idempotency checks.
 """
 
+import sys
 import traceback
-from datetime import datetime
-from typing import List, Optional
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import BigInteger, bindparam, cast, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from src.core.exceptions import DuplicateTaskError, TaskNotFoundError
-from src.storage.models import QueueTask
+from src.storage.models import QueueTask, QueueTaskCounter
 
 from .enums import ErrorType, TaskStatus
 from .schemas import QueueMetrics, TaskCreate, TaskUpdate
 
+# Database clock as naive UTC, matching the "timestamp without time zone"
+# columns regardless of the server's TimeZone setting
+_UTC_NOW = func.timezone("UTC", func.now())
+
+# Bulky, rarely read columns left out of list queries; accessing them on the
+# returned tasks raises instead of lazy-loading (await session.refresh(task,
+# ["error_traceback"]) loads them explicitly). task_metadata stays loaded:
+# TaskResponse reads it.
+_DEFER_COLD_COLUMNS = (
+    defer(QueueTask.error_traceback, raiseload=True),  # type: ignore
+)
+
+# Name of the queue_task_counters row holding the sum of retry_count
+_RETRIES_COUNTER = "retries"
+
+
+def _counter(name: str):
+    """Scalar subquery summing one queue_task_counters counter's slots."""
+    # sum(bigint) is numeric in PostgreSQL; cast back so counts stay ints
+    return func.coalesce(
+        select(cast(func.sum(QueueTaskCounter.value), BigInteger))
+        .where(QueueTaskCounter.name == name)  # type: ignore
+        .scalar_subquery(),
+        0,
+    )
+
+
+def _to_float(value: Optional[Any]) -> Optional[float]:
+    """Convert a nullable SQL aggregate (avg returns Decimal) to float."""
+    return float(value) if value is not None else None
+
+
+# Statements built once at import; per-call values are bound parameters, so
+# each call skips rebuilding the expression tree and hits the compiled cache
+_GET_BY_ID = select(QueueTask).where(
+    QueueTask.id == bindparam("task_id")  # type: ignore
+)
+_GET_BY_CORRELATION_ID = select(QueueTask).where(
+    QueueTask.correlation_id == bindparam("correlation_id")  # type: ignore
+)
+_GET_BY_CELERY_TASK_ID = select(QueueTask).where(
+    QueueTask.celery_task_id == bindparam("celery_task_id")  # type: ignore
+)
+
+# Metrics in one statement (a single round-trip): status counts and total
+# retries come from the trigger-maintained queue_task_counters slots, timings
+# from the covering partial index over completed tasks
+_processing_time = QueueTask.processing_time_ms  # type: ignore
+_METRICS_STMT = select(
+    _counter(TaskStatus.PENDING.name).label("pending"),
+    _counter(TaskStatus.PROCESSING.name).label("processing"),
+    _counter(TaskStatus.COMPLETED.name).label("completed"),
+    _counter(TaskStatus.FAILED.name).label("failed"),
+    _counter(_RETRIES_COUNTER).label("retries"),
+    func.avg(_processing_time).label("avg_processing"),
+    func.avg(QueueTask.rule_engine_time_ms).label(  # type: ignore
+        "avg_rule_engine"
+    ),
+    func.percentile_cont(0.95)
+    .within_group(_processing_time.asc())
+    .label("p95_processing"),
+    func.percentile_cont(0.99)
+    .within_group(_processing_time.asc())
+    .label("p99_processing"),
+).where(
+    QueueTask.status == TaskStatus.COMPLETED  # type: ignore
+)
+
 
 class QueueRepository:
     """
@@ -45,6 +115,9 @@ class QueueRepository:
         """
         Create a new queue task with idempotency check.
 
+        Idempotency is enforced by the unique constraint on correlation_id,
+        so the common (non-duplicate) case costs a single INSERT.
+
         Args:
             task_data: Task creation data
             celery_task_id: Optional Celery task ID
@@ -55,16 +128,6 @@ class QueueRepository:
         Raises:
             DuplicateTaskError: If task with correlation_id already exists
         """
-        # Check for existing task with same correlation_id (idempotency)
-        existing = await self.get_by_correlation_id(task_data.correlation_id)
-        if existing:
-            logger.warning(
-                f"Duplicate task detected: correlation_id={task_data.correlation_id}"
-            )
-            raise DuplicateTaskError(
-                f"Task with correlation_id '{task_data.correlation_id}' already exists"
-            )
-
         try:
             task = QueueTask(
                 correlation_id=task_data.correlation_id,
@@ -75,9 +138,11 @@ class QueueRepository:
                 task_metadata=task_data.metadata,
             )
 
+            # All columns are set client-side (id, timestamps via default
+            # factories) and sessions don't expire on commit, so no refresh
+            # SELECT is needed after the INSERT
             self.session.add(task)
             await self.session.commit()
-            await self.session.refresh(task)
 
             logger.info(
                 f"Created queue task: id={task.id}, "
@@ -86,9 +151,11 @@ class QueueRepository:
 
             return task
 
-        except IntegrityError as e:
+        except IntegrityError:
             await self.session.rollback()
-            logger.error(f"Database integrity error creating task: {e}")
+            logger.warning(
+                f"Duplicate task detected: correlation_id={task_data.correlation_id}"
+            )
             raise DuplicateTaskError(
                 f"Task with correlation_id '{task_data.correlation_id}' already exists"
             )
@@ -107,8 +174,7 @@ class QueueRepository:
         Returns:
             QueueTask if found, None otherwise
         """
-        stmt = select(QueueTask).where(QueueTask.id == task_id)  # type: ignore
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_GET_BY_ID, {"task_id": task_id})
         return result.scalar_one_or_none()
 
     async def get_by_correlation_id(self, correlation_id: str) -> Optional[QueueTask]:
@@ -121,8 +187,9 @@ class QueueRepository:
         Returns:
             QueueTask if found, None otherwise
         """
-        stmt = select(QueueTask).where(QueueTask.correlation_id == correlation_id)  # type: ignore
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _GET_BY_CORRELATION_ID, {"correlation_id": correlation_id}
+        )
         return result.scalar_one_or_none()
 
     async def get_by_celery_task_id(self, celery_task_id: str) -> Optional[QueueTask]:
@@ -135,8 +202,9 @@ class QueueRepository:
         Returns:
             QueueTask if found, None otherwise
         """
-        stmt = select(QueueTask).where(QueueTask.celery_task_id == celery_task_id)  # type: ignore
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _GET_BY_CELERY_TASK_ID, {"celery_task_id": celery_task_id}
+        )
         return result.scalar_one_or_none()
 
     async def update_task(self, task_id: UUID, update_data: TaskUpdate) -> QueueTask:
@@ -153,25 +221,45 @@ class QueueRepository:
         Raises:
             TaskNotFoundError: If task not found
         """
-        task = await self.get_by_id(task_id)
-        if not task:
-            raise TaskNotFoundError(f"Task with id {task_id} not found")
-
         # Update only provided fields
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(task, field, value)
+        return await self._update_fields(task_id, **update_dict)
 
-        task.updated_at = datetime.utcnow()
+    async def _update_fields(self, task_id: UUID, **fields: Any) -> QueueTask:
+        """
+        Apply column values to a task in a single UPDATE ... RETURNING.
+
+        Used directly by the mark_* state transitions, whose fields are known
+        up front, so they skip building and dumping a TaskUpdate model.
+        Values may be SQL expressions (e.g. QueueTask.retry_count + 1), which
+        are evaluated atomically by the database.
+
+        Raises:
+            TaskNotFoundError: If task not found
+        """
+        stmt = (
+            update(QueueTask)
+            .where(QueueTask.id == task_id)  # type: ignore
+            .values(**fields, updated_at=_UTC_NOW)
+            .returning(QueueTask)
+            .execution_options(populate_existing=True)
+        )
 
         try:
+            result = await self.session.execute(stmt)
+            task = result.scalar_one_or_none()
+            if task is None:
+                await self.session.rollback()
+                raise TaskNotFoundError(f"Task with id {task_id} not found")
+
             await self.session.commit()
-            await self.session.refresh(task)
 
-            logger.debug(f"Updated task {task_id}: {update_dict}")
+            logger.debug(f"Updated task {task_id}: {fields}")
 
             return task
 
+        except TaskNotFoundError:
+            raise
         except Exception as e:
             await self.session.rollback()
             logger.error(f"Error updating task {task_id}: {e}")
@@ -191,13 +279,13 @@ class QueueRepository:
         Returns:
             Updated QueueTask
         """
-        update_data = TaskUpdate(
+        return await self._update_fields(
+            task_id,
             status=TaskStatus.PROCESSING,
-            started_at=datetime.utcnow(),
+            started_at=_UTC_NOW,
             worker_id=worker_id,
             worker_hostname=worker_hostname,
         )
-        return await self.update_task(task_id, update_data)
 
     async def mark_completed(
         self,
@@ -206,29 +294,57 @@ class QueueRepository:
         rule_engine_time_ms: Optional[int] = None,
         db_write_time_ms: Optional[int] = None,
         notification_time_ms: Optional[int] = None,
+        elapsed_ms: Optional[int] = None,
+        worker_id: Optional[str] = None,
+        worker_hostname: Optional[str] = None,
     ) -> QueueTask:
         """
         Mark task as successfully completed.
 
+        Workers that skip mark_started pass elapsed_ms and their worker info
+        here, so the task's start and completion land in one UPDATE. Both
+        timestamps then come from the database clock: started_at is the
+        completion time minus elapsed_ms.
+
         Args:
             task_id: Task UUID
             processing_time_ms: Total processing time
             rule_engine_time_ms: Rule engine processing time
             db_write_time_ms: Database write time
             notification_time_ms: Notification send time
+            elapsed_ms: Milliseconds from the start of processing to the
+                current database transaction, if started_at is not yet
+                recorded
+            worker_id: Worker ID processing the task, if not yet recorded
+            worker_hostname: Worker hostname, if not yet recorded
 
         Returns:
             Updated QueueTask
         """
-        update_data = TaskUpdate(
+        start_fields = {
+            name: value
+            for name, value in (
+                (
+                    "started_at",
+                    None
+                    if elapsed_ms is None
+                    else _UTC_NOW - timedelta(milliseconds=elapsed_ms),
+                ),
+                ("worker_id", worker_id),
+                ("worker_hostname", worker_hostname),
+            )
+            if value is not None
+        }
+        return await self._update_fields(
+            task_id,
             status=TaskStatus.COMPLETED,
-            completed_at=datetime.utcnow(),
+            completed_at=_UTC_NOW,
             processing_time_ms=processing_time_ms,
             rule_engine_time_ms=rule_engine_time_ms,
             db_write_time_ms=db_write_time_ms,
             notification_time_ms=notification_time_ms,
+            **start_fields,
         )
-        return await self.update_task(task_id, update_data)
 
     async def mark_failed(
         self,
@@ -245,33 +361,35 @@ class QueueRepository:
             task_id: Task UUID
             error_type: Type of error
             error_message: Error message
-            error_traceback: Full error traceback
+            error_traceback: Full error traceback (defaults to the exception
+                being handled, if any)
             retry: Whether task will be retried
 
         Returns:
             Updated QueueTask
         """
-        task = await self.get_by_id(task_id)
-        if not task:
-            raise TaskNotFoundError(f"Task with id {task_id} not found")
+        # Only format the active exception when the caller didn't capture one;
+        # outside an except block there is nothing to format
+        if error_traceback is None and sys.exc_info()[0] is not None:
+            error_traceback = traceback.format_exc()
 
         # If retrying, set back to PENDING; otherwise mark as FAILED
         new_status = TaskStatus.PENDING if retry else TaskStatus.FAILED
-
-        update_data = TaskUpdate(
-            status=new_status,
-            error_type=error_type,
-            error_message=error_message,
-            error_traceback=error_traceback or traceback.format_exc(),
-            completed_at=datetime.utcnow() if not retry else None,
-            last_retry_at=datetime.utcnow() if retry else None,
-        )
-
-        # Increment retry count if retrying
+        fields: Dict[str, Any] = {
+            "status": new_status,
+            "error_type": error_type,
+            "error_message": error_message,
+            "error_traceback": error_traceback,
+            "completed_at": None if retry else _UTC_NOW,
+            "last_retry_at": _UTC_NOW if retry else None,
+        }
+
+        # Increment retry count in the same UPDATE, so concurrent failures
+        # of one task cannot lose an increment
         if retry:
-            task.retry_count += 1
+            fields["retry_count"] = QueueTask.retry_count + 1  # type: ignore
 
-        return await self.update_task(task_id, update_data)
+        return await self._update_fields(task_id, **fields)
 
     async def get_tasks_by_status(
         self, status: TaskStatus, limit: int = 100
@@ -279,6 +397,8 @@ class QueueRepository:
         """
         Get tasks by status.
 
+        error_traceback is not loaded.
+
         Args:
             status: Task status to filter by
             limit: Maximum number of tasks to return
@@ -291,6 +411,7 @@ class QueueRepository:
             .where(QueueTask.status == status)  # type: ignore
             .order_by(QueueTask.created_at.desc())  # type: ignore
             .limit(limit)
+            .options(*_DEFER_COLD_COLUMNS)
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -302,81 +423,24 @@ class QueueRepository:
         Returns:
             QueueMetrics with current statistics
         """
-        # Count tasks by status
-        status_counts_stmt = select(
-            QueueTask.status,  # type: ignore
-            func.count(QueueTask.id).label("count"),  # type: ignore
-        ).group_by(QueueTask.status)  # type: ignore
-        status_result = await self.session.execute(status_counts_stmt)
-        status_counts = {row[0]: row[1] for row in status_result}
-
-        # Calculate processing time statistics
-        completed_stmt = select(QueueTask).where(
-            QueueTask.status == TaskStatus.COMPLETED  # type: ignore
-        )
-        completed_result = await self.session.execute(completed_stmt)
-        completed_tasks = list(completed_result.scalars().all())
-
-        processing_times = [
-            t.processing_time_ms
-            for t in completed_tasks
-            if t.processing_time_ms is not None
-        ]
-
-        rule_engine_times = [
-            t.rule_engine_time_ms
-            for t in completed_tasks
-            if t.rule_engine_time_ms is not None
-        ]
-
-        # Calculate averages and percentiles
-        avg_processing = (
-            sum(processing_times) / len(processing_times) if processing_times else None
-        )
-        avg_rule_engine = (
-            sum(rule_engine_times) / len(rule_engine_times)
-            if rule_engine_times
-            else None
-        )
-
-        p95_processing = None
-        p99_processing = None
-        if processing_times:
-            sorted_times = sorted(processing_times)
-            p95_idx = int(len(sorted_times) * 0.95)
-            p99_idx = int(len(sorted_times) * 0.99)
-            p95_processing = (
-                sorted_times[p95_idx]
-                if p95_idx < len(sorted_times)
-                else sorted_times[-1]
-            )
-            p99_processing = (
-                sorted_times[p99_idx]
-                if p99_idx < len(sorted_times)
-                else sorted_times[-1]
-            )
-
-        # Count total retries
-        total_retries_stmt = select(func.sum(QueueTask.retry_count))
-        retry_result = await self.session.execute(total_retries_stmt)
-        total_retries = retry_result.scalar() or 0
+        row = (await self.session.execute(_METRICS_STMT)).one()
 
-        # Calculate error rate
-        total = sum(status_counts.values())
-        failed = status_counts.get(TaskStatus.FAILED, 0)
+        total = row.pending + row.processing + row.completed + row.failed
+        failed = row.failed
+        total_retries = row.retries
         error_rate = (failed / total) if total > 0 else 0.0
 
         return QueueMetrics(
             total_tasks=total,
-            pending_tasks=status_counts.get(TaskStatus.PENDING, 0),
-            processing_tasks=status_counts.get(TaskStatus.PROCESSING, 0),
-            completed_tasks=status_counts.get(TaskStatus.COMPLETED, 0),
+            pending_tasks=row.pending,
+            processing_tasks=row.processing,
+            completed_tasks=row.completed,
             failed_tasks=failed,
             retry_tasks=int(total_retries),  # Use actual retry count instead of status
-            avg_processing_time_ms=avg_processing,
-            avg_rule_engine_time_ms=avg_rule_engine,
-            p95_processing_time_ms=p95_processing,
-            p99_processing_time_ms=p99_processing,
+            avg_processing_time_ms=_to_float(row.avg_processing),
+            avg_rule_engine_time_ms=_to_float(row.avg_rule_engine),
+            p95_processing_time_ms=_to_float(row.p95_processing),
+            p99_processing_time_ms=_to_float(row.p99_processing),
             total_retries=int(total_retries),
             error_rate=error_rate,
         )
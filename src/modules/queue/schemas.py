@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .enums import ErrorType, TaskPriority, TaskStatus
 
@@ -39,7 +39,7 @@ class TaskCreate(BaseModel):
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Additional task metadata",
-        alias="task_metadata",
+        validation_alias="task_metadata",
     )
 
 
@@ -60,7 +60,9 @@ class TaskUpdate(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     last_retry_at: Optional[datetime] = None
-    task_metadata: Optional[Dict[str, Any]] = Field(default=None, alias="metadata")
+    task_metadata: Optional[Dict[str, Any]] = Field(
+        default=None, validation_alias="metadata"
+    )
 
 
 class TaskResponse(BaseModel):
@@ -81,15 +83,15 @@ class TaskResponse(BaseModel):
     notification_time_ms: Optional[int]
     worker_id: Optional[str]
     worker_hostname: Optional[str]
-    task_metadata: Dict[str, Any] = Field(alias="metadata")
+    # Read from the task_metadata attribute, emitted as "metadata"
+    # (QueueTask.metadata is the SQLAlchemy MetaData, not the task's data)
+    task_metadata: Dict[str, Any] = Field(serialization_alias="metadata")
     created_at: datetime
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class TaskStatusResponse(BaseModel):
@@ -10,61 +10,40 @@ Defines tasks for processing transactions through the fraud detection pipeline:
 """
 
 import asyncio
-import json
+import os
 import socket
+import threading
 import traceback
-from time import time
-from typing import Any, Dict, List
-from uuid import UUID
+from datetime import datetime
+from functools import lru_cache
+from time import monotonic, perf_counter_ns
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from uuid import UUID, uuid4
 
 from celery import Task
-from celery.exceptions import MaxRetriesExceededError
+from celery.exceptions import Retry
+from celery.signals import worker_process_init
 from loguru import logger
-from redis import Redis as SyncRedis
+from pydantic import ValidationError as PydanticValidationError
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from sqlalchemy.exc import DatabaseError as SQLAlchemyDatabaseError
+from sqlalchemy.exc import InterfaceError as SQLAlchemyInterfaceError
+from sqlalchemy.exc import OperationalError as SQLAlchemyOperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-
-def get_or_create_event_loop():
-    """
-    Get existing event loop or create new one if needed.
-
-    This prevents "Event loop is closed" errors in Celery workers.
-    Safe to use in solo pool or gevent pool workers.
-
-    Returns:
-        Event loop instance
-    """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        # No event loop in current thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    return loop
-
-
-def run_async(coro):
-    """
-    Run async coroutine safely in Celery task context.
-
-    Uses existing event loop when possible, creates new one if needed.
-    This is more reliable than asyncio.run() which always creates new loop.
-
-    Args:
-        coro: Coroutine to execute
-
-    Returns:
-        Result of coroutine execution
-    """
-    loop = get_or_create_event_loop()
-    return loop.run_until_complete(coro)
-
-
-from src.core.exceptions import DatabaseError, RuleEvaluationError
+from src.config import settings
+from src.core.exceptions import (
+    CircuitOpenError,
+    DatabaseError,
+    NotificationError,
+    RuleEvaluationError,
+    ValidationError,
+)
+from src.core.logging import is_level_enabled
+from src.core.reliability import CircuitBreaker
 from src.modules.reporting.metrics import (
     increment_completed_counter,
     increment_error_counter,
@@ -80,26 +59,141 @@ from src.modules.reporting.metrics import (
     observe_transaction_processing_time,
 )
 from src.modules.rule_engine import service as rule_engine_service
-from src.modules.rule_engine.enums import RiskLevel
+from src.modules.rule_engine.enums import RiskLevel, TimeWindow
 from src.modules.rule_engine.enums import TransactionStatus as TxnStatus
 from src.modules.transactions.repository import TransactionRepository
-from src.storage.redis import get_async_redis_dependency
+from src.storage.redis import get_async_redis_client
+from src.storage.redis.pattern import store_transaction_for_pattern_windows
 from src.storage.sql.engine import get_async_session_maker
 
-from .celery_config import celery_app
+from .celery_config import (
+    NON_RETRIABLE_EXCEPTIONS,
+    RETRIABLE_EXCEPTIONS,
+    celery_app,
+)
 from .enums import ErrorType, TaskStatus
 from .repository import QueueRepository
 
+try:
+    from src.modules.notifications.service import NotificationService
+
+    _NOTIFICATIONS_AVAILABLE = True
+except ImportError:  # pragma: no cover - notifications module is optional
+    _NOTIFICATIONS_AVAILABLE = False
+
+
+# Event loop shared by every task of the worker process. It runs forever on
+# a daemon thread, so asyncpg and Redis connection pools bound to it stay
+# warm between tasks. Created lazily per process: threads do not survive the
+# prefork pool's fork.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_pid: Optional[int] = None
+_worker_loop_lock = threading.Lock()
+
+
+def get_worker_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the worker's background event loop, starting it if needed.
+
+    Returns:
+        Event loop running on the worker's loop thread
+    """
+    global _worker_loop, _worker_loop_pid
+
+    pid = os.getpid()
+    if _worker_loop is None or _worker_loop_pid != pid:
+        with _worker_loop_lock:
+            if _worker_loop is None or _worker_loop_pid != pid:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="queue-event-loop", daemon=True
+                ).start()
+                _worker_loop, _worker_loop_pid = loop, pid
+
+    return _worker_loop
+
+
+@worker_process_init.connect
+def _start_worker_event_loop(**kwargs) -> None:
+    """Start the event loop thread as each worker process boots."""
+    get_worker_event_loop()
+
+
+def run_async(coro):
+    """
+    Run async coroutine safely in Celery task context.
+
+    Submits the coroutine to the worker's long-lived event loop and blocks
+    until it finishes.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        Result of coroutine execution
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_worker_event_loop()).result()
+
+
 # Get async session maker from storage module
 AsyncSessionLocal = get_async_session_maker()
 
+# Innermost frames kept when formatting task failure tracebacks
+_TRACEBACK_LIMIT = 20
+
+# Resolved once per worker process instead of once per task
+_WORKER_HOSTNAME = socket.gethostname()
+
+_TXN_STATUS_BY_VALUE: Mapping[str, TxnStatus] = MappingProxyType(
+    {status.value: status for status in TxnStatus}
+)
+
+# Pattern data is stored for every window a pattern rule may query
+_TIME_WINDOWS = (
+    TimeWindow.THIRTY_MINUTES,
+    TimeWindow.HOUR,
+    TimeWindow.SIX_HOURS,
+    TimeWindow.TWELVE_HOURS,
+    TimeWindow.DAY,
+)
+
+# Per-backend circuit breakers shared by every task of the process. Only
+# connection-level failures count; an open circuit fails calls fast instead of
+# tying up a worker slot until the backend times out. The guarded calls must
+# let these errors propagate for the breaker to see them.
+_REDIS_FAILURES = (
+    RedisConnectionError,
+    RedisTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+_redis_breaker = CircuitBreaker(
+    "redis",
+    error_threshold=settings.queue.CIRCUIT_ERROR_THRESHOLD,
+    recovery_seconds=settings.queue.CIRCUIT_RECOVERY_SECONDS,
+    failure_exceptions=_REDIS_FAILURES,
+)
+_postgres_breaker = CircuitBreaker(
+    "postgres",
+    error_threshold=settings.queue.CIRCUIT_ERROR_THRESHOLD,
+    recovery_seconds=settings.queue.CIRCUIT_RECOVERY_SECONDS,
+    failure_exceptions=(
+        SQLAlchemyOperationalError,
+        SQLAlchemyInterfaceError,
+        ConnectionError,
+        TimeoutError,
+    ),
+)
+
 
 class TransactionProcessingTask(Task):
     """
     Base task class with custom error handling and retry logic.
     """
 
-    autoretry_for = (DatabaseError, RuleEvaluationError, Exception)
+    # Transient errors only; the "*" task annotation sets the same values
+    autoretry_for = RETRIABLE_EXCEPTIONS
+    dont_autoretry_for = NON_RETRIABLE_EXCEPTIONS
     retry_kwargs = {"max_retries": 3}
     retry_backoff = True  # Exponential backoff
     retry_backoff_max = 600  # Max 10 minutes
@@ -179,12 +273,12 @@ def process_transaction(
         Dict with processing results
 
     Raises:
-        Retry: If processing fails and retries available
-        MaxRetriesExceededError: If all retries exhausted
+        Retry: If processing fails with a retriable error and retries remain
+        Exception: The original error once retries are exhausted
     """
     # Get worker info
     worker_id = self.request.id
-    worker_hostname = socket.gethostname()
+    worker_hostname = _WORKER_HOSTNAME
 
     # Extract transaction_id from data
     transaction_id = transaction_data.get("id")
@@ -192,7 +286,10 @@ def process_transaction(
     # Extract max_composite_depth (default to 5 if not provided)
     max_composite_depth = int(transaction_data.get("max_composite_depth", 5))
 
-    logger.info(
+    # Parsed once; shared by the processing and failure paths
+    queue_task_uuid = UUID(queue_task_id)
+
+    logger.debug(
         f"Processing transaction {transaction_id} "
         f"(correlation_id={correlation_id}, worker={worker_hostname})"
     )
@@ -200,7 +297,7 @@ def process_transaction(
     increment_submitted_counter()
     increment_task_counter(TaskStatus.PENDING.value)
 
-    start_time = time()
+    start_ns = perf_counter_ns()
 
     try:
         # Run async processing using safe event loop handler
@@ -208,7 +305,7 @@ def process_transaction(
             _process_transaction_async(
                 transaction_data=transaction_data,
                 correlation_id=correlation_id,
-                queue_task_id=UUID(queue_task_id),
+                queue_task_id=queue_task_uuid,
                 worker_id=worker_id,
                 worker_hostname=worker_hostname,
                 max_composite_depth=max_composite_depth,
@@ -216,55 +313,251 @@ def process_transaction(
         )
 
         # Record metrics
-        processing_time_ms = int((time() - start_time) * 1000)
-        observe_processing_time((time() - start_time))
+        processing_ns = perf_counter_ns() - start_ns
+        processing_time_ms = processing_ns // 1_000_000
+        observe_processing_time(processing_ns / 1e9)
 
         increment_task_counter(TaskStatus.COMPLETED.value)
 
-        logger.info(
+        logger.debug(
             f"Transaction {transaction_id} processed successfully "
             f"in {processing_time_ms}ms"
         )
 
         return result
 
+    except CircuitOpenError as exc:
+        # A backend is down, not this transaction at fault: re-queue it for
+        # when the circuit lets calls through again. The copy keeps the
+        # current retry count, so outages do not use up max_retries.
+        logger.warning(
+            f"Deferring transaction {transaction_id} by {exc.retry_after:.1f}s: {exc}",
+            event="transaction_deferred",
+            correlation_id=correlation_id,
+        )
+        increment_task_counter("retry")
+        self.signature_from_request(
+            countdown=exc.retry_after, retries=self.request.retries
+        ).apply_async()
+        raise Retry(exc=exc, when=exc.retry_after)
+
     except Exception as exc:
-        processing_time_ms = int((time() - start_time) * 1000)
+        # Mirrors Celery's autoretry decision, which performs the retry
+        will_retry = _will_autoretry(self, exc, self.request.retries)
 
-        # Determine error type
-        error_type = _map_exception_to_error_type(exc)
+        _record_task_failure(transaction_id, queue_task_uuid, exc, will_retry)
 
-        logger.error(
-            f"Error processing transaction {transaction_id}: {exc}\n"
-            f"{traceback.format_exc()}"
+        # Re-raise for autoretry, which schedules the retry with jittered
+        # exponential backoff (retry_backoff/retry_jitter), or fails the task
+        # once retries are exhausted or the error is not retriable
+        raise
+
+
+def _will_autoretry(task: Task, exc: BaseException, retries: int) -> bool:
+    """Whether Celery's autoretry retries exc after the given retry count."""
+    return (
+        retries < task.max_retries
+        and isinstance(exc, tuple(task.autoretry_for))
+        and not isinstance(exc, tuple(getattr(task, "dont_autoretry_for", ())))
+    )
+
+
+def _record_task_failure(
+    transaction_id: Any, queue_task_id: UUID, exc: BaseException, will_retry: bool
+) -> None:
+    """
+    Log a failed processing attempt and record it on the queue task.
+
+    Args:
+        transaction_id: Transaction ID, for the log
+        queue_task_id: Queue task UUID
+        exc: Exception that failed the attempt
+        will_retry: Whether the transaction is processed again
+    """
+    error_type = _map_exception_to_error_type(exc)
+
+    # Formatted once, depth-capped, and shared by log and DB
+    error_traceback = "".join(traceback.format_exception(exc, limit=-_TRACEBACK_LIMIT))
+    logger.error(
+        f"Error processing transaction {transaction_id}: {exc}\n{error_traceback}"
+    )
+
+    # Try to mark task as failed in database
+    try:
+        run_async(
+            _mark_task_failed(
+                queue_task_id=queue_task_id,
+                error_type=error_type,
+                error_message=str(exc),
+                error_traceback=error_traceback,
+                retry=will_retry,
+            )
+        )
+    except Exception as db_exc:
+        logger.error(f"Failed to update task status: {db_exc}")
+
+    # Increment error metrics, once per failure: a retried attempt is
+    # counted under the "retry" label, only the final one as failed
+    increment_failed_counter(error_type=error_type.value)
+    increment_task_counter("retry" if will_retry else TaskStatus.FAILED.value)
+
+
+@celery_app.task(
+    bind=True,
+    base=TransactionProcessingTask,
+    name="queue.process_transaction_batch",
+    queue="transactions",
+)
+def process_transaction_batch(
+    self,
+    items: List[Tuple[Dict[str, Any], str, str]],
+) -> Dict[str, Any]:
+    """
+    Process several queued transactions in one task.
+
+    For producers that already hold several transactions: the batch costs
+    one broker delivery and ack, and its transactions are evaluated
+    concurrently on the worker event loop, overlapping their Redis and
+    database round-trips.
+
+    A transaction that fails before its status update commits is handed to
+    its own queue.process_transaction task, which owns further retries, so
+    one bad transaction never re-runs the others. The batch attempt counts
+    as that task's first try, so a poison transaction still fails after
+    max_retries. Transactions whose error is not retriable, or that
+    committed but could not queue their fraud notification, are recorded
+    as failed instead.
+
+    Args:
+        items: (transaction_data, correlation_id, queue_task_id) triples, as
+            passed to process_transaction
+
+    Returns:
+        Dict with batch statistics
+    """
+    worker_id = self.request.id
+    start_ns = perf_counter_ns()
+
+    results = run_async(_process_transaction_batch_async(items, worker_id))
+
+    completed = 0
+    redispatched = 0
+    failed = 0
+    for (transaction_data, correlation_id, queue_task_id), result in zip(
+        items, results
+    ):
+        if not isinstance(result, BaseException):
+            increment_submitted_counter()
+            increment_task_counter(TaskStatus.COMPLETED.value)
+            completed += 1
+        elif _redispatch_batch_item(
+            self, transaction_data, correlation_id, queue_task_id, result
+        ):
+            # Counted as submitted by its own process_transaction task
+            redispatched += 1
+        else:
+            increment_submitted_counter()
+            failed += 1
+
+    processing_ns = perf_counter_ns() - start_ns
+    observe_processing_time(processing_ns / 1e9)
+
+    logger.debug(
+        f"Processed batch of {len(items)} transactions "
+        f"in {processing_ns // 1_000_000}ms",
+        completed=completed,
+        redispatched=redispatched,
+        failed=failed,
+    )
+
+    return {
+        "batch_size": len(items),
+        "completed": completed,
+        "redispatched": redispatched,
+        "failed": failed,
+    }
+
+
+def _redispatch_batch_item(
+    task: Task,
+    transaction_data: Dict[str, Any],
+    correlation_id: str,
+    queue_task_id: str,
+    exc: BaseException,
+) -> bool:
+    """
+    Hand a failed batch transaction to its own process_transaction task.
+
+    Returns:
+        True if it was redispatched, False if it failed for good; either way
+        the failed attempt is recorded, except for a deferred open circuit
+    """
+    transaction_id = transaction_data.get("id")
+
+    if isinstance(exc, CircuitOpenError):
+        # Deferred as in process_transaction, without spending a retry
+        options: Dict[str, Any] = {"countdown": exc.retry_after}
+        will_retry = True
+    else:
+        # NotificationError is raised only once the status update committed;
+        # re-running the transaction would apply its evaluation twice
+        options = {"retries": 1}
+        will_retry = not isinstance(exc, NotificationError) and _will_autoretry(
+            task, exc, 0
         )
 
-        # Try to mark task as failed in database
+    if will_retry:
         try:
-            run_async(
-                _mark_task_failed(
-                    queue_task_id=UUID(queue_task_id),
-                    error_type=error_type,
-                    error_message=str(exc),
-                    retry=self.request.retries < self.max_retries,
-                )
+            celery_app.send_task(
+                "queue.process_transaction",
+                args=[transaction_data, correlation_id, queue_task_id],
+                queue="transactions",
+                **options,
             )
-        except Exception as db_exc:
-            logger.error(f"Failed to update task status: {db_exc}")
+        except Exception as dispatch_exc:
+            logger.error(
+                f"Failed to redispatch transaction {transaction_id}: {dispatch_exc}",
+                event="batch_item_redispatch_error",
+                correlation_id=correlation_id,
+            )
+            will_retry = False
 
-        # Increment error metrics
-        increment_failed_counter(error_type=error_type.value)
-        increment_task_counter(TaskStatus.FAILED.value)
+    if will_retry and isinstance(exc, CircuitOpenError):
+        logger.warning(
+            f"Deferring transaction {transaction_id} by {exc.retry_after:.1f}s: {exc}",
+            event="transaction_deferred",
+            correlation_id=correlation_id,
+        )
+        increment_task_counter("retry")
+    else:
+        _record_task_failure(transaction_id, UUID(queue_task_id), exc, will_retry)
 
-        # Retry if possible
-        if self.request.retries < self.max_retries:
-            increment_task_counter(TaskStatus.FAILED.value)
-            raise self.retry(exc=exc, countdown=2**self.request.retries)
-        else:
-            raise MaxRetriesExceededError(
-                f"Task failed after {self.max_retries} retries: {exc}"
+    return will_retry
+
+
+async def _process_transaction_batch_async(
+    items: List[Tuple[Dict[str, Any], str, str]], worker_id: str
+) -> List[Any]:
+    """Run the batch's transactions concurrently; exceptions are returned."""
+    semaphore = asyncio.Semaphore(settings.queue.TRANSACTION_BATCH_CONCURRENCY)
+
+    async def process(
+        transaction_data: Dict[str, Any], correlation_id: str, queue_task_id: str
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            return await _process_transaction_async(
+                transaction_data=transaction_data,
+                correlation_id=correlation_id,
+                queue_task_id=UUID(queue_task_id),
+                worker_id=worker_id,
+                worker_hostname=_WORKER_HOSTNAME,
+                max_composite_depth=int(transaction_data.get("max_composite_depth", 5)),
             )
 
+    return await asyncio.gather(
+        *(process(*item) for item in items), return_exceptions=True
+    )
+
 
 async def _process_transaction_async(
     transaction_data: Dict[str, Any],
@@ -291,97 +584,179 @@ async def _process_transaction_async(
     async with AsyncSessionLocal() as session:
         repo = QueueRepository(session)
 
-        # Mark task as processing
-        await repo.mark_started(
-            task_id=queue_task_id,
-            worker_id=worker_id,
-            worker_hostname=worker_hostname,
-        )
+        # Without MARK_TASKS_STARTED the start is recorded with the
+        # completion, derived from the database clock
+        start_ns = perf_counter_ns()
+        if settings.queue.MARK_TASKS_STARTED:
+            async with _postgres_breaker:
+                await repo.mark_started(
+                    task_id=queue_task_id,
+                    worker_id=worker_id,
+                    worker_hostname=worker_hostname,
+                )
 
         # ✅ Transaction data already received from Redis - no DB fetch needed!
         transaction_id = UUID(transaction_data["id"])
+        transaction_id_str = str(transaction_id)
+
+        # One pooled client covers rule evaluation and pattern writes
+        redis_client = await get_async_redis_client()
 
         # Evaluate with rule engine
-        rule_engine_start = time()
+        rule_engine_start_ns = perf_counter_ns()
         evaluation_result = await _evaluate_transaction(
-            transaction_data, max_composite_depth=max_composite_depth
-        )
-        rule_engine_time_ms = int((time() - rule_engine_start) * 1000)
-        observe_rule_engine_time((time() - rule_engine_start))
-
-        # Update transaction status in DB (async write)
-        db_write_start = time()
-        await _update_transaction_status(session, transaction_id, evaluation_result)
-        db_write_time_ms = int((time() - db_write_start) * 1000)
-        observe_db_write_time((time() - db_write_start))
-
-        # Save rule executions to Redis for later persistence
-        await _save_rule_executions_to_redis(
-            correlation_id=correlation_id,
-            transaction_id=transaction_id,
-            evaluation_result=evaluation_result,
+            transaction_data, redis_client, max_composite_depth=max_composite_depth
         )
-
-        print("WAS I HERE")
-
-        # Trigger background task to save rule executions to PostgreSQL
-        # This runs asynchronously and won't block transaction processing
-        if evaluation_result.get("triggered_rules"):
-            celery_app.send_task(
-                "queue.save_rule_executions_to_db",
-                args=[correlation_id],
-                queue="rule_executions",
-                countdown=5,  # Delay 5 seconds to ensure Redis write completes
-            )
-            logger.debug(
-                f"Scheduled save_rule_executions_to_db task for {correlation_id}",
-                correlation_id=correlation_id,
+        rule_engine_ns = perf_counter_ns() - rule_engine_start_ns
+        rule_engine_time_ms = rule_engine_ns // 1_000_000
+        observe_rule_engine_time(rule_engine_ns / 1e9)
+
+        # Update transaction status in DB (async write); committed together
+        # with the task completion below, in one database transaction
+        db_write_start_ns = perf_counter_ns()
+        async with _postgres_breaker:
+            await _update_transaction_status(
+                session, transaction_id, correlation_id, evaluation_result, commit=False
             )
-
-        # Send notifications if suspicious
-        notification_time_ms = 0
-        if evaluation_result.get("is_suspicious", False):
-            notification_start = time()
-            await _send_notifications(
-                transaction_data, evaluation_result, correlation_id
-            )
-            notification_time_ms = int((time() - notification_start) * 1000)
-            observe_notification_time((time() - notification_start))
+        db_write_ns = perf_counter_ns() - db_write_start_ns
+        db_write_time_ms = db_write_ns // 1_000_000
+        observe_db_write_time(db_write_ns / 1e9)
 
         # Mark task as completed
-        total_time_ms = rule_engine_time_ms + db_write_time_ms + notification_time_ms
+        total_ns = rule_engine_ns + db_write_ns
+        total_time_ms = total_ns // 1_000_000
 
         # Record transaction processing time metric
-        observe_transaction_processing_time(
-            total_time_ms / 1000.0
-        )  # Convert to seconds
+        observe_transaction_processing_time(total_ns / 1e9)
+
+        async with _postgres_breaker:
+            await repo.mark_completed(
+                task_id=queue_task_id,
+                processing_time_ms=total_time_ms,
+                rule_engine_time_ms=rule_engine_time_ms,
+                db_write_time_ms=db_write_time_ms,
+                notification_time_ms=0,  # measured by send_fraud_notification
+                elapsed_ms=(
+                    None
+                    if settings.queue.MARK_TASKS_STARTED
+                    else (db_write_start_ns - start_ns) // 1_000_000
+                ),
+                worker_id=worker_id,
+                worker_hostname=worker_hostname,
+            )
 
-        await repo.mark_completed(
-            task_id=queue_task_id,
-            processing_time_ms=total_time_ms,
-            rule_engine_time_ms=rule_engine_time_ms,
-            db_write_time_ms=db_write_time_ms,
-            notification_time_ms=notification_time_ms,
-        )
+        # Notifications are delivered by their own task, off the transaction
+        # critical path; their timing is recorded there. Dispatched only once
+        # the status update has committed, so an alert never goes out for a
+        # rolled-back evaluation that will be retried.
+        is_suspicious = evaluation_result.get("is_suspicious", False)
+        if is_suspicious:
+            _dispatch_fraud_notification(
+                transaction_data, evaluation_result, correlation_id
+            )
 
         return {
-            "transaction_id": str(transaction_id),
+            "transaction_id": transaction_id_str,
             "correlation_id": correlation_id,
-            "is_suspicious": evaluation_result.get("is_suspicious", False),
+            "is_suspicious": is_suspicious,
             "risk_score": evaluation_result.get("risk_score", 0),
             "triggered_rules": evaluation_result.get("triggered_rules", []),
             "processing_time_ms": total_time_ms,
         }
 
 
+def _dispatch_fraud_notification(
+    transaction_data: Dict[str, Any],
+    evaluation_result: Dict[str, Any],
+    correlation_id: str,
+) -> None:
+    """
+    Queue send_fraud_notification for a processed transaction.
+
+    Raises:
+        NotificationError: If the task could not be queued. The transaction's
+            processing has committed by then and must not be re-run.
+    """
+    try:
+        celery_app.send_task(
+            "queue.send_fraud_notification",
+            args=[transaction_data, evaluation_result, correlation_id],
+            queue="notifications",
+        )
+    except Exception as e:
+        raise NotificationError(f"Failed to queue fraud notification: {e}") from e
+
+
+# Process-local copy of the Redis active-rules cache: (loaded_at, rules).
+# Lives on the worker event loop; dropped after the TTL or as soon as a
+# rule cache change is announced on RULES_INVALIDATE_CHANNEL.
+_ACTIVE_RULES_TTL_SECONDS = 30
+_active_rules_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+_rules_invalidation_listener: Optional[asyncio.Task] = None
+
+
+async def _listen_for_rule_invalidation(redis_client: AsyncRedis) -> None:
+    """Drop the local active-rules copy whenever rules change."""
+    global _active_rules_cache
+
+    pubsub = redis_client.pubsub()
+    try:
+        await pubsub.subscribe(rule_engine_service.RULES_INVALIDATE_CHANNEL)
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                _active_rules_cache = None
+    except Exception as e:
+        logger.warning(
+            f"Rule invalidation listener stopped: {e}",
+            event="rules_invalidation_listener_error",
+            error=str(e),
+        )
+    finally:
+        # Without a listener the copy could go stale until the TTL
+        _active_rules_cache = None
+        await pubsub.aclose()
+
+
+async def _get_active_rules_local(redis_client: AsyncRedis) -> List[Dict[str, Any]]:
+    """
+    Get active rules, reading Redis at most once per TTL per worker process.
+
+    Args:
+        redis_client: Async Redis client
+
+    Returns:
+        List of rule dictionaries
+    """
+    global _active_rules_cache, _rules_invalidation_listener
+
+    if _rules_invalidation_listener is None or _rules_invalidation_listener.done():
+        _rules_invalidation_listener = asyncio.get_running_loop().create_task(
+            _listen_for_rule_invalidation(redis_client)
+        )
+
+    now = monotonic()
+    cached = _active_rules_cache
+    if cached is not None and now - cached[0] < _ACTIVE_RULES_TTL_SECONDS:
+        return cached[1]
+
+    async with _redis_breaker:
+        rules = await rule_engine_service.get_cached_active_rules(redis_client)
+    # An empty result is not cached, so a cold Redis cache is retried
+    _active_rules_cache = (now, rules) if rules else None
+    return rules
+
+
 async def _evaluate_transaction(
-    transaction: Dict[str, Any], max_composite_depth: int = 5
+    transaction: Dict[str, Any],
+    redis_client: AsyncRedis,
+    max_composite_depth: int = 5,
 ) -> Dict[str, Any]:
     """
     Evaluate transaction with rule engine.
 
     Args:
         transaction: Complete transaction data from Redis
+        redis_client: Async Redis client for rules and pattern data
         max_composite_depth: Maximum recursion depth for composite rules
 
     Returns:
@@ -390,29 +765,28 @@ async def _evaluate_transaction(
     transaction_id = transaction.get("id")
     correlation_id = transaction.get("correlation_id", "")
 
-    logger.info(
-        f"Starting rule engine evaluation for transaction {transaction_id}",
-        event="rule_engine_evaluation_start",
-        transaction_id=transaction_id,
-        correlation_id=correlation_id,
-        transaction_amount=transaction.get("amount"),
-        transaction_amount_type=type(transaction.get("amount")).__name__,
-    )
+    if is_level_enabled("debug"):
+        logger.debug(
+            f"Starting rule engine evaluation for transaction {transaction_id}",
+            event="rule_engine_evaluation_start",
+            transaction_id=transaction_id,
+            correlation_id=correlation_id,
+            transaction_amount=transaction.get("amount"),
+            transaction_amount_type=type(transaction.get("amount")).__name__,
+        )
 
     try:
-        # Get Redis client for fetching active rules
-        redis_gen = get_async_redis_dependency()
-        redis_client = await anext(redis_gen)
-
-        # Get active rules from cache
-        active_rules = await rule_engine_service.get_cached_active_rules(redis_client)
+        # Get active rules from the process-local copy of the cache
+        active_rules = await _get_active_rules_local(redis_client)
 
-        logger.info(
-            f"Retrieved {len(active_rules) if active_rules else 0} active rules from cache",
-            event="active_rules_retrieved",
-            transaction_id=transaction_id,
-            rules_count=len(active_rules) if active_rules else 0,
-        )
+        if is_level_enabled("debug"):
+            rules_count = len(active_rules) if active_rules else 0
+            logger.debug(
+                f"Retrieved {rules_count} active rules from cache",
+                event="active_rules_retrieved",
+                transaction_id=transaction_id,
+                rules_count=rules_count,
+            )
 
         if not active_rules:
             logger.warning(
@@ -446,37 +820,27 @@ async def _evaluate_transaction(
         # Store transaction data for pattern analysis (async, non-blocking)
         # This allows pattern rules to analyze historical transaction patterns
         try:
-            from src.modules.rule_engine.enums import TimeWindow
-            from src.storage.redis.pattern import store_transaction_for_pattern
-
-            # Store for multiple time windows to support different pattern rules
-            time_windows = [
-                TimeWindow.THIRTY_MINUTES,
-                TimeWindow.HOUR,
-                TimeWindow.SIX_HOURS,
-                TimeWindow.TWELVE_HOURS,
-                TimeWindow.DAY,
-            ]
-
             from_account = transaction.get("from_account", "")
 
-            for window in time_windows:
-                await store_transaction_for_pattern(
+            # All windows are written in a single pipelined round-trip
+            async with _redis_breaker:
+                await store_transaction_for_pattern_windows(
                     redis=redis_client,
                     account_id=from_account,
                     transaction_data=transaction,
-                    time_window=window,
+                    time_windows=_TIME_WINDOWS,
                 )
 
             logger.debug(
                 "Stored transaction for pattern analysis",
                 transaction_id=transaction_id,
                 from_account=from_account,
-                windows=[w.value for w in time_windows],
+                windows=[w.value for w in _TIME_WINDOWS],
             )
 
         except Exception as pattern_error:
-            # Don't fail transaction processing if pattern storage fails
+            # Don't fail transaction processing if pattern storage fails,
+            # including when the Redis circuit is open
             logger.warning(
                 "Failed to store transaction for pattern analysis",
                 transaction_id=transaction_id,
@@ -497,22 +861,31 @@ async def _evaluate_transaction(
             "total_rules_evaluated": evaluation_result.total_rules_evaluated,
             "total_execution_time_ms": evaluation_result.total_execution_time_ms,
             "has_critical_match": evaluation_result.has_critical_match,
-            "evaluation_details": evaluation_result.to_dict(),
+            # No full evaluation_result.to_dict() here: nothing downstream
+            # reads it, and this dict travels to the notification task
         }
 
-        logger.info(
-            f"Rule engine evaluation completed for transaction {transaction_id}",
-            event="rule_engine_evaluation_complete",
-            transaction_id=transaction_id,
-            is_suspicious=result_dict["is_suspicious"],
-            risk_level=result_dict["risk_level"],
-            final_status=result_dict["final_status"],
-            matched_rules_count=len(evaluation_result.matched_rules),
-            triggered_rules=[r["rule_name"] for r in result_dict["triggered_rules"]],
-        )
+        if is_level_enabled("debug"):
+            logger.debug(
+                f"Rule engine evaluation completed for transaction {transaction_id}",
+                event="rule_engine_evaluation_complete",
+                transaction_id=transaction_id,
+                is_suspicious=result_dict["is_suspicious"],
+                risk_level=result_dict["risk_level"],
+                final_status=result_dict["final_status"],
+                matched_rules_count=len(evaluation_result.matched_rules),
+                triggered_rules=[
+                    r["rule_name"] for r in result_dict["triggered_rules"]
+                ],
+            )
 
         return result_dict
 
+    except (CircuitOpenError, *_REDIS_FAILURES):
+        # Redis is down, not the transaction at fault: the task is retried
+        # instead of the transaction being marked FAILED
+        raise
+
     except Exception as e:
         logger.error(
             f"Rule engine evaluation failed for transaction {transaction_id}: {e}",
@@ -527,7 +900,8 @@ async def _evaluate_transaction(
             "is_suspicious": False,
             "risk_score": 0,
             "risk_level": RiskLevel.LOW.value,
-            "final_status": TxnStatus.FAILED.value,  # Mark as failed due to evaluation error
+            # Mark as failed due to evaluation error
+            "final_status": TxnStatus.FAILED.value,
             "triggered_rules": [],
             "total_rules_evaluated": 0,
             "evaluation_details": {
@@ -537,27 +911,40 @@ async def _evaluate_transaction(
         }
 
 
-def _risk_level_to_score(risk_level: RiskLevel) -> float:
-    """Convert risk level enum to numeric score 0-100."""
-    risk_scores = {
+_RISK_SCORES: Mapping[RiskLevel, float] = MappingProxyType(
+    {
         RiskLevel.LOW: 25.0,
         RiskLevel.MEDIUM: 50.0,
         RiskLevel.HIGH: 75.0,
         RiskLevel.CRITICAL: 100.0,
     }
-    return risk_scores.get(risk_level, 0.0)
+)
+
+
+def _risk_level_to_score(risk_level: RiskLevel) -> float:
+    """Convert risk level enum to numeric score 0-100."""
+    return _RISK_SCORES.get(risk_level, 0.0)
 
 
 async def _update_transaction_status(
-    session: AsyncSession, transaction_id: UUID, evaluation_result: Dict[str, Any]
+    session: AsyncSession,
+    transaction_id: UUID,
+    correlation_id: str,
+    evaluation_result: Dict[str, Any],
+    commit: bool = True,
 ) -> None:
     """
     Update transaction status in database based on rule engine evaluation.
 
+    Triggered rule executions are inserted by the same statement as the
+    status update.
+
     Args:
         session: Database session
         transaction_id: Transaction UUID
+        correlation_id: Transaction correlation ID
         evaluation_result: Evaluation results from rule engine
+        commit: Commit now; pass False to commit with a later write
     """
     try:
         transaction_repo = TransactionRepository(session)
@@ -566,18 +953,24 @@ async def _update_transaction_status(
         final_status_str = evaluation_result.get(
             "final_status", TxnStatus.APPROVED.value
         )
-        final_status = TxnStatus(final_status_str)
+        final_status = _TXN_STATUS_BY_VALUE[final_status_str]
 
-        # Update transaction status
-        await transaction_repo.update_status(
+        # Update transaction status and persist rule executions
+        await transaction_repo.update_status_and_persist_executions(
             transaction_id=transaction_id,
             status=final_status,
+            rule_executions=_rule_execution_values(
+                correlation_id,
+                evaluation_result.get("triggered_rules", []),
+                datetime.utcnow(),
+            ),
+            commit=commit,
         )
 
         # This increments the counter for the final status
         increment_transaction_counter(status=final_status.value)
 
-        logger.info(
+        logger.debug(
             f"Updated transaction {transaction_id} status to {final_status.value}",
             event="transaction_status_updated",
             transaction_id=str(transaction_id),
@@ -593,10 +986,38 @@ async def _update_transaction_status(
             transaction_id=str(transaction_id),
             error=str(e),
         )
+        if isinstance(e, RETRIABLE_EXCEPTIONS):
+            # Left unwrapped: autoretry only checks the raised type
+            raise
         raise DatabaseError(
             f"Failed to update transaction status: {e}",
             operation="update_transaction_status",
-        )
+        ) from e
+
+
+@celery_app.task(
+    name="queue.send_fraud_notification",
+    queue="notifications",
+)
+def send_fraud_notification(
+    transaction_data: Dict[str, Any],
+    evaluation_result: Dict[str, Any],
+    correlation_id: str,
+) -> None:
+    """
+    Send fraud notifications for a suspicious transaction.
+
+    Dispatched by process_transaction so alert delivery does not hold up
+    transaction processing.
+
+    Args:
+        transaction_data: Transaction data from Redis
+        evaluation_result: Evaluation results from rule engine
+        correlation_id: Correlation ID for tracking
+    """
+    start_ns = perf_counter_ns()
+    run_async(_send_notifications(transaction_data, evaluation_result, correlation_id))
+    observe_notification_time((perf_counter_ns() - start_ns) / 1e9)
 
 
 async def _send_notifications(
@@ -617,7 +1038,8 @@ async def _send_notifications(
 
         if not triggered_rules:
             logger.debug(
-                f"No notifications needed for transaction {transaction_id} - no rules matched"
+                f"No notifications needed for transaction {transaction_id} - "
+                "no rules matched"
             )
             return
 
@@ -630,14 +1052,16 @@ async def _send_notifications(
         )
 
         # Call notifications module
-        try:
-            from src.modules.notifications.service import NotificationService
-            from src.storage.dependencies import get_db_session
-            from src.storage.sql import get_async_session_maker
+        if not _NOTIFICATIONS_AVAILABLE:
+            logger.warning("Notifications module not available, using fallback")
+            # Fallback to console output
+            _print_fraud_alert(
+                transaction_id or "unknown", triggered_rules, risk_level or "low"
+            )
+            return
 
-            # Get database session for notifications
-            session_maker = get_async_session_maker()
-            async with session_maker() as db_session:
+        try:
+            async with AsyncSessionLocal() as db_session:
                 notification_service = NotificationService(db_session)
                 delivery_ids = await notification_service.send_fraud_alert(
                     transaction, evaluation_result, correlation_id
@@ -649,12 +1073,6 @@ async def _send_notifications(
                     delivery_count=len(delivery_ids),
                     correlation_id=correlation_id,
                 )
-        except ImportError:
-            logger.warning("Notifications module not available, using fallback")
-            # Fallback to console output
-            _print_fraud_alert(
-                transaction_id or "unknown", triggered_rules, risk_level or "low"
-            )
         except Exception as e:
             logger.error(
                 f"Notification service error: {e}",
@@ -701,85 +1119,11 @@ def _print_fraud_alert(
     print("=" * 80 + "\n")
 
 
-async def _save_rule_executions_to_redis(
-    correlation_id: str,
-    transaction_id: UUID,
-    evaluation_result: Dict[str, Any],
-) -> None:
-    """
-    Save rule execution results to Redis for later persistence to PostgreSQL.
-
-    This allows fast async storage, with a separate Celery worker
-    handling the actual database writes.
-
-    Args:
-        correlation_id: Transaction correlation ID
-        transaction_id: Transaction UUID
-        evaluation_result: Complete evaluation results
-    """
-    try:
-        redis_gen = get_async_redis_dependency()
-        redis_client = await anext(redis_gen)
-
-        # Prepare rule execution data
-        triggered_rules = evaluation_result.get("triggered_rules", [])
-
-        if not triggered_rules:
-            logger.debug(
-                f"No rule executions to save for transaction {transaction_id}",
-                transaction_id=str(transaction_id),
-                correlation_id=correlation_id,
-            )
-            return
-
-        # Store each rule execution in Redis
-        redis_key = f"rule_executions:{correlation_id}"
-        execution_data = {
-            "transaction_id": str(transaction_id),
-            "correlation_id": correlation_id,
-            "triggered_rules": triggered_rules,
-            "total_rules_evaluated": evaluation_result.get("total_rules_evaluated", 0),
-            "saved_at": time(),
-        }
-
-        # Store with 1 hour TTL
-        await redis_client.setex(
-            redis_key,
-            3600,  # 1 hour
-            json.dumps(execution_data),
-        )
-
-        logger.info(
-            f"Saved {len(triggered_rules)} rule executions to Redis",
-            event="rule_executions_saved_to_redis",
-            transaction_id=str(transaction_id),
-            correlation_id=correlation_id,
-            redis_key=redis_key,
-            matched_rules_count=len(triggered_rules),
-        )
-
-        # TODO: Trigger Celery task to persist to PostgreSQL
-        # celery_app.send_task(
-        #     "queue.save_rule_executions_to_db",
-        #     args=[correlation_id],
-        #     queue="rule_executions",
-        # )
-
-    except Exception as e:
-        logger.error(
-            f"Failed to save rule executions to Redis: {e}",
-            event="rule_executions_save_error",
-            transaction_id=str(transaction_id),
-            correlation_id=correlation_id,
-            error=str(e),
-        )
-        # Don't raise - this is not critical for transaction processing
-
-
 async def _mark_task_failed(
     queue_task_id: UUID,
     error_type: ErrorType,
     error_message: str,
+    error_traceback: str,
     retry: bool = False,
 ) -> None:
     """
@@ -789,6 +1133,7 @@ async def _mark_task_failed(
         queue_task_id: Queue task UUID
         error_type: Type of error
         error_message: Error message
+        error_traceback: Traceback formatted by the caller's except block
         retry: Whether task will be retried
     """
     async with AsyncSessionLocal() as session:
@@ -797,11 +1142,24 @@ async def _mark_task_failed(
             task_id=queue_task_id,
             error_type=error_type,
             error_message=error_message,
-            error_traceback=traceback.format_exc(),
+            error_traceback=error_traceback,
             retry=retry,
         )
 
 
+_ERROR_TYPES: Mapping[type, ErrorType] = MappingProxyType(
+    {
+        ValidationError: ErrorType.VALIDATION_ERROR,
+        PydanticValidationError: ErrorType.VALIDATION_ERROR,
+        DatabaseError: ErrorType.DATABASE_ERROR,
+        SQLAlchemyDatabaseError: ErrorType.DATABASE_ERROR,
+        RuleEvaluationError: ErrorType.RULE_ENGINE_ERROR,
+        NotificationError: ErrorType.NOTIFICATION_ERROR,
+        TimeoutError: ErrorType.TIMEOUT_ERROR,
+    }
+)
+
+
 def _map_exception_to_error_type(exc: Exception) -> ErrorType:
     """
     Map Python exception to ErrorType enum.
@@ -812,17 +1170,13 @@ def _map_exception_to_error_type(exc: Exception) -> ErrorType:
     Returns:
         Corresponding ErrorType
     """
-    exc_name = type(exc).__name__
-
-    mapping = {
-        "ValidationError": ErrorType.VALIDATION_ERROR,
-        "DatabaseError": ErrorType.DATABASE_ERROR,
-        "RuleEvaluationError": ErrorType.RULE_ENGINE_ERROR,
-        "NotificationError": ErrorType.NOTIFICATION_ERROR,
-        "TimeoutError": ErrorType.TIMEOUT_ERROR,
-    }
+    # Walk the MRO so subclasses map like their base class
+    for cls in type(exc).__mro__:
+        error_type = _ERROR_TYPES.get(cls)
+        if error_type is not None:
+            return error_type
 
-    return mapping.get(exc_name, ErrorType.UNKNOWN_ERROR)
+    return ErrorType.UNKNOWN_ERROR
 
 
 @celery_app.task(name="queue.cleanup_old_tasks")
@@ -851,212 +1205,57 @@ def cleanup_old_tasks() -> Dict[str, Any]:
     }
 
 
-@celery_app.task(
-    bind=True,
-    name="queue.save_rule_executions_to_db",
-    queue="rule_executions",
-    max_retries=3,
-)
-def save_rule_executions_to_db(
-    self,
-    correlation_id: str,
-) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def _rule_uuid(rule_id: str) -> UUID:
     """
-    Save rule execution results from Redis to PostgreSQL (SYNC VERSION).
-
-    This task runs asynchronously after transaction processing to persist
-    rule evaluation results for analytics and compliance.
-
-    Uses synchronous Redis and SQLAlchemy to avoid event loop conflicts.
-
-    Args:
-        correlation_id: Transaction correlation ID used as Redis key
-
-    Returns:
-        Dict with save statistics
+    Parse a rule ID.
 
-    Raises:
-        Retry: If save fails and retries available
+    The same few rules trigger across most transactions, so each ID string
+    is parsed and validated once per process rather than once per row.
     """
-    logger.info(
-        f"Starting rule executions persistence for correlation_id={correlation_id}",
-        event="save_rule_executions_start",
-        correlation_id=correlation_id,
-    )
-
-    try:
-        # Use synchronous implementation
-        result = _save_rule_executions_to_db_sync(correlation_id)
-
-        logger.info(
-            f"Rule executions saved successfully: {result['saved_count']} records",
-            event="save_rule_executions_complete",
-            correlation_id=correlation_id,
-            saved_count=result["saved_count"],
-        )
-
-        return result
+    return UUID(rule_id)
 
-    except Exception as exc:
-        logger.error(
-            f"Failed to save rule executions: {exc}",
-            event="save_rule_executions_error",
-            correlation_id=correlation_id,
-            error=str(exc),
-        )
 
-        # Retry if possible
-        if self.request.retries < self.max_retries:
-            raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
-        else:
-            raise
+def _rule_execution_context(rule_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Context stored with a rule execution."""
+    return {
+        "rule_name": rule_result.get("rule_name"),
+        "rule_type": rule_result.get("rule_type"),
+        "match_reason": rule_result.get("match_reason"),
+        "risk_level": rule_result.get("risk_level"),
+    }
 
 
-def _save_rule_executions_to_db_sync(
-    correlation_id: str,
-) -> Dict[str, Any]:
+def _rule_execution_values(
+    correlation_id: str, triggered_rules: List[Dict[str, Any]], executed_at: datetime
+) -> List[Dict[str, Any]]:
     """
-    Synchronous implementation of saving rule executions from Redis to PostgreSQL.
-
-    Args:
-        correlation_id: Transaction correlation ID
-
-    Returns:
-        Dict with save results
+    Build rule_executions rows for TransactionRepository, keyed by
+    RULE_EXECUTION_COLUMNS.
     """
-    from src.config import settings
-    from src.storage.models import RuleExecution
-
-    # Get sync Redis client
-    redis_client = SyncRedis(
-        host=settings.redis.REDIS_HOST,
-        port=settings.redis.REDIS_PORT,
-        db=settings.redis.REDIS_DB,
-        password=settings.redis.REDIS_PASSWORD
-        if settings.redis.REDIS_PASSWORD
-        else None,
-        decode_responses=True,
-    )
-
-    # Read execution data from Redis
-    redis_key = f"rule_executions:{correlation_id}"
+    rows = []
 
-    try:
-        cached_data = redis_client.get(redis_key)
-
-        if not cached_data:
-            logger.warning(
-                f"No rule execution data found in Redis for {correlation_id}",
-                event="no_redis_data",
-                correlation_id=correlation_id,
-                redis_key=redis_key,
+    for rule_result in triggered_rules:
+        try:
+            rows.append(
+                {
+                    "id": uuid4(),
+                    "rule_id": _rule_uuid(rule_result["rule_id"]),
+                    "correlation_id": correlation_id,
+                    "matched": bool(rule_result.get("matched", False)),
+                    "confidence_score": rule_result.get("confidence_score", 0.0),
+                    "execution_time_ms": rule_result.get("execution_time_ms", 0.0),
+                    "context": _rule_execution_context(rule_result),
+                    "error_message": rule_result.get("error_message"),
+                    "executed_at": executed_at,
+                }
             )
-            redis_client.close()
-            return {
-                "saved_count": 0,
-                "status": "no_data",
-                "correlation_id": correlation_id,
-            }
-
-        execution_data = json.loads(cached_data)
-        transaction_id = UUID(execution_data["transaction_id"])
-        triggered_rules = execution_data.get("triggered_rules", [])
-
-        if not triggered_rules:
-            logger.debug(f"No triggered rules to save for {correlation_id}")
-            # Delete from Redis since there's nothing to save
-            redis_client.delete(redis_key)
-            redis_client.close()
-            return {
-                "saved_count": 0,
-                "status": "no_rules",
-                "correlation_id": correlation_id,
-            }
-
-        # Get sync database session
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-
-        # Build sync database URL
-        db_url = (
-            f"postgresql://{settings.database.POSTGRES_USER}:"
-            f"{settings.database.POSTGRES_PASSWORD}@"
-            f"{settings.database.POSTGRES_HOST}:"
-            f"{settings.database.POSTGRES_PORT}/"
-            f"{settings.database.POSTGRES_DB}"
-        )
-
-        # Create sync engine and session
-        sync_engine = create_engine(db_url, pool_pre_ping=True)
-        SyncSessionLocal = sessionmaker(bind=sync_engine, expire_on_commit=False)
-
-        # Save to PostgreSQL
-        with SyncSessionLocal() as session:
-            saved_count = 0
-
-            for rule_result in triggered_rules:
-                try:
-                    rule_execution = RuleExecution(
-                        rule_id=UUID(rule_result["rule_id"]),
-                        transaction_id=transaction_id,
-                        correlation_id=correlation_id,
-                        matched=rule_result.get("matched", False),
-                        confidence_score=rule_result.get("confidence_score", 0.0),
-                        execution_time_ms=rule_result.get("execution_time_ms", 0.0),
-                        context={
-                            "rule_name": rule_result.get("rule_name"),
-                            "rule_type": rule_result.get("rule_type"),
-                            "match_reason": rule_result.get("match_reason"),
-                            "risk_level": rule_result.get("risk_level"),
-                        },
-                        error_message=rule_result.get("error_message"),
-                    )
-
-                    session.add(rule_execution)
-                    saved_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Error creating RuleExecution for rule {rule_result.get('rule_id')}: {e}",
-                        correlation_id=correlation_id,
-                    )
-                    continue
-
-            # Commit all executions
-            session.commit()
-
-            logger.info(
-                f"Saved {saved_count} rule executions to database",
-                event="rule_executions_persisted",
+        except Exception as e:
+            logger.error(
+                f"Error creating RuleExecution for rule "
+                f"{rule_result.get('rule_id')}: {e}",
                 correlation_id=correlation_id,
-                saved_count=saved_count,
             )
+            continue
 
-        # Delete from Redis after successful save
-        redis_client.delete(redis_key)
-        redis_client.close()
-
-        logger.debug(
-            f"Deleted rule executions from Redis: {redis_key}",
-            redis_key=redis_key,
-        )
-
-        # Dispose engine after use
-        sync_engine.dispose()
-
-        return {
-            "saved_count": saved_count,
-            "status": "success",
-            "correlation_id": correlation_id,
-        }
-
-    except Exception as e:
-        logger.error(
-            f"Error in _save_rule_executions_to_db_sync: {e}",
-            event="save_error",
-            correlation_id=correlation_id,
-            error=str(e),
-            traceback=traceback.format_exc(),
-        )
-        redis_client.close()
-        raise
+    return rows
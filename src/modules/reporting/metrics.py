@@ -5,7 +5,26 @@ Provides counters, gauges, and histograms for tracking system performance,
 queue statistics, and processing metrics.
 """
 
+from functools import lru_cache
+from typing import Callable, Optional
+
 from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.metrics import MetricWrapperBase
+
+
+def _child_cache(
+    metric: MetricWrapperBase, maxsize: Optional[int] = None
+) -> Callable[..., MetricWrapperBase]:
+    """
+    Memoize metric.labels() by label values (positional, in labelnames order).
+
+    labels() takes the metric's lock and builds a key tuple on every call;
+    the cached child is the same object it would return. Label values are
+    small bounded sets (statuses, error types, rule types, channels); caches
+    keyed by rule_id get a maxsize.
+    """
+    return lru_cache(maxsize=maxsize)(metric.labels)
+
 
 # Task processing counters
 tasks_total = Counter(
@@ -86,6 +105,12 @@ errors_total = Counter(
 )
 
 
+_tasks_total_child = _child_cache(tasks_total)
+_tasks_failed_child = _child_cache(tasks_failed)
+_queue_length_child = _child_cache(queue_length)
+_errors_total_child = _child_cache(errors_total)
+
+
 # Helper functions for metrics collection
 def increment_task_counter(status: str) -> None:
     """
@@ -94,7 +119,7 @@ def increment_task_counter(status: str) -> None:
     Args:
         status: Task status (pending, processing, completed, failed, retry)
     """
-    tasks_total.labels(status=status).inc()
+    _tasks_total_child(status).inc()
 
 
 def increment_submitted_counter() -> None:
@@ -114,7 +139,7 @@ def increment_failed_counter(error_type: str) -> None:
     Args:
         error_type: Type of error that caused failure
     """
-    tasks_failed.labels(error_type=error_type).inc()
+    _tasks_failed_child(error_type).inc()
 
 
 def increment_retry_counter() -> None:
@@ -170,7 +195,7 @@ def set_queue_length(queue_name: str, length: int) -> None:
         queue_name: Name of the queue
         length: Current number of pending tasks
     """
-    queue_length.labels(queue_name=queue_name).set(length)
+    _queue_length_child(queue_name).set(length)
 
 
 def set_processing_count(count: int) -> None:
@@ -200,7 +225,7 @@ def increment_error_counter(error_type: str) -> None:
     Args:
         error_type: Type of error encountered
     """
-    errors_total.labels(error_type=error_type).inc()
+    _errors_total_child(error_type).inc()
 
 
 # Transaction counters by status
@@ -267,6 +292,14 @@ transaction_review_duration = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0),  # seconds
 )
 
+_transactions_total_child = _child_cache(transactions_total)
+_transactions_by_type_child = _child_cache(transactions_by_type)
+_rules_evaluated_child = _child_cache(rules_evaluated_total)
+_rules_matched_child = _child_cache(rules_matched_total, maxsize=4096)
+_rule_execution_duration_child = _child_cache(rule_execution_duration)
+_rule_match_rate_child = _child_cache(rule_match_rate, maxsize=4096)
+_transaction_reviews_child = _child_cache(transaction_reviews_total)
+
 
 def increment_transaction_counter(status: str) -> None:
     """
@@ -275,7 +308,7 @@ def increment_transaction_counter(status: str) -> None:
     Args:
         status: Transaction status (pending, processed, alerted, reviewed, rejected)
     """
-    transactions_total.labels(status=status).inc()
+    _transactions_total_child(status).inc()
 
 
 def increment_transaction_by_type_counter(transaction_type: str) -> None:
@@ -285,7 +318,7 @@ def increment_transaction_by_type_counter(transaction_type: str) -> None:
     Args:
         transaction_type: Type of transaction (transfer, payment, withdrawal, deposit)
     """
-    transactions_by_type.labels(type=transaction_type).inc()
+    _transactions_by_type_child(transaction_type).inc()
 
 
 def observe_transaction_processing_time(duration_seconds: float) -> None:
@@ -305,7 +338,7 @@ def increment_rule_evaluated_counter(rule_type: str) -> None:
     Args:
         rule_type: Type of rule (threshold, pattern, composite, ml)
     """
-    rules_evaluated_total.labels(rule_type=rule_type).inc()
+    _rules_evaluated_child(rule_type).inc()
 
 
 def increment_rule_matched_counter(rule_type: str, rule_id: str) -> None:
@@ -316,7 +349,7 @@ def increment_rule_matched_counter(rule_type: str, rule_id: str) -> None:
         rule_type: Type of rule (threshold, pattern, composite, ml)
         rule_id: Unique identifier of the rule
     """
-    rules_matched_total.labels(rule_type=rule_type, rule_id=rule_id).inc()
+    _rules_matched_child(rule_type, rule_id).inc()
 
 
 def observe_rule_execution_time(rule_type: str, duration_seconds: float) -> None:
@@ -327,7 +360,7 @@ def observe_rule_execution_time(rule_type: str, duration_seconds: float) -> None
         rule_type: Type of rule (threshold, pattern, composite, ml)
         duration_seconds: Rule execution duration in seconds
     """
-    rule_execution_duration.labels(rule_type=rule_type).observe(duration_seconds)
+    _rule_execution_duration_child(rule_type).observe(duration_seconds)
 
 
 def update_rule_match_rate(rule_id: str, rule_type: str, match_rate: float) -> None:
@@ -339,7 +372,7 @@ def update_rule_match_rate(rule_id: str, rule_type: str, match_rate: float) -> N
         rule_type: Type of rule (threshold, pattern, composite, ml)
         match_rate: Match rate as a float (0.0 to 1.0)
     """
-    rule_match_rate.labels(rule_id=rule_id, rule_type=rule_type).set(match_rate)
+    _rule_match_rate_child(rule_id, rule_type).set(match_rate)
 
 
 def increment_transaction_review_counter(status: str, success: bool) -> None:
@@ -350,7 +383,7 @@ def increment_transaction_review_counter(status: str, success: bool) -> None:
         status: Review status (accepted or rejected)
         success: Whether the review operation was successful
     """
-    transaction_reviews_total.labels(status=status, success=str(success).lower()).inc()
+    _transaction_reviews_child(status, "true" if success else "false").inc()
 
 
 def observe_transaction_review_duration(duration_seconds: float) -> None:
@@ -397,6 +430,12 @@ notifications_pending = Gauge(
     ["channel"],
 )
 
+_notifications_sent_child = _child_cache(notifications_sent_total)
+_notifications_delivered_child = _child_cache(notifications_delivered_total)
+_notifications_failed_child = _child_cache(notifications_failed_total)
+_notification_delivery_duration_child = _child_cache(notification_delivery_duration)
+_notifications_pending_child = _child_cache(notifications_pending)
+
 
 def increment_notification_sent_counter(channel: str, status: str) -> None:
     """
@@ -406,7 +445,7 @@ def increment_notification_sent_counter(channel: str, status: str) -> None:
         channel: Notification channel (telegram, email, sms)
         status: Delivery status (sent, failed)
     """
-    notifications_sent_total.labels(channel=channel, status=status).inc()
+    _notifications_sent_child(channel, status).inc()
 
 
 def increment_notification_delivered_counter(channel: str) -> None:
@@ -416,7 +455,7 @@ def increment_notification_delivered_counter(channel: str) -> None:
     Args:
         channel: Notification channel (telegram, email, sms)
     """
-    notifications_delivered_total.labels(channel=channel).inc()
+    _notifications_delivered_child(channel).inc()
 
 
 def increment_notification_failed_counter(channel: str, error_type: str) -> None:
@@ -427,7 +466,7 @@ def increment_notification_failed_counter(channel: str, error_type: str) -> None
         channel: Notification channel (telegram, email, sms)
         error_type: Type of error that caused failure
     """
-    notifications_failed_total.labels(channel=channel, error_type=error_type).inc()
+    _notifications_failed_child(channel, error_type).inc()
 
 
 def observe_notification_delivery_time(channel: str, duration_seconds: float) -> None:
@@ -438,7 +477,7 @@ def observe_notification_delivery_time(channel: str, duration_seconds: float) ->
         channel: Notification channel (telegram, email, sms)
         duration_seconds: Delivery duration in seconds
     """
-    notification_delivery_duration.labels(channel=channel).observe(duration_seconds)
+    _notification_delivery_duration_child(channel).observe(duration_seconds)
 
 
 def set_notifications_pending(channel: str, count: int) -> None:
@@ -449,4 +488,4 @@ def set_notifications_pending(channel: str, count: int) -> None:
         channel: Notification channel (telegram, email, sms)
         count: Number of pending notifications
     """
-    notifications_pending.labels(channel=channel).set(count)
+    _notifications_pending_child(channel).set(count)
@@ -27,6 +27,7 @@ from .schemas import (
     RuleCreateRequest,
     RuleUpdateRequest,
 )
+from .service import RULES_INVALIDATE_CHANNEL
 
 logger = get_logger("rule_engine.repository")
 
@@ -611,6 +612,8 @@ class RuleRepository:
             # Update rule index (sorted set by priority)
             await self.async_redis.zadd(RULE_INDEX_KEY, {str(rule.id): rule.priority})
 
+            await self.async_redis.publish(RULES_INVALIDATE_CHANNEL, str(rule.id))
+
             logger.debug(
                 "Rule added to cache",
                 rule_id=rule.id,
@@ -659,6 +662,8 @@ class RuleRepository:
             # Remove from rule index
             await self.async_redis.zrem(RULE_INDEX_KEY, str(rule_id))
 
+            await self.async_redis.publish(RULES_INVALIDATE_CHANNEL, str(rule_id))
+
             logger.debug(
                 "Rule removed from cache",
                 rule_id=str(rule_id),
@@ -756,6 +761,8 @@ class RuleRepository:
                 type_key = f"{RULE_TYPE_KEY_PREFIX}{rule_type}"
                 await self.async_redis.delete(type_key)
 
+            await self.async_redis.publish(RULES_INVALIDATE_CHANNEL, "*")
+
             logger.info(
                 "Cache cleared successfully",
                 rules_removed=deleted,
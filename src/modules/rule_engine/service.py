@@ -12,6 +12,8 @@ from uuid import UUID
 
 from loguru import logger
 from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from src.modules.reporting.metrics import (
     increment_rule_evaluated_counter,
@@ -30,6 +32,8 @@ from .schemas import ThresholdRuleParams
 # Redis key patterns
 RULE_CACHE_KEY_PREFIX = "rule:"
 ACTIVE_RULES_KEY = "active_rules:all"
+# Pub/sub channel announcing rule cache changes (workers drop local copies)
+RULES_INVALIDATE_CHANNEL = "rules:invalidate"
 
 
 class RuleEvaluationResult:
@@ -129,6 +133,10 @@ async def get_cached_active_rules(redis_client: Redis) -> List[Dict[str, Any]]:
 
     Returns:
         List of rule dictionaries from cache
+
+    Raises:
+        RedisConnectionError: If Redis is unreachable
+        RedisTimeoutError: If a Redis command times out
     """
     try:
         # Get all active rule IDs from SET
@@ -163,6 +171,8 @@ async def get_cached_active_rules(redis_client: Redis) -> List[Dict[str, Any]]:
                         rule_id=rule_id,
                         event="cache_inconsistency",
                     )
+            except (RedisConnectionError, RedisTimeoutError):
+                raise
             except Exception as e:
                 logger.error(
                     f"Failed to load rule from cache: {e}",
@@ -180,6 +190,10 @@ async def get_cached_active_rules(redis_client: Redis) -> List[Dict[str, Any]]:
 
         return rules_list
 
+    except (RedisConnectionError, RedisTimeoutError):
+        # An unreachable Redis is not an empty cache; the caller decides
+        raise
+
     except Exception as e:
         logger.error(
             f"Failed to get cached rules: {e}",
@@ -5,18 +5,106 @@ Provides async database access for creating, updating, and querying
 transactions in PostgreSQL.
 """
 
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    Text,
+    bindparam,
+    cast,
+    column,
+    func,
+    insert,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError, InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import DatabaseError
 from src.modules.rule_engine.enums import TransactionStatus, TransactionType
-from src.storage.models import Transaction
+from src.storage.models import RuleExecution, Transaction
+
+# Connection-level failures, re-raised unwrapped so the queue task's
+# autoretry (which checks the raised type only) retries them
+_TRANSIENT_ERRORS = (OperationalError, InterfaceError, ConnectionError, TimeoutError)
+
+# rule_executions columns supplied by callers; transaction_id comes from the
+# updated transaction row
+RULE_EXECUTION_COLUMNS = (
+    "id",
+    "rule_id",
+    "correlation_id",
+    "matched",
+    "confidence_score",
+    "execution_time_ms",
+    "context",
+    "error_message",
+    "executed_at",
+)
+
+
+def _build_update_status_and_insert_executions():
+    """
+    Build the combined status UPDATE / rule_executions INSERT statement.
+
+    Rows are passed as one array parameter per column and expanded with
+    unnest, so the SQL text is the same for any batch size: asyncpg reuses a
+    single prepared statement and the bind count stays at one per column.
+    JSON context travels as text[] and is cast back to the column type.
+    """
+    table = RuleExecution.__table__  # type: ignore
+    status_type = Transaction.__table__.c.status.type  # type: ignore
+    updated = (
+        update(Transaction)
+        .where(Transaction.id == bindparam("transaction_id"))  # type: ignore
+        .values(
+            status=bindparam("new_status", type_=status_type),
+            updated_at=bindparam("updated_at"),
+        )
+        .returning(Transaction.id)  # type: ignore
+        .cte("updated")
+    )
+
+    column_types = {
+        name: Text() if name == "context" else table.c[name].type
+        for name in RULE_EXECUTION_COLUMNS
+    }
+    executions = func.unnest(
+        *(
+            cast(bindparam(name), ARRAY(column_types[name]))
+            for name in RULE_EXECUTION_COLUMNS
+        )
+    ).table_valued(
+        *(column(name, column_types[name]) for name in RULE_EXECUTION_COLUMNS),
+        name="executions",
+    )
+    selected = [
+        cast(executions.c[name], table.c[name].type)
+        if name == "context"
+        else executions.c[name]
+        for name in RULE_EXECUTION_COLUMNS
+    ]
+
+    return (
+        insert(RuleExecution)
+        .from_select(
+            ["transaction_id", *RULE_EXECUTION_COLUMNS],
+            select(updated.c.id, *selected).select_from(
+                updated.join(executions, true())
+            ),
+        )
+        .add_cte(updated)
+        .returning(RuleExecution.id)  # type: ignore
+    )
+
+
+_UPDATE_STATUS_AND_INSERT_EXECUTIONS = _build_update_status_and_insert_executions()
 
 
 class TransactionRepository:
@@ -145,13 +233,15 @@ class TransactionRepository:
 
             return transaction
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error fetching transaction by ID: {e}")
             raise DatabaseError(
                 "Failed to fetch transaction",
                 operation="get_by_id",
                 details={"transaction_id": str(transaction_id), "error": str(e)},
-            )
+            ) from e
 
     async def get_by_correlation_id(self, correlation_id: str) -> Optional[Transaction]:
         """
@@ -188,7 +278,7 @@ class TransactionRepository:
             )
 
     async def update_status(
-        self, transaction_id: UUID, status: TransactionStatus
+        self, transaction_id: UUID, status: TransactionStatus, commit: bool = True
     ) -> Transaction:
         """
         Update transaction status.
@@ -196,6 +286,8 @@ class TransactionRepository:
         Args:
             transaction_id: Transaction UUID
             status: New transaction status
+            commit: Commit now; pass False to only flush, leaving the commit
+                to a later write in the same session
 
         Returns:
             Updated Transaction instance
@@ -216,8 +308,11 @@ class TransactionRepository:
             transaction.status = status
             transaction.updated_at = datetime.utcnow()
 
-            await self.session.commit()
-            await self.session.refresh(transaction)
+            if commit:
+                await self.session.commit()
+                await self.session.refresh(transaction)
+            else:
+                await self.session.flush()
 
             logger.info(
                 f"Updated transaction status: id={transaction_id}, status={status}"
@@ -227,6 +322,9 @@ class TransactionRepository:
 
         except DatabaseError:
             raise
+        except _TRANSIENT_ERRORS:
+            await self.session.rollback()
+            raise
         except Exception as e:
             await self.session.rollback()
             logger.error(f"Error updating transaction status: {e}")
@@ -234,8 +332,88 @@ class TransactionRepository:
                 "Failed to update transaction status",
                 operation="update_status",
                 details={"transaction_id": str(transaction_id), "error": str(e)},
+            ) from e
+
+    async def update_status_and_persist_executions(
+        self,
+        transaction_id: UUID,
+        status: TransactionStatus,
+        rule_executions: List[Dict[str, Any]],
+        commit: bool = True,
+    ) -> int:
+        """
+        Update transaction status and insert its rule executions together.
+
+        The UPDATE runs in a data-modifying CTE whose RETURNING id feeds an
+        INSERT ... SELECT over the unnested column arrays, so both writes take
+        a single round-trip and commit.
+
+        Args:
+            transaction_id: Transaction UUID
+            status: New transaction status
+            rule_executions: Rows keyed by RULE_EXECUTION_COLUMNS
+            commit: Commit now; pass False to leave the commit to a later
+                write in the same session
+
+        Returns:
+            Number of rule executions inserted
+
+        Raises:
+            DatabaseError: If transaction not found or update fails
+        """
+        if not rule_executions:
+            await self.update_status(transaction_id, status, commit=commit)
+            return 0
+
+        try:
+            params: Dict[str, Any] = {
+                name: [row[name] for row in rule_executions]
+                for name in RULE_EXECUTION_COLUMNS
+            }
+            params["context"] = [json.dumps(context) for context in params["context"]]
+            params.update(
+                transaction_id=transaction_id,
+                new_status=status,
+                updated_at=datetime.utcnow(),
+            )
+
+            result = await self.session.execute(
+                _UPDATE_STATUS_AND_INSERT_EXECUTIONS, params
+            )
+            inserted = len(result.all())
+            if not inserted:
+                # The CTE updated nothing, so no execution rows were joined
+                await self.session.rollback()
+                raise DatabaseError(
+                    "Transaction not found",
+                    operation="update_status_and_persist_executions",
+                    details={"transaction_id": str(transaction_id)},
+                )
+
+            if commit:
+                await self.session.commit()
+
+            logger.info(
+                f"Updated transaction status: id={transaction_id}, status={status}, "
+                f"rule_executions={inserted}"
             )
 
+            return inserted
+
+        except DatabaseError:
+            raise
+        except _TRANSIENT_ERRORS:
+            await self.session.rollback()
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error updating transaction status: {e}")
+            raise DatabaseError(
+                "Failed to update transaction status",
+                operation="update_status_and_persist_executions",
+                details={"transaction_id": str(transaction_id), "error": str(e)},
+            ) from e
+
     async def get_all_transactions(
         self,
         limit: Optional[int] = None,
@@ -9,8 +9,9 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import BigInteger, Column, Index, text
+from sqlalchemy import BigInteger, Column, Index, SmallInteger, text
 from sqlalchemy.dialects.postgresql import JSON as PGJSON
+from sqlalchemy.dialects.postgresql import JSONB as PGJSONB
 from sqlmodel import Field, SQLModel, String
 
 from src.storage.enums import (
@@ -351,7 +352,7 @@ class QueueTask(SQLModel, table=True):
     # Additional metadata
     task_metadata: Dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(PGJSON),
+        sa_column=Column(PGJSONB),
         description="Additional flexible metadata",
     )
 
@@ -385,10 +386,60 @@ class QueueTask(SQLModel, table=True):
 
     # Define composite indexes for common queries
     __table_args__ = (
+        # Serves get_tasks_by_status (status filter, newest first); lookups by
+        # correlation_id / celery_task_id / transaction_id use the index=True
+        # column indexes
         Index("idx_queue_status_created", "status", "created_at"),
-        Index("idx_queue_correlation", "correlation_id"),
-        Index("idx_queue_celery_task", "celery_task_id"),
-        Index("idx_queue_transaction", "transaction_id"),
+        # Covering index for completed-task timing metrics
+        Index(
+            "idx_queue_completed_timings",
+            "processing_time_ms",
+            postgresql_include=["rule_engine_time_ms"],
+            postgresql_where=text("status = 'COMPLETED'"),
+        ),
+        # Partial indexes: only in-flight tasks / finished tasks, so they stay
+        # small as completed history accumulates
+        Index(
+            "idx_queue_pending_created",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')"),
+        ),
+        Index(
+            "idx_queue_completed_at",
+            "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL"),
+        ),
+        Index(
+            "idx_queue_metadata_gin",
+            "task_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"task_metadata": "jsonb_path_ops"},
+        ),
+    )
+
+
+class QueueTaskCounter(SQLModel, table=True):
+    """
+    Running queue_tasks aggregates, maintained by database triggers.
+
+    Counters per task status (named after the status) holding the number of
+    tasks in it, plus "retries" with the sum of retry_count. Each counter is
+    striped over slots, one per group of database backends, so concurrent
+    writers rarely update the same row; its value is the sum of its slots.
+    Lets metrics read a few dozen rows instead of scanning queue_tasks.
+    """
+
+    __tablename__ = "queue_task_counters"  # type: ignore
+
+    name: str = Field(primary_key=True, description="Status name or 'retries'")
+    slot: int = Field(
+        sa_column=Column(SmallInteger, primary_key=True),
+        description="Stripe written by a group of database backends",
+    )
+    value: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("0")),
+        description="Current counter value",
     )
 
 
@@ -9,6 +9,7 @@ from .client import (
     SyncRedisClient,
     close_redis_connections,
     get_async_redis,
+    get_async_redis_client,
     get_async_redis_dependency,
     get_sync_redis,
     get_sync_redis_dependency,
@@ -16,6 +17,7 @@ from .client import (
 
 __all__ = [
     "get_async_redis",
+    "get_async_redis_client",
     "get_sync_redis",
     "get_async_redis_dependency",
     "get_sync_redis_dependency",
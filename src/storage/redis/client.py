@@ -7,6 +7,7 @@ Celery queue operations in the fraud detection system.
 
 from typing import Annotated, AsyncGenerator, Generator
 
+from redis import BlockingConnectionPool
 from redis import Redis as SyncRedis
 from redis.asyncio import ConnectionPool as AsyncConnectionPool
 from redis.asyncio import Redis as AsyncRedis
@@ -161,10 +162,37 @@ async def get_async_redis() -> AsyncConnectionPool:
     return _async_redis_pool
 
 
+async def get_async_redis_client() -> AsyncRedis:
+    """
+    Get the shared async Redis client bound to the connection pool.
+
+    Celery workers use this instead of driving get_async_redis_dependency per
+    call, so one long-lived client serves every task of the process.
+
+    Returns:
+        AsyncRedis: Async Redis client
+
+    Raises:
+        DatabaseError: If connection to Redis fails
+        ConfigurationError: If Redis configuration is invalid
+    """
+    global _async_redis_client
+
+    if _async_redis_client is None:
+        pool = await get_async_redis()
+        _async_redis_client = AsyncRedis(connection_pool=pool)
+
+    return _async_redis_client
+
+
 def get_sync_redis() -> SyncRedis:
     """
     Get or create sync Redis client for Celery workers.
 
+    The client is shared by every task of the process and draws connections
+    from a bounded pool. redis-py resets the pool after fork, so prefork
+    children do not reuse the parent's sockets.
+
     Returns:
         SyncRedis: Synchronous Redis client
 
@@ -186,12 +214,19 @@ def get_sync_redis() -> SyncRedis:
                 url=redis_url.split("@")[-1] if "@" in redis_url else redis_url,
             )
 
-            _sync_redis_client = SyncRedis.from_url(
+            from src.config import settings
+
+            # Bounded: once every connection is checked out, callers wait up
+            # to REDIS_POOL_TIMEOUT instead of opening more connections
+            pool = BlockingConnectionPool.from_url(
                 url=redis_url,
+                max_connections=settings.redis.REDIS_POOL_SIZE,
+                timeout=settings.redis.REDIS_POOL_TIMEOUT,
                 decode_responses=True,
                 retry_on_timeout=True,
                 retry_on_error=[RedisConnectionError, TimeoutError],
             )
+            _sync_redis_client = SyncRedis(connection_pool=pool)
 
             # Test the connection
             try:
@@ -8,9 +8,11 @@ pattern analysis like structuring detection, recipient patterns, and device-base
 
 import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from src.core.logging import get_logger
 from src.modules.rule_engine.enums import TimeWindow
@@ -75,6 +77,19 @@ def get_window_duration_seconds(time_window: TimeWindow) -> int:
     return duration_mapping.get(time_window, 3600)
 
 
+def _build_pattern_record(transaction_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored pattern record, with timestamp for time-based filtering."""
+    return {
+        "id": str(transaction_data.get("id")),
+        "amount": float(transaction_data.get("amount", 0)),
+        "to_account": transaction_data.get("to_account", ""),
+        "device_id": transaction_data.get("device_id"),
+        "timestamp": transaction_data.get("timestamp", datetime.utcnow().isoformat()),
+        "type": transaction_data.get("type", ""),
+        "location": transaction_data.get("location"),
+    }
+
+
 async def store_transaction_for_pattern(
     redis: Redis,
     account_id: str,
@@ -109,17 +124,7 @@ async def store_transaction_for_pattern(
         )
 
         # Prepare transaction record with timestamp for filtering
-        txn_record = {
-            "id": str(transaction_data.get("id")),
-            "amount": float(transaction_data.get("amount", 0)),
-            "to_account": transaction_data.get("to_account", ""),
-            "device_id": transaction_data.get("device_id"),
-            "timestamp": transaction_data.get(
-                "timestamp", datetime.utcnow().isoformat()
-            ),
-            "type": transaction_data.get("type", ""),
-            "location": transaction_data.get("location"),
-        }
+        txn_record = _build_pattern_record(transaction_data)
 
         # Store as JSON in list
         await redis.lpush(key, json.dumps(txn_record))
@@ -146,6 +151,63 @@ async def store_transaction_for_pattern(
         # Don't raise - pattern storage failure shouldn't block transaction processing
 
 
+async def store_transaction_for_pattern_windows(
+    redis: Redis,
+    account_id: str,
+    transaction_data: Dict[str, Any],
+    time_windows: Sequence[TimeWindow],
+) -> None:
+    """
+    Store transaction data for several time windows in one round-trip.
+
+    Same records as store_transaction_for_pattern, but the LPUSH/EXPIRE pairs
+    for all windows are sent in a single non-transactional pipeline; the
+    writes are independent, so MULTI/EXEC atomicity is not needed.
+
+    Args:
+        redis: Async Redis client
+        account_id: Account ID (from_account)
+        transaction_data: Complete transaction data dict
+        time_windows: Time windows for pattern detection
+
+    Raises:
+        RedisConnectionError: If Redis is unreachable
+        RedisTimeoutError: If the pipeline times out
+    """
+    try:
+        record_json = json.dumps(_build_pattern_record(transaction_data))
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for time_window in time_windows:
+                key = KEY_PREFIX_PATTERN_TXNS.format(
+                    account_id=account_id, window=time_window.value
+                )
+                pipe.lpush(key, record_json)
+                pipe.expire(key, get_ttl_for_window(time_window))
+            await pipe.execute()
+
+        logger.debug(
+            "Stored transaction for pattern analysis",
+            account_id=account_id,
+            txn_id=str(transaction_data.get("id")),
+            windows=[w.value for w in time_windows],
+            event="pattern_txn_stored",
+        )
+
+    except (RedisConnectionError, RedisTimeoutError):
+        # Reported to the caller, whose circuit breaker tracks Redis health
+        raise
+
+    except Exception as e:
+        logger.error(
+            "Failed to store transaction for pattern analysis",
+            account_id=account_id,
+            error=str(e),
+            event="pattern_store_failed",
+        )
+        # Don't raise - pattern storage failure shouldn't block transaction processing
+
+
 async def get_transactions_in_window(
     redis: Redis,
     account_id: str,
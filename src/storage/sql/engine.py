@@ -13,6 +13,7 @@ from sqlalchemy.exc import (
     SQLAlchemyError,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.core.exceptions import ConfigurationError, DatabaseError
 from src.core.logging import get_logger
@@ -74,14 +75,19 @@ def get_async_engine():
     global _async_engine
 
     if _async_engine is None:
+        from src.config import settings
+
         database_url = get_database_url()
 
         try:
             _async_engine = create_async_engine(
                 database_url,
                 echo=False,  # Set to True for SQL debugging
-                pool_size=10,
-                max_overflow=20,
+                # Explicit: a blocking QueuePool would stall the event loop
+                # on checkout under contention
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.database.POSTGRES_POOL_SIZE,
+                max_overflow=settings.database.POSTGRES_MAX_OVERFLOW,
                 pool_pre_ping=True,
                 pool_recycle=3600,  # Recycle connections every hour
             )
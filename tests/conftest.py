@@ -0,0 +1,41 @@
+"""
+Shared test fixtures.
+
+Database tests run against the PostgreSQL instance from settings, migrated
+to head (alembic upgrade head), and are skipped when it is unreachable.
+Each test runs inside one outer transaction that is rolled back afterwards;
+repository commits only release savepoints, so nothing is left behind.
+"""
+
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.storage.sql.engine import get_database_url
+
+
+@pytest.fixture
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """Session on a rolled-back connection to the configured database."""
+    engine = create_async_engine(get_database_url(), poolclass=NullPool)
+    try:
+        connection = await engine.connect()
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL is not available: {e}")
+
+    transaction = await connection.begin()
+    session = AsyncSession(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
@@ -0,0 +1,23 @@
+"""Tests for typed notification channel configs."""
+
+import pytest
+from aiogram.enums import ParseMode
+
+from src.modules.notifications.senders.config import TelegramConfig
+
+
+@pytest.mark.parametrize(
+    ("stored", "expected"),
+    [
+        ("HTML", ParseMode.HTML),
+        ("Markdown", ParseMode.MARKDOWN),
+        ("MarkdownV2", ParseMode.MARKDOWN_V2),
+        ("", None),
+    ],
+)
+def test_telegram_parse_modes(stored, expected):
+    assert TelegramConfig.from_dict({"parse_mode": stored}).parse_mode == expected
+
+
+def test_telegram_parse_mode_defaults_to_html():
+    assert TelegramConfig.from_dict({}).parse_mode == ParseMode.HTML
@@ -0,0 +1,41 @@
+"""Tests for the Telegram sender, with the Bot API stubbed out."""
+
+import asyncio
+
+from src.modules.notifications.senders import telegram
+from src.modules.notifications.senders.config import TelegramConfig
+from src.modules.notifications.senders.telegram import TelegramSender
+
+
+class _FakeBot:
+    """Records the peak number of concurrent sendMessage calls."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.sent = 0
+
+    async def send_message(self, chat_id, text, parse_mode=None) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        self.sent += 1
+
+
+async def test_send_many_shares_the_bot_send_limit(monkeypatch):
+    bot = _FakeBot()
+    monkeypatch.setitem(
+        telegram._bots,
+        "test-token",
+        (bot, asyncio.Semaphore(telegram.MAX_CONCURRENT_SENDS)),
+    )
+    sender = TelegramSender()
+    sender.bot_token = "test-token"
+    messages = [([str(chat_id)], "alert", None) for chat_id in range(100)]
+
+    results = await sender.send_many(messages, TelegramConfig())
+
+    assert results == [(True, None)] * len(messages)
+    assert bot.sent == len(messages)
+    assert bot.peak <= telegram.MAX_CONCURRENT_SENDS
@@ -0,0 +1,32 @@
+"""Tests for notification template rendering."""
+
+import pytest
+from jinja2.exceptions import SecurityError
+
+from src.modules.notifications.templating import render_template_string
+
+
+def test_jinja_template_renders_variables():
+    rendered = render_template_string(
+        "{% if flagged %}Alert: {{ amount }} {{ currency }}{% endif %}",
+        {"flagged": True, "amount": 250, "currency": "USD"},
+    )
+
+    assert rendered == "Alert: 250 USD"
+
+
+def test_jinja_template_cannot_reach_python_internals():
+    template = (
+        "{% if 1 %}{{ ''.__class__.__mro__[1].__subclasses__()|length }}{% endif %}"
+    )
+
+    with pytest.raises(SecurityError):
+        render_template_string(template, {})
+
+
+def test_legacy_template_drops_lines_with_missing_variables():
+    rendered = render_template_string(
+        "Amount: {amount}\nLocation: {location}", {"amount": 10}
+    )
+
+    assert rendered == "Amount: 10"
@@ -0,0 +1,86 @@
+"""Tests for the trigger-maintained queue_task_counters table."""
+
+from typing import Dict
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select
+
+from src.modules.queue.enums import ErrorType, TaskStatus
+from src.modules.queue.repository import QueueRepository
+from src.modules.queue.schemas import TaskCreate
+from src.storage.models import QueueTask, QueueTaskCounter
+
+_COUNTER_NAMES = (
+    TaskStatus.PENDING.name,
+    TaskStatus.COMPLETED.name,
+    "retries",
+)
+
+
+async def _counters(session) -> Dict[str, int]:
+    """Counter totals summed over their stripes."""
+    result = await session.execute(
+        select(QueueTaskCounter.name, func.sum(QueueTaskCounter.value)).group_by(
+            QueueTaskCounter.name
+        )
+    )
+    return {name: int(total) for name, total in result}
+
+
+def _deltas(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    return {name: after.get(name, 0) - before.get(name, 0) for name in _COUNTER_NAMES}
+
+
+async def _create_tasks(repo: QueueRepository, count: int):
+    return [
+        await repo.create_task(TaskCreate(correlation_id=f"test-{uuid4().hex}"))
+        for _ in range(count)
+    ]
+
+
+async def test_counters_follow_inserts_updates_and_deletes(db_session):
+    repo = QueueRepository(db_session)
+    before = await _counters(db_session)
+
+    tasks = await _create_tasks(repo, 3)
+    assert _deltas(before, await _counters(db_session)) == {
+        TaskStatus.PENDING.name: 3,
+        TaskStatus.COMPLETED.name: 0,
+        "retries": 0,
+    }
+
+    await repo.mark_completed(tasks[0].id, processing_time_ms=5)
+    for _ in range(2):
+        await repo.mark_failed(
+            tasks[1].id, ErrorType.DATABASE_ERROR, "connection reset", retry=True
+        )
+    assert _deltas(before, await _counters(db_session)) == {
+        TaskStatus.PENDING.name: 2,
+        TaskStatus.COMPLETED.name: 1,
+        "retries": 2,
+    }
+
+    await db_session.execute(
+        delete(QueueTask).where(
+            QueueTask.id.in_([task.id for task in tasks])  # type: ignore
+        )
+    )
+    assert _deltas(before, await _counters(db_session)) == {
+        TaskStatus.PENDING.name: 0,
+        TaskStatus.COMPLETED.name: 0,
+        "retries": 0,
+    }
+
+
+async def test_get_metrics_reads_counters(db_session):
+    repo = QueueRepository(db_session)
+    before = await repo.get_metrics()
+
+    tasks = await _create_tasks(repo, 2)
+    await repo.mark_completed(tasks[0].id, processing_time_ms=5)
+
+    after = await repo.get_metrics()
+    assert after.total_tasks - before.total_tasks == 2
+    assert after.pending_tasks - before.pending_tasks == 1
+    assert after.completed_tasks - before.completed_tasks == 1
+    assert after.failed_tasks == before.failed_tasks
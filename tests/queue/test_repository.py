@@ -0,0 +1,68 @@
+"""Tests for QueueRepository against PostgreSQL."""
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.exceptions import DuplicateTaskError
+from src.modules.queue.enums import ErrorType, TaskStatus
+from src.modules.queue.repository import QueueRepository
+from src.modules.queue.schemas import TaskCreate, TaskResponse
+
+
+def _new_task(**kwargs) -> TaskCreate:
+    return TaskCreate(correlation_id=f"test-{uuid4().hex}", **kwargs)
+
+
+async def test_create_task_rejects_duplicate_correlation_id(db_session):
+    repo = QueueRepository(db_session)
+    task = await repo.create_task(_new_task())
+
+    assert task.status == TaskStatus.PENDING
+    with pytest.raises(DuplicateTaskError):
+        await repo.create_task(TaskCreate(correlation_id=task.correlation_id))
+
+
+async def test_mark_completed_derives_start_from_elapsed_time(db_session):
+    repo = QueueRepository(db_session)
+    task = await repo.create_task(_new_task())
+
+    completed = await repo.mark_completed(
+        task.id,
+        processing_time_ms=1500,
+        elapsed_ms=1500,
+        worker_id="worker-1",
+        worker_hostname="host-1",
+    )
+
+    assert completed.status == TaskStatus.COMPLETED
+    assert completed.worker_id == "worker-1"
+    # Both timestamps come from the same database clock reading
+    assert completed.completed_at - completed.started_at == timedelta(milliseconds=1500)
+
+
+async def test_mark_failed_with_retry_requeues_task(db_session):
+    repo = QueueRepository(db_session)
+    task = await repo.create_task(_new_task())
+
+    failed = await repo.mark_failed(
+        task.id, ErrorType.DATABASE_ERROR, "connection reset", retry=True
+    )
+
+    assert failed.status == TaskStatus.PENDING
+    assert failed.retry_count == 1
+    assert failed.last_retry_at is not None
+
+
+async def test_tasks_by_status_validate_as_task_response(db_session):
+    repo = QueueRepository(db_session)
+    task = await repo.create_task(_new_task(task_metadata={"source": "test"}))
+    # Load the task from the list query, not the identity map
+    db_session.expunge_all()
+
+    tasks = await repo.get_tasks_by_status(TaskStatus.PENDING, limit=10)
+
+    listed = next(item for item in tasks if item.id == task.id)
+    response = TaskResponse.model_validate(listed)
+    assert response.task_metadata == {"source": "test"}
@@ -0,0 +1,263 @@
+"""Tests for the transaction processing tasks, with backends stubbed out."""
+
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.core.exceptions import CircuitOpenError, DatabaseError, NotificationError
+from src.modules.queue import tasks
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+@pytest.fixture
+def pipeline(monkeypatch) -> Dict[str, Any]:
+    """
+    Stub the backends of _process_transaction_async.
+
+    Returns a dict holding the ordered list of backend calls ("calls") and
+    knobs for the stubs: "suspicious", "complete_error" and "send_error".
+    """
+    state: Dict[str, Any] = {
+        "calls": [],
+        "suspicious": True,
+        "complete_error": None,
+        "send_error": None,
+    }
+    calls: List[str] = state["calls"]
+
+    class FakeQueueRepository:
+        def __init__(self, session) -> None:
+            pass
+
+        async def mark_started(self, **kwargs) -> None:
+            calls.append("mark_started")
+
+        async def mark_completed(self, **kwargs) -> None:
+            if state["complete_error"] is not None:
+                raise state["complete_error"]
+            calls.append("mark_completed")
+
+    async def fake_redis_client():
+        return None
+
+    async def fake_evaluate(transaction, redis_client, max_composite_depth=5):
+        return {
+            "is_suspicious": state["suspicious"],
+            "risk_score": 0.9,
+            "triggered_rules": [],
+        }
+
+    async def fake_update_status(
+        session, transaction_id, correlation_id, evaluation_result, commit=True
+    ):
+        calls.append("update_status")
+
+    def fake_send_task(name, args=None, **options):
+        if state["send_error"] is not None:
+            raise state["send_error"]
+        calls.append(name)
+
+    monkeypatch.setattr(tasks.settings.queue, "MARK_TASKS_STARTED", False)
+    monkeypatch.setattr(tasks, "AsyncSessionLocal", _FakeSession)
+    monkeypatch.setattr(tasks, "QueueRepository", FakeQueueRepository)
+    monkeypatch.setattr(tasks, "get_async_redis_client", fake_redis_client)
+    monkeypatch.setattr(tasks, "_evaluate_transaction", fake_evaluate)
+    monkeypatch.setattr(tasks, "_update_transaction_status", fake_update_status)
+    monkeypatch.setattr(tasks.celery_app, "send_task", fake_send_task)
+    return state
+
+
+async def _process() -> Dict[str, Any]:
+    return await tasks._process_transaction_async(
+        transaction_data={"id": str(uuid4())},
+        correlation_id="corr-1",
+        queue_task_id=uuid4(),
+        worker_id="worker-1",
+        worker_hostname="host-1",
+    )
+
+
+async def test_notification_dispatched_after_completion(pipeline):
+    result = await _process()
+
+    assert result["is_suspicious"] is True
+    assert pipeline["calls"] == [
+        "update_status",
+        "mark_completed",
+        "queue.send_fraud_notification",
+    ]
+
+
+async def test_no_notification_for_legitimate_transaction(pipeline):
+    pipeline["suspicious"] = False
+
+    await _process()
+
+    assert pipeline["calls"] == ["update_status", "mark_completed"]
+
+
+async def test_no_notification_when_completion_fails(pipeline):
+    pipeline["complete_error"] = RuntimeError("commit failed")
+
+    with pytest.raises(RuntimeError):
+        await _process()
+
+    assert "queue.send_fraud_notification" not in pipeline["calls"]
+
+
+async def test_notification_dispatch_failure_raises_notification_error(pipeline):
+    pipeline["send_error"] = ConnectionError("broker down")
+
+    with pytest.raises(NotificationError):
+        await _process()
+
+    # The completion was already committed when the dispatch failed
+    assert pipeline["calls"] == ["update_status", "mark_completed"]
+
+
+async def test_mark_started_recorded_first(pipeline, monkeypatch):
+    monkeypatch.setattr(tasks.settings.queue, "MARK_TASKS_STARTED", True)
+
+    await _process()
+
+    assert pipeline["calls"][0] == "mark_started"
+
+
+@pytest.fixture
+def redispatch(monkeypatch) -> Dict[str, List[Any]]:
+    """Record the send_task calls and failures of _redispatch_batch_item."""
+    state: Dict[str, List[Any]] = {"sent": [], "failed": [], "send_error": []}
+
+    def fake_send_task(name, args=None, **options):
+        if state["send_error"]:
+            raise state["send_error"][0]
+        state["sent"].append((name, options))
+
+    def fake_record_failure(transaction_id, queue_task_id, exc, will_retry):
+        state["failed"].append((exc, will_retry))
+
+    monkeypatch.setattr(tasks.celery_app, "send_task", fake_send_task)
+    monkeypatch.setattr(tasks, "_record_task_failure", fake_record_failure)
+    return state
+
+
+def _redispatch(exc: BaseException) -> bool:
+    return tasks._redispatch_batch_item(
+        tasks.process_transaction_batch,
+        {"id": str(uuid4())},
+        "corr-1",
+        str(uuid4()),
+        exc,
+    )
+
+
+def test_redispatch_defers_open_circuit(redispatch):
+    assert _redispatch(CircuitOpenError("postgres", retry_after=2.5)) is True
+
+    assert redispatch["sent"] == [
+        ("queue.process_transaction", {"queue": "transactions", "countdown": 2.5})
+    ]
+    assert redispatch["failed"] == []
+
+
+def test_redispatch_retriable_error_counts_the_batch_attempt(redispatch):
+    exc = ConnectionError("database down")
+
+    assert _redispatch(exc) is True
+
+    assert redispatch["sent"] == [
+        ("queue.process_transaction", {"queue": "transactions", "retries": 1})
+    ]
+    # The failed batch attempt is recorded as a retry, as process_transaction
+    # records its own retried attempts
+    assert redispatch["failed"] == [(exc, True)]
+
+
+@pytest.mark.parametrize("exc", [NotificationError("broker down"), KeyError("amount")])
+def test_redispatch_records_final_failures(redispatch, exc):
+    assert _redispatch(exc) is False
+
+    assert redispatch["sent"] == []
+    assert redispatch["failed"] == [(exc, False)]
+
+
+def test_redispatch_records_failure_when_send_fails(redispatch):
+    redispatch["send_error"].append(ConnectionError("broker down"))
+    exc = ConnectionError("database down")
+
+    assert _redispatch(exc) is False
+
+    assert redispatch["failed"] == [(exc, False)]
+
+
+def test_batch_counts_item_outcomes(redispatch, monkeypatch):
+    results = [
+        {"transaction_id": "a"},
+        CircuitOpenError("redis", retry_after=1.0),
+        KeyError("amount"),
+    ]
+
+    def fake_run_async(coro):
+        coro.close()
+        return results
+
+    monkeypatch.setattr(tasks, "run_async", fake_run_async)
+    items = [({"id": str(uuid4())}, f"corr-{i}", str(uuid4())) for i in range(3)]
+
+    stats = tasks.process_transaction_batch(items)
+
+    assert stats == {"batch_size": 3, "completed": 1, "redispatched": 1, "failed": 1}
+    assert len(redispatch["sent"]) == 1
+    assert [exc for exc, _ in redispatch["failed"]] == [results[2]]
+
+
+@pytest.fixture
+def status_update_error(monkeypatch) -> Dict[str, Any]:
+    """Make the repository status update raise state["error"]."""
+    state: Dict[str, Any] = {"error": None}
+
+    class FakeTransactionRepository:
+        def __init__(self, session) -> None:
+            pass
+
+        async def update_status_and_persist_executions(self, **kwargs) -> int:
+            raise state["error"]
+
+    monkeypatch.setattr(tasks, "TransactionRepository", FakeTransactionRepository)
+    return state
+
+
+async def _update_status() -> None:
+    await tasks._update_transaction_status(
+        None, uuid4(), "corr-1", {"final_status": "approved"}
+    )
+
+
+async def test_status_update_keeps_transient_errors_retriable(status_update_error):
+    error = OperationalError("UPDATE transactions", {}, ConnectionError("reset"))
+    status_update_error["error"] = error
+
+    with pytest.raises(OperationalError) as raised:
+        await _update_status()
+
+    assert raised.value is error
+    assert tasks._will_autoretry(tasks.process_transaction, raised.value, 0)
+
+
+async def test_status_update_wraps_other_errors(status_update_error):
+    error = ValueError("bad status")
+    status_update_error["error"] = error
+
+    with pytest.raises(DatabaseError) as raised:
+        await _update_status()
+
+    assert raised.value.__cause__ is error
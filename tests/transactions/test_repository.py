@@ -0,0 +1,130 @@
+"""Tests for TransactionRepository against PostgreSQL."""
+
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.core.exceptions import DatabaseError
+from src.modules.rule_engine.enums import RuleType, TransactionStatus, TransactionType
+from src.modules.transactions.repository import TransactionRepository
+from src.storage.models import Rule, RuleExecution, Transaction
+
+
+async def _create_rule(session) -> Rule:
+    rule = Rule(name=f"test-{uuid4().hex}", type=RuleType.THRESHOLD)
+    session.add(rule)
+    await session.flush()
+    return rule
+
+
+async def _create_transaction(repo: TransactionRepository) -> Transaction:
+    return await repo.create_transaction(
+        transaction_id=uuid4(),
+        amount=250.0,
+        from_account="acc-from",
+        to_account="acc-to",
+        transaction_type=TransactionType.TRANSFER,
+        correlation_id=f"test-{uuid4().hex}",
+    )
+
+
+def _execution(rule_id: UUID, correlation_id: str, **kwargs) -> Dict[str, Any]:
+    row = {
+        "id": uuid4(),
+        "rule_id": rule_id,
+        "correlation_id": correlation_id,
+        "matched": False,
+        "confidence_score": None,
+        "execution_time_ms": 1.5,
+        "context": {},
+        "error_message": None,
+        "executed_at": datetime.utcnow(),
+    }
+    row.update(kwargs)
+    return row
+
+
+async def test_update_status_and_persist_executions(db_session):
+    repo = TransactionRepository(db_session)
+    rule = await _create_rule(db_session)
+    transaction = await _create_transaction(repo)
+    executions = [
+        _execution(
+            rule.id,
+            transaction.correlation_id,
+            matched=True,
+            confidence_score=0.9,
+            context={"rule_type": "threshold", "details": {"limit": 100}},
+        ),
+        _execution(rule.id, transaction.correlation_id, error_message="timeout"),
+    ]
+
+    inserted = await repo.update_status_and_persist_executions(
+        transaction.id, TransactionStatus.FLAGGED, executions
+    )
+
+    assert inserted == 2
+    status = await db_session.scalar(
+        select(Transaction.status).where(Transaction.id == transaction.id)
+    )
+    assert status == TransactionStatus.FLAGGED
+
+    result = await db_session.execute(
+        select(
+            RuleExecution.id,
+            RuleExecution.transaction_id,
+            RuleExecution.matched,
+            RuleExecution.confidence_score,
+            RuleExecution.context,
+            RuleExecution.error_message,
+        ).where(RuleExecution.transaction_id == transaction.id)
+    )
+    rows = {row.id: row for row in result}
+    assert rows.keys() == {execution["id"] for execution in executions}
+
+    matched = rows[executions[0]["id"]]
+    assert matched.transaction_id == transaction.id
+    assert matched.matched is True
+    assert matched.confidence_score == pytest.approx(0.9)
+    assert matched.context == executions[0]["context"]
+
+    errored = rows[executions[1]["id"]]
+    assert errored.confidence_score is None
+    assert errored.error_message == "timeout"
+
+
+async def test_update_status_and_persist_executions_unknown_transaction(db_session):
+    repo = TransactionRepository(db_session)
+    rule = await _create_rule(db_session)
+    transaction_id = uuid4()
+
+    with pytest.raises(DatabaseError):
+        await repo.update_status_and_persist_executions(
+            transaction_id,
+            TransactionStatus.APPROVED,
+            [_execution(rule.id, "missing")],
+        )
+
+    # Nothing is joined to a missing transaction, so no execution is written
+    execution_id = await db_session.scalar(
+        select(RuleExecution.id).where(RuleExecution.transaction_id == transaction_id)
+    )
+    assert execution_id is None
+
+
+async def test_update_status_without_executions(db_session):
+    repo = TransactionRepository(db_session)
+    transaction = await _create_transaction(repo)
+
+    inserted = await repo.update_status_and_persist_executions(
+        transaction.id, TransactionStatus.APPROVED, []
+    )
+
+    assert inserted == 0
+    status = await db_session.scalar(
+        select(Transaction.status).where(Transaction.id == transaction.id)
+    )
+    assert status == TransactionStatus.APPROVED